@@ -0,0 +1,59 @@
+"""
+Microbenchmark for enum membership tests and value lookups.
+
+Compares the previous exception based ``MetaEnum.__contains__`` with the
+value index for hits and misses.
+
+Usage:
+    python -m benchmarks.bench_better_enum --number 1000000
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+from workout_tracker.better_enum import MetaEnum
+from workout_tracker.measurement import DistanceUnit
+
+
+def legacy_contains(cls: MetaEnum, item: Any) -> bool:
+    """
+    Previous membership check calling the enum and catching the error.
+
+    Args:
+        cls (MetaEnum): Enum class.
+        item (Any): Item to check.
+
+    Returns:
+        bool: True if item in enum and False otherwise.
+    """
+    try:
+        cls(item)
+    except ValueError:
+        return False
+    return True
+
+
+def main() -> None:
+    """
+    Runs the microbenchmarks and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases = {
+        "legacy contains hit": lambda: legacy_contains(DistanceUnit, "m"),
+        "legacy contains miss": lambda: legacy_contains(DistanceUnit, "kg"),
+        "contains hit": lambda: "m" in DistanceUnit,
+        "contains miss": lambda: "kg" in DistanceUnit,
+        "get hit": lambda: DistanceUnit.get("m"),
+        "get miss": lambda: DistanceUnit.get("kg"),
+    }
+    for name, func in cases.items():
+        elapsed = timeit.timeit(func, number=args.number)
+        print(f"{name:<22} {elapsed / args.number * 1e9:8.1f} ns / call")
+
+
+if __name__ == "__main__":
+    main()
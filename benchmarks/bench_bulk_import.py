@@ -0,0 +1,79 @@
+"""
+Benchmark for the parallel bulk import.
+
+Writes a JSON Lines export of the given number of records and imports it
+with one worker up to the given number of worker processes. Reports the
+throughput and the speedup over a single worker.
+
+Usage:
+    python -m benchmarks.bench_bulk_import --count 1000000 --max-workers 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import timedelta
+from itertools import cycle, islice
+from pathlib import Path
+
+from workout_tracker.bulk_import import DEFAULT_CHUNK_SIZE, bulk_import
+from workout_tracker.exercise import Exercise
+from workout_tracker.jsonl import dump_iter
+from workout_tracker.measurement import (
+    Distance,
+    DistanceUnit,
+    Weight,
+    WeightUnit,
+)
+
+SAMPLES = [
+    Exercise(name="Back Squat", reps=5, weight=Weight(100.0, WeightUnit.KG)),
+    Exercise(name="Deadlift", reps=3, weight=Weight(315.0, WeightUnit.LB)),
+    Exercise(name="Run", distance=Distance(400.0, DistanceUnit.M)),
+    Exercise(name="Plank", duration=timedelta(seconds=90)),
+    Exercise(
+        name=None,
+        reps=3,
+        weight=Weight(60.0, WeightUnit.KG),
+        sub_exercises=[
+            Exercise(name="Clean", reps=1),
+            Exercise(name="Front Squat", reps=2),
+            Exercise(name="Jerk", reps=1),
+        ],
+    ),
+]
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "export.jsonl"
+        dump_iter(islice(cycle(SAMPLES), args.count), path)
+
+        baseline = None
+        print(f"records: {args.count:,}")
+        for workers in range(1, args.max_workers + 1):
+            start = time.perf_counter()
+            result = bulk_import(
+                path, workers=workers, chunk_size=args.chunk_size
+            )
+            elapsed = time.perf_counter() - start
+            assert len(result.exercises) == args.count
+            baseline = baseline or elapsed
+            print(
+                f"workers {workers:>2}: {args.count / elapsed:>12,.0f} "
+                f"records / s, speedup {baseline / elapsed:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
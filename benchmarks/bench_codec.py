@@ -0,0 +1,114 @@
+"""
+Benchmark comparing the binary codec with JSON via to_dict/from_dict.
+
+Reports encoded size and encode/decode throughput.
+
+Usage:
+    python -m benchmarks.bench_codec --count 100000
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from itertools import cycle, islice
+from typing import Any
+
+from workout_tracker.codec import decode, encode
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import (
+    Distance,
+    DistanceUnit,
+    Weight,
+    WeightUnit,
+)
+
+SAMPLES = [
+    Exercise(name="Back Squat", reps=5, weight=Weight(100.0, WeightUnit.KG)),
+    Exercise(name="Deadlift", reps=3, weight=Weight(315.0, WeightUnit.LB)),
+    Exercise(name="Run", distance=Distance(400.0, DistanceUnit.M)),
+    Exercise(name="Row", distance=Distance(2.0, DistanceUnit.KM)),
+    Exercise(name="Plank", duration=timedelta(seconds=90)),
+    Exercise(
+        name="Box Jump", reps=20, height=Distance(24.0, DistanceUnit.INCH)
+    ),
+    Exercise(
+        name=None,
+        reps=3,
+        weight=Weight(60.0, WeightUnit.KG),
+        sub_exercises=[
+            Exercise(name="Clean", reps=1),
+            Exercise(name="Front Squat", reps=2),
+            Exercise(name="Jerk", reps=1),
+        ],
+    ),
+]
+
+
+def json_encode(exercises: list[Exercise]) -> bytes:
+    """
+    Encodes exercises as JSON list of dictionaries.
+
+    Args:
+        exercises (list[Exercise]): Exercises to encode.
+
+    Returns:
+        bytes: Encoded data.
+    """
+    return json.dumps([exercise.to_dict() for exercise in exercises]).encode()
+
+
+def json_decode(data: bytes) -> list[Exercise]:
+    """
+    Decodes exercises from a JSON list of dictionaries.
+
+    Args:
+        data (bytes): Encoded data.
+
+    Returns:
+        list[Exercise]: Decoded exercises.
+    """
+    return [Exercise.from_dict(item) for item in json.loads(data)]
+
+
+def timed(func: Callable, arg: Any) -> tuple[float, Any]:
+    """
+    Measures the wall time of a single call.
+
+    Args:
+        func (Callable): Function to call.
+        arg (Any): Argument of the call.
+
+    Returns:
+        tuple[float, Any]: Elapsed seconds and result of the call.
+    """
+    start = time.perf_counter()
+    result = func(arg)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    exercises = list(islice(cycle(SAMPLES), args.count))
+    for name, encoder, decoder in [
+        ("json", json_encode, json_decode),
+        ("binary", encode, decode),
+    ]:
+        encode_time, data = timed(encoder, exercises)
+        decode_time, _ = timed(decoder, data)
+        print(
+            f"{name:<7} {len(data) / args.count:6.1f} bytes / exercise  "
+            f"encode {args.count / encode_time:10,.0f} / s  "
+            f"decode {args.count / decode_time:10,.0f} / s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Memory benchmark for interned exercises.
+
+Uses tracemalloc to report the bytes needed to hold a multi-year training
+history decoded as mutable exercises and as interned frozen exercises.
+
+Usage:
+    python -m benchmarks.bench_exercise_memory --years 3
+"""
+
+import argparse
+import gc
+import tracemalloc
+from functools import partial
+
+from benchmarks.datasets import training_history
+from workout_tracker.exercise import Exercise, interned_count
+
+
+def traced_bytes(dicts: list[dict], intern: bool) -> tuple[int, int]:
+    """
+    Measures the traced memory needed to hold the decoded exercises.
+
+    Args:
+        dicts (list[dict]): Exercise dictionaries.
+        intern (bool): Whether to decode interned frozen exercises.
+
+    Returns:
+        tuple[int, int]: Allocated bytes and number of living interned
+            exercises.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    decode = (
+        partial(Exercise.from_dict, intern=True)
+        if intern
+        else Exercise.from_dict
+    )
+    exercises = [decode(exercise_dict) for exercise_dict in dicts]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    living = interned_count()
+    del exercises
+    return after - before, living
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=3)
+    args = parser.parse_args()
+
+    dicts = training_history(args.years)
+    count = len(dicts)
+    mutable, _ = traced_bytes(dicts, intern=False)
+    interned, distinct = traced_bytes(dicts, intern=True)
+
+    print(f"sets:     {count:,} over {args.years} years")
+    print(f"mutable:  {mutable / count:6.1f} bytes / set")
+    print(f"interned: {interned / count:6.1f} bytes / set")
+    print(f"distinct: {distinct:,} interned exercises")
+    print(f"saved:    {1 - interned / mutable:.1%}")
+
+
+if __name__ == "__main__":
+    main()
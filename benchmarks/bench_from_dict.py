@@ -0,0 +1,88 @@
+"""
+Benchmark comparing the shape-specialized decoders of Exercise.from_dict
+with the generic decoding path on a batch of mixed shapes.
+
+Usage:
+    python -m benchmarks.bench_from_dict --count 100000
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from benchmarks.datasets import SEED, deep_complexes, flat_sets
+from workout_tracker.duration import clear_duration_cache
+from workout_tracker.exercise import Exercise, clear_decoder_cache
+
+
+def mixed_dicts(count: int, seed: int = SEED) -> list[dict]:
+    """
+    Generates exercise dictionaries of plain sets and complexes in random
+    order, some of them with explicit None values.
+
+    Args:
+        count (int): Number of dictionaries.
+        seed (int): Random seed. Defaults to SEED.
+
+    Returns:
+        list[dict]: Exercise dictionaries.
+    """
+    rng = random.Random(seed)
+    dicts = [exercise.to_dict() for exercise in flat_sets(count, seed)]
+    complexes = deep_complexes(count // 5, seed=seed)
+    last = len(complexes)
+    dicts[:last] = [exercise.to_dict() for exercise in complexes]
+    for exercise_dict in rng.sample(dicts, count // 10):
+        exercise_dict["height"] = None
+    rng.shuffle(dicts)
+    return dicts
+
+
+def best_time(
+    decode: Callable[[dict], Exercise], dicts: list[dict], repeats: int
+) -> float:
+    """
+    Measures the fastest of several runs decoding all dictionaries.
+
+    Args:
+        decode (Callable[[dict], Exercise]): Decoder to measure.
+        dicts (list[dict]): Exercise dictionaries.
+        repeats (int): Number of runs.
+
+    Returns:
+        float: Seconds of the fastest run.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        clear_duration_cache()
+        clear_decoder_cache()
+        start = time.perf_counter()
+        for exercise_dict in dicts:
+            decode(exercise_dict)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    dicts = mixed_dicts(args.count)
+    shapes = len({tuple(exercise_dict) for exercise_dict in dicts})
+    print(f"{args.count:,} dictionaries of {shapes} shapes")
+    # pylint: disable-next=protected-access
+    generic = best_time(Exercise._from_any_dict, dicts, args.repeats)
+    specialized = best_time(Exercise.from_dict, dicts, args.repeats)
+    for name, seconds in [("generic", generic), ("specialized", specialized)]:
+        print(f"{name:<12} {args.count / seconds:12,.0f} / s")
+    print(f"speedup      {generic / specialized:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
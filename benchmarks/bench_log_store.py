@@ -0,0 +1,119 @@
+"""
+Benchmark for the append-only workout log.
+
+Appends the given number of sets spread over several years, reopens the
+log and looks up all Back Squat sets of one year through the index. With
+--scan the same lookup is also done by a full scan for comparison.
+
+Usage:
+    python -m benchmarks.bench_log_store --sets 10000000
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.log_store import WorkoutLog
+from workout_tracker.measurement import (
+    Distance,
+    DistanceUnit,
+    Weight,
+    WeightUnit,
+)
+
+MOVEMENTS = [
+    "Back Squat",
+    "Front Squat",
+    "Deadlift",
+    "Bench Press",
+    "Strict Press",
+    "Push Press",
+    "Clean",
+    "Snatch",
+    "Thruster",
+    "Overhead Squat",
+]
+
+BATCH_SIZE = 10_000
+START = date(2020, 1, 1)
+
+
+def generate_sets(count: int):
+    """
+    Generates dated sets, one hundred sets per day.
+
+    Args:
+        count (int): Number of sets.
+
+    Yields:
+        tuple[date, Exercise]: Date and set.
+    """
+    for index in range(count):
+        day = START + timedelta(days=index // 100)
+        if index % 11 == 0:
+            yield day, Exercise(
+                name="Run", distance=Distance(400.0, DistanceUnit.M)
+            )
+            continue
+        yield day, Exercise(
+            name=MOVEMENTS[index % len(MOVEMENTS)],
+            reps=1 + index % 5,
+            weight=Weight(float(60 + index % 80), WeightUnit.KG),
+        )
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sets", type=int, default=10_000_000)
+    parser.add_argument("--scan", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "workouts.log"
+        sets = generate_sets(args.sets)
+
+        start = time.perf_counter()
+        with WorkoutLog(path) as log:
+            while batch := list(islice(sets, BATCH_SIZE)):
+                log.extend(batch)
+        append_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        log = WorkoutLog(path)
+        open_time = time.perf_counter() - start
+
+        year = START.year + (args.sets // 100 // 365) // 2
+        first, last = date(year, 1, 1), date(year, 12, 31)
+        start = time.perf_counter()
+        found = sum(1 for _ in log.query("Back Squat", first, last))
+        query_time = time.perf_counter() - start
+
+        print(f"sets:        {args.sets:,}")
+        print(f"data size:   {path.stat().st_size / 1e6:,.1f} MB")
+        print(f"append:      {args.sets / append_time:,.0f} sets / s")
+        print(f"open:        {open_time:.3f} s")
+        print(f"query {year}:  {found:,} sets in {query_time:.3f} s")
+
+        if args.scan:
+            start = time.perf_counter()
+            scanned = sum(
+                1
+                for day, record in log
+                if first <= day <= last
+                and isinstance(record, Exercise)
+                and record.name == "Back Squat"
+            )
+            scan_time = time.perf_counter() - start
+            print(f"full scan:   {scanned:,} sets in {scan_time:.3f} s")
+        log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark for parsing measurement strings.
+
+Compares the previous two-scan implementation of ``get_value_and_unit``
+with the current single-pass tokenizer.
+
+Usage:
+    python -m benchmarks.bench_measurement --count 1000000
+"""
+
+import argparse
+import re
+import time
+from collections.abc import Callable
+from itertools import cycle, islice
+
+from workout_tracker.measurement import (
+    DistanceUnit,
+    UnknownUnitError,
+    WeightUnit,
+    get_value_and_unit,
+)
+
+SAMPLES = [
+    "100 kg",
+    "102.5kg",
+    "225 lb",
+    "1.5 pood",
+    "400 m",
+    "5 km",
+    "24 in",
+    "1 mile",
+    "  60   cm ",
+    "ft 3.2",
+]
+
+
+def legacy_get_value_and_unit(string: str) -> tuple[float, str]:
+    """
+    Previous implementation with two regex scans and exception based unit
+    membership checks.
+
+    Args:
+        string (str): String from which to extract value and unit.
+
+    Raises:
+        ValueError: If not exactly one number or unit in string.
+        UnknownUnitError: If unit is unknown.
+
+    Returns:
+        tuple[float, str]: Value and unit
+    """
+    if len(values := re.findall(r"\d+\.?\d*", string)) != 1:
+        raise ValueError("Input text needs to contain exactly one number!")
+    if len(units := re.findall(r"[^\d\W]+", string)) != 1:
+        raise ValueError("Input text needs to contain exactly one unit!")
+
+    unit = units[0]
+    if (unit not in DistanceUnit) and (unit not in WeightUnit):
+        raise UnknownUnitError(f"The input unit of {unit} is unknown.")
+
+    return float(values[0]), unit
+
+
+def run(func: Callable, strings: list[str]) -> float:
+    """
+    Parses all strings with the given function.
+
+    Args:
+        func (Callable): Parsing function.
+        strings (list[str]): Strings to parse.
+
+    Returns:
+        float: Elapsed wall time in seconds.
+    """
+    start = time.perf_counter()
+    for string in strings:
+        func(string)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    strings = list(islice(cycle(SAMPLES), args.count))
+    legacy = run(legacy_get_value_and_unit, strings)
+    current = run(get_value_and_unit, strings)
+
+    print(f"strings:  {args.count:,}")
+    print(f"legacy:   {legacy:.3f} s ({args.count / legacy:,.0f} / s)")
+    print(f"current:  {current:.3f} s ({args.count / current:,.0f} / s)")
+    print(f"speedup:  {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
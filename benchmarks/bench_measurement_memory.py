@@ -0,0 +1,128 @@
+"""
+Memory benchmark for measurement instances.
+
+Uses tracemalloc to report the bytes allocated per measurement for the
+previous dict based layout, which built a new Unit per instance, and for
+the current slotted layout sharing units through the UNIT_REGISTRY.
+
+Usage:
+    python -m benchmarks.bench_measurement_memory --count 100000
+"""
+
+import argparse
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import cycle, islice
+
+from workout_tracker.measurement import (
+    UNIT_CONVERSIONS,
+    Distance,
+    DistanceUnit,
+    Measurement,
+    Weight,
+    WeightUnit,
+)
+
+SAMPLES = [
+    (Weight, 100.0, WeightUnit.KG),
+    (Weight, 225.0, WeightUnit.LB),
+    (Weight, 1.5, WeightUnit.POOD),
+    (Distance, 400.0, DistanceUnit.M),
+    (Distance, 24.0, DistanceUnit.INCH),
+]
+
+
+@dataclass
+class LegacyUnit:
+    """
+    Previous per instance unit.
+    """
+
+    name: str
+    in_si: float
+
+
+class LegacyMeasurement:
+    """
+    Previous dict based measurement layout.
+    """
+
+    def __init__(self, value: float, unit: str) -> None:
+        self.value = value
+        self.si_unit = "Undefined"
+        self.unit = LegacyUnit(name=str(unit), in_si=UNIT_CONVERSIONS[unit])
+
+
+def legacy_factory(_: type[Measurement], value: float, unit: str) -> object:
+    """
+    Creates a measurement with the previous layout.
+
+    Args:
+        _ (type[Measurement]): Ignored measurement class.
+        value (float): Value of the measurement.
+        unit (str): Unit of the measurement.
+
+    Returns:
+        object: Legacy measurement.
+    """
+    return LegacyMeasurement(value, unit)
+
+
+def current_factory(
+    cls: type[Measurement], value: float, unit: DistanceUnit | WeightUnit
+) -> Measurement:
+    """
+    Creates a measurement with the current layout.
+
+    Args:
+        cls (type[Measurement]): Measurement class.
+        value (float): Value of the measurement.
+        unit (DistanceUnit | WeightUnit): Unit of the measurement.
+
+    Returns:
+        Measurement: Measurement instance.
+    """
+    return cls(value, unit)
+
+
+def bytes_per_measurement(factory: Callable, count: int) -> float:
+    """
+    Measures the traced memory needed to hold count measurements.
+
+    Args:
+        factory (Callable): Function creating a single measurement.
+        count (int): Number of measurements to create.
+
+    Returns:
+        float: Allocated bytes per measurement.
+    """
+    samples = list(islice(cycle(SAMPLES), count))
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    measurements = [factory(*sample) for sample in samples]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del measurements
+    return (after - before) / count
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    legacy = bytes_per_measurement(legacy_factory, args.count)
+    current = bytes_per_measurement(current_factory, args.count)
+
+    print(f"measurements: {args.count:,}")
+    print(f"legacy:       {legacy:.1f} bytes / measurement")
+    print(f"current:      {current:.1f} bytes / measurement")
+    print(f"saved:        {1 - current / legacy:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark comparing the recursive flattening of a nested AMRAP with the
+linear iteration of its compiled plan when scoring it repeatedly.
+
+Usage:
+    python -m benchmarks.bench_plan --scores 100000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from benchmarks.datasets import deep_complexes, flat_sets
+from workout_tracker.analytics import iter_movements
+from workout_tracker.plan import compile_plan
+from workout_tracker.workout import Amrap
+
+
+def nested_amrap() -> Amrap:
+    """
+    Builds an AMRAP with complexes and nested buy-in and buy-out workouts.
+
+    Returns:
+        Amrap: Nested workout.
+    """
+    return Amrap(
+        duration=timedelta(minutes=12),
+        exercises=flat_sets(6) + deep_complexes(2),
+        repeats=3,
+        rest=timedelta(minutes=2),
+        buy_in=Amrap(
+            duration=timedelta(minutes=3),
+            exercises=flat_sets(3, seed=1),
+            buy_in=Amrap(
+                duration=timedelta(minutes=1), exercises=flat_sets(2, seed=2)
+            ),
+        ),
+        buy_out=Amrap(
+            duration=timedelta(minutes=3), exercises=deep_complexes(1, seed=3)
+        ),
+    )
+
+
+def best_time(
+    score: Callable[[int], float], scores: int, repeats: int
+) -> float:
+    """
+    Measures the fastest of several runs scoring the workout.
+
+    Args:
+        score (Callable[[int], float]): Computes the tonnage of a score.
+        scores (int): Number of scores per run.
+        repeats (int): Number of runs.
+
+    Returns:
+        float: Seconds of the fastest run.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for rounds in range(scores):
+            score(rounds % 20)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scores", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    amrap = nested_amrap()
+    print(f"{len(compile_plan(amrap)):,} rows per plan")
+    recursive = best_time(
+        lambda rounds: sum(
+            movement.reps * movement.load
+            for movement in iter_movements(amrap, rounds=rounds)
+        ),
+        args.scores,
+        args.repeats,
+    )
+    compiled = best_time(
+        lambda rounds: sum(
+            movement.reps * movement.load
+            for movement in compile_plan(amrap).movements(rounds)
+        ),
+        args.scores,
+        args.repeats,
+    )
+    for name, seconds in [("recursive", recursive), ("compiled", compiled)]:
+        print(f"{name:<10} {args.scores / seconds:12,.0f} scores / s")
+    print(f"speedup    {recursive / compiled:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
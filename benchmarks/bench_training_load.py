@@ -0,0 +1,118 @@
+"""
+Benchmark comparing the incremental training load aggregator with
+recomputing the rolling tonnage over the full history for every daily
+dashboard view.
+
+Usage:
+    python -m benchmarks.bench_training_load --years 1
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+from benchmarks.datasets import training_history
+from workout_tracker.analytics import iter_movements
+from workout_tracker.exercise import Exercise
+from workout_tracker.training_load import (
+    ACUTE_DAYS,
+    CHRONIC_DAYS,
+    TrainingLoad,
+)
+
+START = date(2020, 1, 6)
+
+
+def dated_history(years: int) -> list[tuple[date, Exercise]]:
+    """
+    Spreads the sets of a training history evenly over its days.
+
+    Args:
+        years (int): Number of years.
+
+    Returns:
+        list[tuple[date, Exercise]]: Dates and sets in order.
+    """
+    exercises = [
+        Exercise.from_dict(exercise_dict)
+        for exercise_dict in training_history(years)
+    ]
+    days = 364 * years
+    return [
+        (START + timedelta(days=index * days // len(exercises)), exercise)
+        for index, exercise in enumerate(exercises)
+    ]
+
+
+def recompute(history: list[tuple[date, Exercise]]) -> float:
+    """
+    Computes the acute and chronic tonnage for each training day by
+    scanning all sets logged so far.
+
+    Args:
+        history (list[tuple[date, Exercise]]): Dates and sets in order.
+
+    Returns:
+        float: Seconds to compute all views.
+    """
+    start = time.perf_counter()
+    for today in sorted({day for day, _ in history}):
+        acute = chronic = 0.0
+        for day, exercise in history:
+            if day > today:
+                break
+            age = (today - day).days
+            if age >= CHRONIC_DAYS:
+                continue
+            tonnage = sum(
+                movement.reps * movement.load
+                for movement in iter_movements(exercise)
+            )
+            chronic += tonnage
+            if age < ACUTE_DAYS:
+                acute += tonnage
+    return time.perf_counter() - start
+
+
+def incremental(history: list[tuple[date, Exercise]]) -> float:
+    """
+    Feeds the sets to the aggregator and reads the metrics once per
+    training day.
+
+    Args:
+        history (list[tuple[date, Exercise]]): Dates and sets in order.
+
+    Returns:
+        float: Seconds to compute all views.
+    """
+    start = time.perf_counter()
+    load = TrainingLoad()
+    seen = None
+    for day, exercise in history:
+        if day != seen and seen is not None:
+            load.metrics()
+        load.add(exercise, day)
+        seen = day
+    load.metrics()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=1)
+    args = parser.parse_args()
+
+    history = dated_history(args.years)
+    print(f"{len(history):,} sets over {args.years} years")
+    full = recompute(history)
+    streamed = incremental(history)
+    for name, seconds in [("recompute", full), ("incremental", streamed)]:
+        print(f"{name:<12} {seconds:8.3f} s")
+    print(f"speedup      {full / streamed:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
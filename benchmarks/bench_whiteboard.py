@@ -0,0 +1,136 @@
+"""
+Throughput benchmark for the whiteboard text and CSV parsers.
+
+Writes generated whiteboard and CSV files of the given size to a temporary
+directory and reports the parsed megabytes and exercises per second.
+
+Usage:
+    python -m benchmarks.bench_whiteboard --megabytes 8
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from benchmarks.datasets import deep_complexes, flat_sets
+from workout_tracker.exercise import Exercise
+from workout_tracker.whiteboard import (
+    CSV_FIELDS,
+    iter_parse_csv,
+    iter_parse_file,
+)
+from workout_tracker.workout import Amrap
+
+
+def whiteboard_lines(count: int) -> list[str]:
+    """
+    Renders exercises and complexes as whiteboard lines, with an AMRAP
+    header before every tenth block of lines.
+
+    Args:
+        count (int): Number of exercises.
+
+    Returns:
+        list[str]: Lines of whiteboard text.
+    """
+    exercises = flat_sets(count) + deep_complexes(count // 10)
+    lines = []
+    for index, exercise in enumerate(exercises):
+        if index % 50 == 0:
+            lines.append("")
+            if index % 500 == 0:
+                lines.append(f"{index % 20 + 5} min AMRAP")
+        lines.append(str(exercise))
+    return lines
+
+
+def write_files(directory: Path, megabytes: float) -> tuple[Path, Path]:
+    """
+    Writes a whiteboard and a CSV file of at least the given size.
+
+    Args:
+        directory (Path): Directory of the files.
+        megabytes (float): Minimum size of each file.
+
+    Returns:
+        tuple[Path, Path]: Paths of the whiteboard and the CSV file.
+    """
+    sample = whiteboard_lines(10_000)
+    sample_size = sum(len(line) + 1 for line in sample)
+    repeats = int(megabytes * 1e6 / sample_size) + 1
+    text_path = directory / "whiteboard.txt"
+    text_path.write_text("\n".join(sample * repeats) + "\n", encoding="utf-8")
+
+    csv_path = directory / "whiteboard.csv"
+    rows = [exercise.to_dict() for exercise in flat_sets(10_000)]
+    with open(csv_path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, CSV_FIELDS)
+        writer.writeheader()
+        while file.tell() < megabytes * 1e6:
+            writer.writerows(rows)
+    return text_path, csv_path
+
+
+def _csv_items(path: Path) -> Iterator[Exercise]:
+    """
+    Parses a CSV file.
+
+    Args:
+        path (Path): Path of the CSV file.
+
+    Yields:
+        Exercise: Parsed exercises.
+    """
+    with open(path, encoding="utf-8", newline="") as file:
+        yield from iter_parse_csv(file)
+
+
+def measure(parse: Callable[[Path], Any], path: Path) -> tuple[float, int]:
+    """
+    Measures the time to parse a whole file.
+
+    Args:
+        parse (Callable[[Path], Any]): Streaming parser of a file.
+        path (Path): Path of the file.
+
+    Returns:
+        tuple[float, int]: Seconds and number of parsed exercises.
+    """
+    start = time.perf_counter()
+    count = sum(
+        len(item.exercises) if isinstance(item, Amrap) else 1
+        for item in parse(path)
+    )
+    return time.perf_counter() - start, count
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path, csv_path = write_files(Path(directory), args.megabytes)
+        parsers: list[tuple[str, Callable[[Path], Any], Path]] = [
+            ("whiteboard", iter_parse_file, text_path),
+            ("csv", _csv_items, csv_path),
+        ]
+        for name, parse, path in parsers:
+            seconds, count = measure(parse, path)
+            megabytes = path.stat().st_size / 1e6
+            print(
+                f"{name:<11} {megabytes:6.1f} MB  {count:>9,} exercises  "
+                f"{megabytes / seconds:6.2f} MB / s  "
+                f"{count / seconds:10,.0f} exercises / s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Deterministic generated datasets for the benchmarks.
+
+All generators take a count and a seed, so that repeated runs measure the
+same data.
+"""
+
+import random
+from datetime import timedelta
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import (
+    UNIT_ALIASES,
+    Distance,
+    DistanceUnit,
+    Weight,
+    WeightUnit,
+)
+
+MOVEMENTS = [
+    "Back Squat",
+    "Front Squat",
+    "Deadlift",
+    "Bench Press",
+    "Strict Press",
+    "Push Press",
+    "Clean",
+    "Power Clean",
+    "Snatch",
+    "Jerk",
+    "Thruster",
+    "Overhead Squat",
+    "Kettlebell Swing",
+    "Wall Ball",
+    "Pull Up",
+    "Burpee",
+]
+
+CARDIO = ["Run", "Row", "Bike", "Ski"]
+
+SEED = 20230601
+
+
+def measurement_strings(count: int, seed: int = SEED) -> list[str]:
+    """
+    Generates measurement strings with mixed units, aliases, spacing and
+    number formats.
+
+    Args:
+        count (int): Number of strings.
+        seed (int): Random seed. Defaults to SEED.
+
+    Returns:
+        list[str]: Measurement strings.
+    """
+    rng = random.Random(seed)
+    aliases = list(UNIT_ALIASES)
+    strings = []
+    for _ in range(count):
+        value = rng.choice(
+            [str(rng.randint(1, 500)), f"{rng.uniform(0.5, 300):.1f}"]
+        )
+        unit = rng.choice(aliases)
+        spacing = rng.choice(["", " ", "  "])
+        strings.append(f"{value}{spacing}{unit}")
+    return strings
+
+
+def flat_sets(count: int, seed: int = SEED) -> list[Exercise]:
+    """
+    Generates plain sets of strength, cardio and timed exercises with
+    mixed units.
+
+    Args:
+        count (int): Number of exercises.
+        seed (int): Random seed. Defaults to SEED.
+
+    Returns:
+        list[Exercise]: Exercises.
+    """
+    rng = random.Random(seed)
+    exercises = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.6:
+            exercise = Exercise(
+                name=rng.choice(MOVEMENTS),
+                reps=rng.randint(1, 20),
+                weight=Weight(
+                    float(rng.randint(20, 300)), rng.choice(list(WeightUnit))
+                ),
+            )
+        elif kind < 0.85:
+            exercise = Exercise(
+                name=rng.choice(CARDIO),
+                distance=Distance(
+                    float(rng.randint(1, 50) * 100),
+                    rng.choice([DistanceUnit.M, DistanceUnit.KM]),
+                ),
+            )
+        else:
+            exercise = Exercise(
+                name=rng.choice(["Plank", "Hollow Hold", "Wall Sit"]),
+                reps=rng.randint(1, 5),
+                duration=timedelta(seconds=rng.randint(10, 300)),
+            )
+        exercises.append(exercise)
+    return exercises
+
+
+def deep_complexes(
+    count: int, width: int = 6, seed: int = SEED
+) -> list[Exercise]:
+    """
+    Generates complexes of several loaded sub exercises.
+
+    Args:
+        count (int): Number of complexes.
+        width (int): Maximum number of sub exercises. Defaults to 6.
+        seed (int): Random seed. Defaults to SEED.
+
+    Returns:
+        list[Exercise]: Complexes.
+    """
+    rng = random.Random(seed)
+    return [
+        Exercise(
+            name=None,
+            reps=rng.randint(1, 5),
+            weight=Weight(float(rng.randint(20, 140)), WeightUnit.KG),
+            sub_exercises=[
+                Exercise(name=name, reps=rng.randint(1, 3))
+                for name in rng.sample(MOVEMENTS, rng.randint(2, width))
+            ],
+        )
+        for _ in range(count)
+    ]
+
+
+def training_history(years: int, seed: int = SEED) -> list[dict]:
+    """
+    Generates the logged sets of a multi-year training history as
+    exercise dictionaries, as they are read from the logs.
+
+    Four sessions a week repeat a few prescriptions with loads on a 2.5 kg
+    grid that progress in twelve week cycles, plus conditioning pieces.
+
+    Args:
+        years (int): Number of years.
+        seed (int): Random seed. Defaults to SEED.
+
+    Returns:
+        list[dict]: Exercise dictionaries in logged order.
+    """
+    rng = random.Random(seed)
+    maxes = {movement: rng.randint(40, 160) for movement in MOVEMENTS}
+    sets = []
+    for week in range(52 * years):
+        progress = 1 + (week % 12) * 0.01
+        for _ in range(4):
+            for movement in rng.sample(MOVEMENTS, 3):
+                reps = rng.choice([1, 3, 5, 8])
+                load = maxes[movement] * progress * (1 - reps * 0.025)
+                weight = Weight(round(load / 2.5) * 2.5, WeightUnit.KG)
+                for _ in range(5):
+                    sets.append(
+                        Exercise(name=movement, reps=reps, weight=weight)
+                    )
+            sets.append(
+                Exercise(
+                    name=rng.choice(CARDIO),
+                    distance=Distance(
+                        rng.choice([200, 400, 500, 1000]), DistanceUnit.M
+                    ),
+                )
+            )
+    return [exercise.to_dict() for exercise in sets]
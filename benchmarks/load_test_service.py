@@ -0,0 +1,122 @@
+"""
+Load test for the asyncio ingestion service.
+
+Starts the service on a free local port with a JSON Lines or SQLite
+backend, posts exercises over keep-alive connections from the given number
+of concurrent clients and reports latency percentiles and throughput.
+
+Usage:
+    python -m benchmarks.load_test_service --backend sqlite --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from workout_tracker.service import (
+    BatchWriter,
+    IngestionService,
+    JsonlStorage,
+    SqliteStorage,
+    Storage,
+)
+
+PAYLOAD = json.dumps(
+    {"name": "Back Squat", "reps": 5, "weight": "100 kg"}
+).encode()
+
+
+async def client(port: int, count: int, latencies: list[float]) -> int:
+    """
+    Posts exercises over a single keep-alive connection.
+
+    Args:
+        port (int): Port of the service.
+        count (int): Number of requests.
+        latencies (list[float]): Collects the latency of each request.
+
+    Returns:
+        int: Number of rejected requests.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = (
+        b"POST /exercises HTTP/1.1\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: " + str(len(PAYLOAD)).encode() + b"\r\n\r\n"
+    ) + PAYLOAD
+    rejected = 0
+    for _ in range(count):
+        start = time.perf_counter()
+        writer.write(request)
+        status = await reader.readline()
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+        rejected += b" 201 " not in status
+    writer.close()
+    return rejected
+
+
+async def run(args: argparse.Namespace, path: Path) -> None:
+    """
+    Runs the load test against a service with the chosen backend.
+
+    Args:
+        args (argparse.Namespace): Command line arguments.
+        path (Path): Path of the storage.
+    """
+    storage: Storage
+    if args.backend == "sqlite":
+        storage = SqliteStorage(path.with_suffix(".db"))
+    else:
+        storage = JsonlStorage(path.with_suffix(".jsonl"))
+    writer = BatchWriter(
+        storage, max_batch_size=args.batch_size, max_delay=args.max_delay
+    )
+    latencies: list[float] = []
+    per_client = args.requests // args.clients
+    async with IngestionService(writer, port=0) as service:
+        start = time.perf_counter()
+        rejected = await asyncio.gather(
+            *(
+                client(service.port, per_client, latencies)
+                for _ in range(args.clients)
+            )
+        )
+        elapsed = time.perf_counter() - start
+    storage.close()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"backend:   {args.backend}")
+    print(f"requests:  {len(latencies):,} from {args.clients} clients")
+    print(f"rejected:  {sum(rejected):,}")
+    print(f"p50:       {quantiles[49] * 1e3:.2f} ms")
+    print(f"p99:       {quantiles[98] * 1e3:.2f} ms")
+    print(f"rps:       {len(latencies) / elapsed:,.0f}")
+
+
+def main() -> None:
+    """
+    Parses the arguments and runs the load test.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--backend", choices=("jsonl", "sqlite"), default="jsonl"
+    )
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--max-delay", type=float, default=0.01)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args, Path(directory) / "exercises"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Benchmark suite for the core hot paths with a regression gate.
+
+Measures the throughput of each case on generated datasets and compares
+it with a stored baseline. Exits with status 1 if any case drops by more
+than the threshold, or if there is no baseline to compare with. Record
+a baseline on the machine that runs the gate with --save.
+
+Usage:
+    python -m benchmarks.suite --save
+    python -m benchmarks.suite --threshold 0.2
+"""
+
+import argparse
+import json
+import operator
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from benchmarks.datasets import deep_complexes, flat_sets, measurement_strings
+from workout_tracker.duration import clear_duration_cache
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import (
+    DistanceUnit,
+    Weight,
+    WeightUnit,
+    get_value_and_unit,
+)
+from workout_tracker.whiteboard import parse_line
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.2
+
+
+def bench(
+    function: Callable[[Any], Any], setup: Callable[[], list], repeats: int
+) -> float:
+    """
+    Measures the best throughput of calling a function on every item.
+
+    Args:
+        function (Callable[[Any], Any]): Function to measure.
+        setup (Callable[[], list]): Builds the items before each run,
+            outside of the measurement.
+        repeats (int): Number of runs, the fastest one counts.
+
+    Returns:
+        float: Calls per second.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        items = setup()
+        clear_duration_cache()
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+
+Case = tuple[Callable[[Any], Any], Callable[[], list]]
+
+
+def cases(count: int) -> dict[str, Case]:
+    """
+    Builds the benchmark cases with their datasets. Exercises are rebuilt
+    for every run of the rendering cases, so that cached renderings do
+    not hide the cost of the first one.
+
+    Args:
+        count (int): Number of items per dataset.
+
+    Returns:
+        dict[str, Case]: Function and item setup per case name.
+    """
+    strings = measurement_strings(count)
+    weight_strings = [
+        string
+        for string in strings
+        if get_value_and_unit(string)[1] in WeightUnit
+    ]
+    flat_dicts = [exercise.to_dict() for exercise in flat_sets(count)]
+    complex_dicts = [
+        exercise.to_dict() for exercise in deep_complexes(count // 4)
+    ]
+    lines = [str(exercise) for exercise in flat_sets(count)]
+    units: list[object] = [
+        get_value_and_unit(string)[1].value for string in strings
+    ]
+    units += ["parsec", 42, None] * (count // 30)
+    flat = partial(_fresh, flat_dicts)
+    complexes = partial(_fresh, complex_dicts)
+    return {
+        "get_value_and_unit": (get_value_and_unit, lambda: strings),
+        "weight_from_str": (Weight.from_str, lambda: weight_strings),
+        "from_dict_flat": (Exercise.from_dict, lambda: flat_dicts),
+        "from_dict_complex": (Exercise.from_dict, lambda: complex_dicts),
+        "to_dict_flat": (Exercise.to_dict, flat),
+        "to_dict_complex": (Exercise.to_dict, complexes),
+        "str_flat": (str, flat),
+        "str_complex": (str, complexes),
+        "parse_line": (parse_line, lambda: lines),
+        "enum_contains": (
+            partial(operator.contains, DistanceUnit),
+            lambda: units,
+        ),
+    }
+
+
+def _fresh(dicts: list[dict]) -> list[Exercise]:
+    """
+    Builds exercises without cached renderings.
+
+    Args:
+        dicts (list[dict]): Exercise dictionaries.
+
+    Returns:
+        list[Exercise]: New exercises.
+    """
+    return [Exercise.from_dict(exercise_dict) for exercise_dict in dicts]
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """
+    Finds the cases that dropped by more than the threshold.
+
+    Args:
+        results (dict[str, float]): Throughput per case.
+        baseline (dict[str, float]): Baseline throughput per case.
+        threshold (float): Allowed relative drop, e.g. 0.2 for 20 %.
+
+    Returns:
+        list[str]: Names of the regressed cases.
+    """
+    return [
+        name
+        for name, throughput in results.items()
+        if name in baseline and throughput < baseline[name] * (1 - threshold)
+    ]
+
+
+def main() -> None:
+    """
+    Runs the suite, prints the results and applies the regression gate.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save", action="store_true")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+
+    results = {}
+    for name, (function, setup) in cases(args.count).items():
+        results[name] = bench(function, setup, args.repeats)
+        change = ""
+        if name in baseline:
+            change = f"{results[name] / baseline[name] - 1:+8.1%}"
+        print(f"{name:<20} {results[name]:>14,.0f} ops / s {change}")
+
+    if args.save:
+        args.baseline.write_text(
+            json.dumps(results, indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"Saved baseline to {args.baseline}")
+        return
+    if not baseline:
+        print(f"No baseline at {args.baseline}, run with --save first.")
+        sys.exit(1)
+    if regressed := compare(results, baseline, args.threshold):
+        print(f"Regressed by more than {args.threshold:.0%}: {regressed}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
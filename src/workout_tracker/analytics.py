@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from typing import NamedTuple, TypeVar
+
+from workout_tracker.exercise import AnyExercise
+from workout_tracker.movements import CATALOG
+from workout_tracker.workout import Amrap, Workout
+
+K = TypeVar("K", bound=Hashable)
+
+PERIODS: dict[str, Callable[[date], Hashable]] = {
+    "day": lambda day: day,
+    "week": lambda day: tuple(day.isocalendar()[:2]),
+    "month": lambda day: (day.year, day.month),
+    "year": lambda day: day.year,
+}
+
+
+class Movement(NamedTuple):
+    """
+    Flattened movement with quantities in SI units.
+    """
+
+    name: str
+    reps: float
+    load: float
+    distance: float
+    duration: float
+
+
+def iter_movements(
+    record: AnyExercise | Workout, rounds: float = 1
+) -> Iterator[Movement]:
+    """
+    Flattens an exercise or workout into movements.
+
+    Complexes are split into their sub exercises, each performed the reps
+    of the complex times its own reps with the load of the complex. A
+    distance or duration of a complex is reported on a movement with the
+    name of the complex. Distances and durations count once per rep.
+    Exercises of an AMRAP are counted for the given number of rounds per
+    repeat, nested buy-in and buy-out workouts for a single round.
+
+    Args:
+        record (AnyExercise | Workout): Exercise or workout to flatten.
+        rounds (float): Completed rounds of AMRAP workouts. Defaults to 1.
+
+    Raises:
+        TypeError: If the workout type is not supported.
+
+    Yields:
+        Movement: Flattened movement.
+    """
+    if isinstance(record, Amrap):
+        if record.buy_in is not None:
+            yield from iter_movements(record.buy_in)
+        for exercise in record.exercises:
+            for movement in iter_movements(exercise):
+                factor = rounds * record.repeats
+                yield movement._replace(
+                    reps=movement.reps * factor,
+                    distance=movement.distance * factor,
+                    duration=movement.duration * factor,
+                )
+        if record.buy_out is not None:
+            yield from iter_movements(record.buy_out)
+        return
+
+    if not isinstance(record, AnyExercise):
+        raise TypeError(f"Cannot flatten object of type {type(record)}.")
+    count = record.reps or 1
+    load = record.weight.si_value if record.weight else 0.0
+    distance = record.distance.si_value * count if record.distance else 0.0
+    duration = (
+        record.duration.total_seconds() * count if record.duration else 0.0
+    )
+    if record.sub_exercises is None:
+        yield Movement(record.name, record.reps or 0, load, distance, duration)
+        return
+    for sub_exercise in record.sub_exercises:
+        yield Movement(
+            sub_exercise.name, count * sub_exercise.reps, load, 0, 0
+        )
+    if distance or duration:
+        yield Movement(record.name, 0, 0.0, distance, duration)
+
+
+def work_time(record: AnyExercise | Workout) -> float:
+    """
+    Computes the time under work of an exercise or workout.
+
+    AMRAPs count their duration per repeat plus their buy-in and buy-out,
+    exercises count their duration per rep.
+
+    Args:
+        record (AnyExercise | Workout): Exercise or workout.
+
+    Raises:
+        TypeError: If the workout type is not supported.
+
+    Returns:
+        float: Time under work in seconds.
+    """
+    if isinstance(record, Amrap):
+        return (
+            record.duration.total_seconds() * record.repeats
+            + (work_time(record.buy_in) if record.buy_in else 0.0)
+            + (work_time(record.buy_out) if record.buy_out else 0.0)
+        )
+    if not isinstance(record, AnyExercise):
+        raise TypeError(f"Cannot time object of type {type(record)}.")
+    if record.duration is None:
+        return 0.0
+    return record.duration.total_seconds() * (record.reps or 1)
+
+
+@dataclass(frozen=True)
+class VolumeStats:
+    """
+    Aggregated training volume.
+    """
+
+    reps: float = 0.0
+    loaded_reps: float = 0.0
+    tonnage: float = 0.0
+    distance: float = 0.0
+    time: float = 0.0
+
+    @property
+    def intensity(self) -> float | None:
+        """
+        Average load per loaded rep.
+
+        Returns:
+            float | None: Load in kg or None without loaded reps.
+        """
+        if not self.loaded_reps:
+            return None
+        return self.tonnage / self.loaded_reps
+
+    @property
+    def density(self) -> float | None:
+        """
+        Tonnage per minute of work.
+
+        Returns:
+            float | None: Tonnage in kg per minute or None without time.
+        """
+        if not self.time:
+            return None
+        return self.tonnage / self.time * 60
+
+
+class VolumeTable:  # pylint: disable=too-many-instance-attributes
+    """
+    Columnar table of flattened movements for bulk volume analytics.
+
+    Exercises and workouts are flattened once into numeric columns in SI
+    units. Aggregations then run over the columns without walking any
+    exercise trees again.
+    """
+
+    def __init__(self) -> None:
+        """
+        Columnar table of flattened movements for bulk volume analytics.
+        """
+        self.names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self.name_ids = array("I")
+        self.workout_ids = array("I")
+        self.reps = array("d")
+        self.loads = array("d")
+        self.distances = array("d")
+        self.durations = array("d")
+        self.workout_days = array("i")
+        self.workout_times = array("d")
+
+    def __len__(self) -> int:
+        """
+        Number of movements in the table.
+
+        Returns:
+            int: Number of movements.
+        """
+        return len(self.reps)
+
+    def add(
+        self,
+        record: AnyExercise | Workout,
+        day: date | None = None,
+        rounds: float = 1,
+    ) -> int:
+        """
+        Flattens an exercise or workout into the table.
+
+        Args:
+            record (AnyExercise | Workout): Exercise or workout.
+            day (date | None): Date of the workout. Defaults to None.
+            rounds (float): Completed rounds of AMRAP workouts.
+                Defaults to 1.
+
+        Returns:
+            int: Id of the workout within the table.
+        """
+        workout_id = len(self.workout_times)
+        self.workout_days.append(day.toordinal() if day else 0)
+        self.workout_times.append(work_time(record))
+        for movement in iter_movements(record, rounds=rounds):
+            if (name_id := self._name_ids.get(movement.name)) is None:
+                name_id = self._name_ids[movement.name] = len(self.names)
+                self.names.append(movement.name)
+            self.name_ids.append(name_id)
+            self.workout_ids.append(workout_id)
+            self.reps.append(movement.reps)
+            self.loads.append(movement.load)
+            self.distances.append(movement.distance)
+            self.durations.append(movement.duration)
+        return workout_id
+
+    def extend(
+        self, records: Iterable[tuple[date, AnyExercise | Workout]]
+    ) -> None:
+        """
+        Flattens dated exercises or workouts into the table.
+
+        Args:
+            records (Iterable[tuple[date, AnyExercise | Workout]]): Dates and
+                exercises or workouts.
+        """
+        for day, record in records:
+            self.add(record, day=day)
+
+    def _aggregate(
+        self, keys: Iterable[K], time: Iterable[float]
+    ) -> dict[K, VolumeStats]:
+        """
+        Sums all columns per key.
+
+        Args:
+            keys (Iterable[K]): Group key per movement.
+            time (Iterable[float]): Time under work per movement.
+
+        Returns:
+            dict[K, VolumeStats]: Volume per key.
+        """
+        keys = list(keys)
+        tonnage = array("d", map(operator.mul, self.reps, self.loads))
+        loaded = array(
+            "d",
+            (
+                reps if load else 0.0
+                for reps, load in zip(self.reps, self.loads)
+            ),
+        )
+        columns = [
+            _group_sum(keys, column)
+            for column in (self.reps, loaded, tonnage, self.distances, time)
+        ]
+        return {
+            key: VolumeStats(*(column[key] for column in columns))
+            for key in columns[0]
+        }
+
+    def totals(self) -> VolumeStats:
+        """
+        Sums the volume of all movements.
+
+        Returns:
+            VolumeStats: Total volume.
+        """
+        tonnage = map(operator.mul, self.reps, self.loads)
+        return VolumeStats(
+            reps=math.fsum(self.reps),
+            loaded_reps=math.fsum(
+                reps for reps, load in zip(self.reps, self.loads) if load
+            ),
+            tonnage=math.fsum(tonnage),
+            distance=math.fsum(self.distances),
+            time=math.fsum(self.workout_times),
+        )
+
+    def by_exercise(self) -> dict[str, VolumeStats]:
+        """
+        Aggregates the volume per exercise name.
+
+        Returns:
+            dict[str, VolumeStats]: Volume per exercise name.
+        """
+        per_id = self._aggregate(self.name_ids, self.durations)
+        return {
+            self.names[name_id]: stats for name_id, stats in per_id.items()
+        }
+
+    def by_movement(self) -> dict[int | None, VolumeStats]:
+        """
+        Aggregates the volume per movement of the CATALOG, so that names
+        logged with different aliases count for the same movement.
+
+        Returns:
+            dict[int | None, VolumeStats]: Volume per movement ID, with
+                unknown movements under None.
+        """
+        movement_ids = [CATALOG.lookup(name) for name in self.names]
+        keys = map(movement_ids.__getitem__, self.name_ids)
+        return self._aggregate(keys, self.durations)
+
+    def by_workout(self) -> dict[int, VolumeStats]:
+        """
+        Aggregates the volume per workout.
+
+        Returns:
+            dict[int, VolumeStats]: Volume per workout id.
+        """
+        per_id = self._aggregate(self.workout_ids, self._workout_time_shares())
+        return {
+            workout_id: per_id.get(workout_id, VolumeStats(time=time))
+            for workout_id, time in enumerate(self.workout_times)
+        }
+
+    def by_period(
+        self, period: str | Callable[[date], Hashable] = "week"
+    ) -> dict[Hashable, VolumeStats]:
+        """
+        Aggregates the volume per period of the workout dates.
+
+        Args:
+            period (str | Callable[[date], Hashable]): One of "day", "week",
+                "month" and "year" or a function mapping a date to its
+                period. Defaults to "week".
+
+        Returns:
+            dict[Hashable, VolumeStats]: Volume per period.
+        """
+        to_period = PERIODS[period] if isinstance(period, str) else period
+        workout_periods = [
+            to_period(date.fromordinal(ordinal)) if ordinal else None
+            for ordinal in self.workout_days
+        ]
+        keys = map(workout_periods.__getitem__, self.workout_ids)
+        return self._aggregate(keys, self._workout_time_shares())
+
+    def _workout_time_shares(self) -> array:
+        """
+        Assigns the time under work of each workout to its first movement,
+        so that summing per movement counts every workout once.
+
+        Returns:
+            array: Time under work per movement.
+        """
+        shares = array("d", bytes(8 * len(self)))
+        seen = -1
+        for position, workout_id in enumerate(self.workout_ids):
+            if workout_id != seen:
+                shares[position] = self.workout_times[workout_id]
+                seen = workout_id
+        return shares
+
+
+def _group_sum(keys: list[K], values: Iterable[float]) -> dict[K, float]:
+    """
+    Sums values per key.
+
+    Args:
+        keys (list[K]): Key per value.
+        values (Iterable[float]): Values to sum.
+
+    Returns:
+        dict[K, float]: Sum per key in order of first appearance.
+    """
+    sums = dict.fromkeys(keys, 0.0)
+    for key, value in zip(keys, values):
+        sums[key] += value
+    return sums
@@ -1,14 +1,29 @@
 # pylint: disable=no-value-for-parameter
 
+from collections.abc import Mapping
 from enum import EnumMeta, StrEnum
+from types import MappingProxyType
 from typing import Any
 
 
 class MetaEnum(EnumMeta):
     """
     MetaEnum class with contains method.
+
+    Builds a frozen index from member values to members when the enum class
+    is created, so that membership tests and value lookups are plain hash
+    lookups that never raise.
     """
 
+    _value_index_: Mapping[Any, Any]
+
+    def __new__(mcs, cls, bases, classdict, **kwds):
+        enum_class = super().__new__(mcs, cls, bases, classdict, **kwds)
+        value_index = dict(enum_class._value2member_map_)
+        value_index.update((member, member) for member in enum_class)
+        enum_class._value_index_ = MappingProxyType(value_index)
+        return enum_class
+
     def __contains__(cls, item: Any) -> bool:
         """
         Checks whether enum contains given item
@@ -20,10 +35,26 @@ class MetaEnum(EnumMeta):
             bool: True if item in enum and False otherwise.
         """
         try:
-            cls(item)
-        except ValueError:
+            return item in cls._value_index_
+        except TypeError:
             return False
-        return True
+
+    def get(cls, value: Any, default: Any = None) -> Any:
+        """
+        Looks up the enum member with the given value.
+
+        Args:
+            value (Any): Value of the member.
+            default (Any): Returned if no member has the given value.
+                Defaults to None.
+
+        Returns:
+            Any: Enum member with the given value or default.
+        """
+        try:
+            return cls._value_index_.get(value, default)
+        except TypeError:
+            return default
 
 
 class BetterStrEnum(StrEnum, metaclass=MetaEnum):
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from itertools import islice
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.jsonl import (
+    RecordError,
+    build_record,
+    log_record_error,
+    parse_record,
+)
+
+DEFAULT_CHUNK_SIZE = 2_000
+
+# Chunks in flight per worker, bounds the memory of unconsumed results.
+CHUNKS_PER_WORKER = 2
+
+Item = tuple[int, object]
+ChunkResult = tuple[int, list[Exercise], list[RecordError]]
+
+
+@dataclass
+class ImportResult:
+    """
+    Exercises and errors of a bulk import.
+    """
+
+    exercises: list[Exercise] = field(default_factory=list)
+    errors: list[RecordError] = field(default_factory=list)
+
+
+def _parse_chunk(items: list[Item]) -> ChunkResult:
+    """
+    Parses a chunk of records, collecting the errors of invalid ones.
+
+    Args:
+        items (list[Item]): Line number and raw JSON text or decoded JSON
+            record of each record.
+
+    Returns:
+        ChunkResult: Number of records, exercises and errors.
+    """
+    exercises = []
+    errors = []
+    for number, item in items:
+        try:
+            if isinstance(item, str):
+                exercises.append(parse_record(number, item))
+            else:
+                exercises.append(build_record(number, item))
+        except RecordError as error:
+            errors.append(error)
+    return len(items), exercises, errors
+
+
+def _iter_items(path: str | os.PathLike) -> Iterator[Item]:
+    """
+    Reads the records of a JSON array or JSON Lines export.
+
+    JSON Lines records are passed on as raw text, so that decoding happens
+    in the workers. JSON arrays are decoded at once and numbered by their
+    position, starting at 1.
+
+    Args:
+        path (str | os.PathLike): Path of the export.
+
+    Yields:
+        Item: Line number and record.
+    """
+    with open(path, encoding="utf-8") as file:
+        head = file.read(1)
+        while head.isspace():
+            head = file.read(1)
+        file.seek(0)
+        if head == "[":
+            yield from enumerate(json.load(file), start=1)
+            return
+        for line_number, line in enumerate(file, start=1):
+            if line.strip():
+                yield line_number, line
+
+
+def _chunks(items: Iterator[Item], chunk_size: int) -> Iterator[list[Item]]:
+    """
+    Splits records into chunks.
+
+    Args:
+        items (Iterator[Item]): Records to split.
+        chunk_size (int): Maximum number of records per chunk.
+
+    Yields:
+        list[Item]: Chunk of records.
+    """
+    while chunk := list(islice(items, chunk_size)):
+        yield chunk
+
+
+def _map_ordered(
+    executor: ProcessPoolExecutor, chunks: Iterable[list[Item]], window: int
+) -> Iterator[ChunkResult]:
+    """
+    Parses chunks in the pool and yields the results in input order.
+
+    Args:
+        executor (ProcessPoolExecutor): Process pool.
+        chunks (Iterable[list[Item]]): Chunks to parse.
+        window (int): Maximum number of chunks in flight.
+
+    Yields:
+        ChunkResult: Result of each chunk.
+    """
+    pending: deque[Future[ChunkResult]] = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(_parse_chunk, chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _map_unordered(
+    executor: ProcessPoolExecutor, chunks: Iterable[list[Item]], window: int
+) -> Iterator[ChunkResult]:
+    """
+    Parses chunks in the pool and yields the results as they complete.
+
+    Args:
+        executor (ProcessPoolExecutor): Process pool.
+        chunks (Iterable[list[Item]]): Chunks to parse.
+        window (int): Maximum number of chunks in flight.
+
+    Yields:
+        ChunkResult: Result of each chunk.
+    """
+    pending: set[Future[ChunkResult]] = set()
+    for chunk in chunks:
+        pending.add(executor.submit(_parse_chunk, chunk))
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    for future in wait(pending).done:
+        yield future.result()
+
+
+def _parse_chunks(
+    chunks: Iterator[list[Item]], workers: int, ordered: bool
+) -> Iterator[ChunkResult]:
+    """
+    Parses chunks in a process pool, or in this process for one worker.
+
+    Args:
+        chunks (Iterator[list[Item]]): Chunks to parse.
+        workers (int): Number of worker processes.
+        ordered (bool): Yield results in input order.
+
+    Yields:
+        ChunkResult: Result of each chunk.
+    """
+    if workers == 1:
+        yield from map(_parse_chunk, chunks)
+        return
+    map_chunks = _map_ordered if ordered else _map_unordered
+    with ProcessPoolExecutor(workers) as executor:
+        yield from map_chunks(executor, chunks, workers * CHUNKS_PER_WORKER)
+
+
+def iter_import(  # pylint: disable=too-many-arguments
+    path: str | os.PathLike,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+    on_error: Callable[[RecordError], None] | None = None,
+    on_progress: Callable[[int], None] | None = None,
+) -> Iterator[Exercise]:
+    """
+    Loads exercises from a JSON array or JSON Lines export in parallel.
+
+    The export is split into chunks which are parsed in a process pool.
+    Invalid records are passed to on_error and skipped. In order, the
+    stream is identical to the serial jsonl.iter_load. With a single
+    worker the chunks are parsed in this process.
+
+    Args:
+        path (str | os.PathLike): Path of the export.
+        workers (int | None): Number of worker processes. Defaults to the
+            number of CPUs.
+        chunk_size (int): Number of records per chunk.
+            Defaults to DEFAULT_CHUNK_SIZE.
+        ordered (bool): Yield exercises in the order of the export instead
+            of as soon as their chunk is parsed. Defaults to True.
+        on_error (Callable[[RecordError], None] | None): Called for every
+            invalid record. Defaults to logging a warning.
+        on_progress (Callable[[int], None] | None): Called with the number
+            of processed records after each chunk. Defaults to None.
+
+    Raises:
+        ValueError: If workers or chunk_size is not positive.
+
+    Yields:
+        Exercise: Exercise of each valid record.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Workers and chunk size need to be positive!")
+    handle_error = on_error or log_record_error
+    chunks = _chunks(_iter_items(path), chunk_size)
+    processed = 0
+    for count, exercises, errors in _parse_chunks(chunks, workers, ordered):
+        for error in errors:
+            handle_error(error)
+        yield from exercises
+        processed += count
+        if on_progress is not None:
+            on_progress(processed)
+
+
+def bulk_import(
+    path: str | os.PathLike,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_progress: Callable[[int], None] | None = None,
+) -> ImportResult:
+    """
+    Loads all exercises of an export in parallel and collects the errors.
+
+    Args:
+        path (str | os.PathLike): Path of the export.
+        workers (int | None): Number of worker processes. Defaults to the
+            number of CPUs.
+        chunk_size (int): Number of records per chunk.
+            Defaults to DEFAULT_CHUNK_SIZE.
+        on_progress (Callable[[int], None] | None): Called with the number
+            of processed records after each chunk. Defaults to None.
+
+    Returns:
+        ImportResult: Exercises in export order and errors of invalid
+            records.
+    """
+    result = ImportResult()
+    result.exercises.extend(
+        iter_import(
+            path,
+            workers=workers,
+            chunk_size=chunk_size,
+            on_error=result.errors.append,
+            on_progress=on_progress,
+        )
+    )
+    return result
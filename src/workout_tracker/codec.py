@@ -0,0 +1,462 @@
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+from typing import Any
+
+from workout_tracker.exercise import AnyExercise, Exercise
+from workout_tracker.measurement import (
+    UNIT_CODES,
+    UNITS_BY_CODE,
+    Distance,
+    DistanceUnit,
+    Measurement,
+    Weight,
+)
+from workout_tracker.workout import Amrap, Workout
+
+# Layout of version 1, all numbers little endian:
+#
+#     header        magic b"WTRK", version (uint8)
+#     string table  count (uint32), then per string its length (uint16)
+#                   and UTF-8 bytes
+#     records       count (uint32), then per record a tag (uint8) and body
+#
+# Exercise bodies start with a field bitmask (uint8) followed by the name
+# index (uint32, omitted for complexes whose name is derived), reps (int32,
+# or float64 for float reps, marked by a flag), weight, duration, distance,
+# height and the sub exercises, each only if set. Measurements are a unit
+# code from UNIT_CODES (uint8, the high bit marks integral values) and the
+# value (float64). Durations are stored as microseconds (int64).
+
+MAGIC = b"WTRK"
+VERSION = 1
+
+TAG_EXERCISE = 1
+TAG_AMRAP = 2
+TAG_MEASUREMENT = 3
+TAG_TIMEDELTA = 4
+
+_REPS = 1
+_WEIGHT = 2
+_DURATION = 4
+_DISTANCE = 8
+_HEIGHT = 16
+_SUB_EXERCISES = 32
+_FLOAT_REPS = 64
+
+_REST = 1
+_BUY_IN = 2
+_BUY_OUT = 4
+
+_INTEGRAL = 0x80
+
+_HEADER = struct.Struct("<4sB")
+_UINT8 = struct.Struct("<B")
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+_INT32 = struct.Struct("<i")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_MEASUREMENT = struct.Struct("<Bd")
+_AMRAP = struct.Struct("<qIB")
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+Record = AnyExercise | Workout | Measurement | timedelta
+
+
+class DecodeError(ValueError):
+    """Error raised when binary data cannot be decoded."""
+
+
+class _Encoder:
+    """
+    Collects the string table and record bodies while encoding.
+    """
+
+    def __init__(self) -> None:
+        """
+        Collects the string table and record bodies while encoding.
+        """
+        self.strings: dict[str, int] = {}
+        self.body = bytearray()
+        self.count = 0
+
+    def string(self, value: str) -> None:
+        """
+        Writes the string table index of a string.
+
+        Args:
+            value (str): String to reference.
+        """
+        if (index := self.strings.get(value)) is None:
+            index = self.strings[value] = len(self.strings)
+        self.body += _UINT32.pack(index)
+
+    def measurement(self, measurement: Measurement) -> None:
+        """
+        Writes a distance or weight.
+
+        Args:
+            measurement (Measurement): Measurement to write.
+        """
+        code = UNIT_CODES[measurement.unit.name]
+        if isinstance(measurement.value, int):
+            code |= _INTEGRAL
+        self.body += _MEASUREMENT.pack(code, measurement.value)
+
+    def timedelta(self, duration: timedelta) -> None:
+        """
+        Writes a duration with microsecond resolution.
+
+        Args:
+            duration (timedelta): Duration to write.
+        """
+        self.body += _INT64.pack(duration // _ONE_MICROSECOND)
+
+    def exercise(self, exercise: AnyExercise) -> None:
+        """
+        Writes an exercise body including its sub exercises.
+
+        Args:
+            exercise (AnyExercise): Exercise to write.
+        """
+        flags = (
+            (_REPS if exercise.reps is not None else 0)
+            | (_WEIGHT if exercise.weight is not None else 0)
+            | (_DURATION if exercise.duration is not None else 0)
+            | (_DISTANCE if exercise.distance is not None else 0)
+            | (_HEIGHT if exercise.height is not None else 0)
+            | (_SUB_EXERCISES if exercise.sub_exercises is not None else 0)
+        )
+        if flags & _REPS and not isinstance(exercise.reps, int):
+            flags |= _FLOAT_REPS
+        self.body += _UINT8.pack(flags)
+        if exercise.sub_exercises is None:
+            self.string(exercise.name)
+        if flags & _FLOAT_REPS:
+            self.body += _FLOAT64.pack(exercise.reps)
+        elif flags & _REPS:
+            self.body += _INT32.pack(exercise.reps)
+        if flags & _WEIGHT:
+            self.measurement(exercise.weight)
+        if flags & _DURATION:
+            self.timedelta(exercise.duration)
+        if flags & _DISTANCE:
+            self.measurement(exercise.distance)
+        if flags & _HEIGHT:
+            self.measurement(exercise.height)
+        if flags & _SUB_EXERCISES:
+            self.body += _UINT16.pack(len(exercise.sub_exercises))
+            for sub_exercise in exercise.sub_exercises:
+                self.exercise(sub_exercise)
+
+    def amrap(self, amrap: Amrap) -> None:
+        """
+        Writes an AMRAP body including nested buy-in and buy-out workouts.
+
+        Args:
+            amrap (Amrap): Workout to write.
+        """
+        flags = (
+            (_REST if amrap.rest is not None else 0)
+            | (_BUY_IN if amrap.buy_in is not None else 0)
+            | (_BUY_OUT if amrap.buy_out is not None else 0)
+        )
+        self.body += _AMRAP.pack(
+            amrap.duration // _ONE_MICROSECOND, amrap.repeats, flags
+        )
+        if flags & _REST:
+            self.timedelta(amrap.rest)
+        self.body += _UINT16.pack(len(amrap.exercises))
+        for exercise in amrap.exercises:
+            self.exercise(exercise)
+        if flags & _BUY_IN:
+            self.record(amrap.buy_in)
+        if flags & _BUY_OUT:
+            self.record(amrap.buy_out)
+
+    def record(self, obj: Record) -> None:
+        """
+        Writes a tagged record.
+
+        Args:
+            obj (Record): Object to write.
+
+        Raises:
+            TypeError: If the object type is not supported.
+        """
+        if isinstance(obj, AnyExercise):
+            self.body += _UINT8.pack(TAG_EXERCISE)
+            self.exercise(obj)
+        elif isinstance(obj, Amrap):
+            self.body += _UINT8.pack(TAG_AMRAP)
+            self.amrap(obj)
+        elif isinstance(obj, Measurement):
+            self.body += _UINT8.pack(TAG_MEASUREMENT)
+            self.measurement(obj)
+        elif isinstance(obj, timedelta):
+            self.body += _UINT8.pack(TAG_TIMEDELTA)
+            self.timedelta(obj)
+        else:
+            raise TypeError(f"Cannot encode object of type {type(obj)}.")
+
+    def to_bytes(self) -> bytes:
+        """
+        Assembles header, string table and records.
+
+        Returns:
+            bytes: Encoded data.
+        """
+        parts: list[bytes | bytearray] = [
+            _HEADER.pack(MAGIC, VERSION),
+            _UINT32.pack(len(self.strings)),
+        ]
+        for value in self.strings:
+            encoded = value.encode("utf-8")
+            parts.append(_UINT16.pack(len(encoded)))
+            parts.append(encoded)
+        parts.append(_UINT32.pack(self.count))
+        parts.append(self.body)
+        return b"".join(parts)
+
+
+class _Decoder:
+    """
+    Reads records from a buffer without copying it.
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        """
+        Reads records from a buffer without copying it.
+
+        Args:
+            view (memoryview): Encoded data.
+        """
+        self.view = view
+        self.offset = 0
+        self.strings: list[str] = []
+
+    def unpack(self, fmt: struct.Struct) -> tuple[Any, ...]:
+        """
+        Unpacks fixed width fields at the current offset.
+
+        Args:
+            fmt (struct.Struct): Format of the fields.
+
+        Returns:
+            tuple[Any, ...]: Unpacked values.
+        """
+        values = fmt.unpack_from(self.view, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def header(self) -> int:
+        """
+        Reads header and string table.
+
+        Raises:
+            DecodeError: If magic or version do not match.
+
+        Returns:
+            int: Number of records.
+        """
+        magic, version = self.unpack(_HEADER)
+        if magic != MAGIC:
+            raise DecodeError("Data is not in the workout tracker format.")
+        if version != VERSION:
+            raise DecodeError(f"Unsupported format version {version}.")
+        (count,) = self.unpack(_UINT32)
+        for _ in range(count):
+            (length,) = self.unpack(_UINT16)
+            start = self.offset
+            end = self.offset = start + length
+            if end > len(self.view):
+                raise DecodeError("Data is truncated.")
+            self.strings.append(str(self.view[start:end], "utf-8"))
+        return self.unpack(_UINT32)[0]
+
+    def measurement(self) -> Measurement:
+        """
+        Reads a distance or weight.
+
+        Returns:
+            Measurement: Decoded measurement.
+        """
+        code, value = self.unpack(_MEASUREMENT)
+        if code & _INTEGRAL:
+            value = int(value)
+        unit = UNITS_BY_CODE[code & ~_INTEGRAL]
+        if unit in DistanceUnit:
+            return Distance(value, unit)
+        return Weight(value, unit)
+
+    def distance(self) -> Distance:
+        """
+        Reads a distance.
+
+        Raises:
+            DecodeError: If the measurement is no distance.
+
+        Returns:
+            Distance: Decoded distance.
+        """
+        if not isinstance(distance := self.measurement(), Distance):
+            raise DecodeError(f"Expected a distance, got {distance!r}.")
+        return distance
+
+    def weight(self) -> Weight:
+        """
+        Reads a weight.
+
+        Raises:
+            DecodeError: If the measurement is no weight.
+
+        Returns:
+            Weight: Decoded weight.
+        """
+        if not isinstance(weight := self.measurement(), Weight):
+            raise DecodeError(f"Expected a weight, got {weight!r}.")
+        return weight
+
+    def timedelta(self) -> timedelta:
+        """
+        Reads a duration.
+
+        Returns:
+            timedelta: Decoded duration.
+        """
+        return timedelta(microseconds=self.unpack(_INT64)[0])
+
+    def exercise(self) -> Exercise:
+        """
+        Reads an exercise body including its sub exercises.
+
+        Returns:
+            Exercise: Decoded exercise.
+        """
+        (flags,) = self.unpack(_UINT8)
+        name = None
+        if not flags & _SUB_EXERCISES:
+            name = self.strings[self.unpack(_UINT32)[0]]
+        reps = None
+        if flags & _REPS:
+            reps = self.unpack(_FLOAT64 if flags & _FLOAT_REPS else _INT32)[0]
+        weight = self.weight() if flags & _WEIGHT else None
+        duration = self.timedelta() if flags & _DURATION else None
+        distance = self.distance() if flags & _DISTANCE else None
+        height = self.distance() if flags & _HEIGHT else None
+        sub_exercises = None
+        if flags & _SUB_EXERCISES:
+            (count,) = self.unpack(_UINT16)
+            sub_exercises = [self.exercise() for _ in range(count)]
+        return Exercise(
+            name=name,
+            reps=reps,
+            weight=weight,
+            duration=duration,
+            distance=distance,
+            height=height,
+            sub_exercises=sub_exercises,
+        )
+
+    def amrap(self) -> Amrap:
+        """
+        Reads an AMRAP body including nested buy-in and buy-out workouts.
+
+        Returns:
+            Amrap: Decoded workout.
+        """
+        microseconds, repeats, flags = self.unpack(_AMRAP)
+        rest = self.timedelta() if flags & _REST else None
+        (count,) = self.unpack(_UINT16)
+        exercises = [self.exercise() for _ in range(count)]
+        buy_in = self.record() if flags & _BUY_IN else None
+        buy_out = self.record() if flags & _BUY_OUT else None
+        return Amrap(
+            duration=timedelta(microseconds=microseconds),
+            exercises=exercises,
+            buy_in=buy_in,
+            repeats=repeats,
+            rest=rest,
+            buy_out=buy_out,
+        )
+
+    def record(self) -> Any:
+        """
+        Reads a tagged record.
+
+        Raises:
+            DecodeError: If the tag is unknown.
+
+        Returns:
+            Any: Decoded object.
+        """
+        (tag,) = self.unpack(_UINT8)
+        if tag == TAG_EXERCISE:
+            return self.exercise()
+        if tag == TAG_AMRAP:
+            return self.amrap()
+        if tag == TAG_MEASUREMENT:
+            return self.measurement()
+        if tag == TAG_TIMEDELTA:
+            return self.timedelta()
+        raise DecodeError(f"Unknown record tag {tag}.")
+
+
+def encode(objects: Iterable[Record]) -> bytes:
+    """
+    Encodes exercises, workouts, measurements and durations.
+
+    Args:
+        objects (Iterable[Record]): Objects to encode.
+
+    Returns:
+        bytes: Encoded data.
+    """
+    encoder = _Encoder()
+    for obj in objects:
+        encoder.record(obj)
+        encoder.count += 1
+    return encoder.to_bytes()
+
+
+def iter_decode(buffer: Any) -> Iterator[Record]:
+    """
+    Lazily decodes all records from a buffer.
+
+    The buffer is read through a memoryview, so bytes, bytearrays and
+    memory mapped files are decoded without copying them.
+
+    Args:
+        buffer (Any): Object supporting the buffer protocol.
+
+    Raises:
+        DecodeError: If the data is invalid or truncated.
+
+    Yields:
+        Record: Decoded objects in encoding order.
+    """
+    with memoryview(buffer) as view:
+        decoder = _Decoder(view)
+        try:
+            count = decoder.header()
+            for _ in range(count):
+                yield decoder.record()
+        except (struct.error, IndexError, UnicodeDecodeError) as error:
+            raise DecodeError(f"Invalid data: {error}") from error
+
+
+def decode(buffer: Any) -> list[Record]:
+    """
+    Decodes all records from a buffer.
+
+    Args:
+        buffer (Any): Object supporting the buffer protocol.
+
+    Returns:
+        list[Record]: Decoded objects in encoding order.
+    """
+    return list(iter_decode(buffer))
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import re
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any
+
+import pytimeparse
+
+DURATION_CACHE_SIZE = 1024
+
+_MINUTE_CLOCK_PATTERN = re.compile(r"\s*([0-9]{1,2}):([0-9]{2})\s*")
+_HOUR_CLOCK_PATTERN = re.compile(r"\s*([0-9]+):([0-9]{2}):([0-9]{2})\s*")
+_UNIT_PATTERN = re.compile(r"\s*([0-9]+)\s*([A-Za-z]+)\s*")
+
+UNIT_SECONDS = {
+    **dict.fromkeys(["s", "sec", "secs", "second", "seconds"], 1),
+    **dict.fromkeys(["m", "min", "mins", "minute", "minutes"], 60),
+    **dict.fromkeys(["h", "hr", "hrs", "hour", "hours"], 60 * 60),
+    **dict.fromkeys(["d", "dy", "dys", "day", "days"], 24 * 60 * 60),
+    **dict.fromkeys(["w", "wk", "wks", "week", "weeks"], 7 * 24 * 60 * 60),
+}
+
+
+def _parse_seconds(string: str) -> int | float | None:
+    """
+    Parses a duration string to seconds.
+
+    Handles the frequent "mm:ss", "hh:mm:ss" and "<n><unit>" forms directly
+    and falls back to pytimeparse for everything else.
+
+    Args:
+        string (str): Duration string.
+
+    Returns:
+        int | float | None: Seconds or None if string is no valid duration.
+    """
+    if match := _MINUTE_CLOCK_PATTERN.fullmatch(string):
+        minutes, seconds = match.groups()
+        return int(minutes) * 60 + int(seconds)
+    if match := _HOUR_CLOCK_PATTERN.fullmatch(string):
+        hours, minutes, seconds = match.groups()
+        return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+    if match := _UNIT_PATTERN.fullmatch(string):
+        value, unit = match.groups()
+        if (factor := UNIT_SECONDS.get(unit.lower())) is not None:
+            return int(value) * factor
+    return pytimeparse.parse(string)
+
+
+@lru_cache(maxsize=DURATION_CACHE_SIZE)
+def parse_duration(string: str) -> timedelta:
+    """
+    Parses a duration string like "20:00", "1 min" or "90s".
+
+    Results are kept in a bounded LRU cache, as exports usually contain only
+    a few hundred distinct durations.
+
+    Args:
+        string (str): Duration string.
+
+    Raises:
+        ValueError: If string is no valid duration or out of range.
+
+    Returns:
+        timedelta: Parsed duration.
+    """
+    if (seconds := _parse_seconds(string)) is None:
+        raise ValueError(f"The duration {string!r} cannot be parsed.")
+    try:
+        return timedelta(seconds=seconds)
+    except OverflowError as error:
+        raise ValueError(f"The duration {string!r} is too long.") from error
+
+
+def duration_cache_info() -> Any:
+    """
+    Gets hit and miss statistics of the duration cache.
+
+    Returns:
+        Any: Cache info named tuple of functools.lru_cache with hits,
+            misses, maxsize and currsize.
+    """
+    return parse_duration.cache_info()
+
+
+def clear_duration_cache() -> None:
+    """
+    Clears the duration cache and its statistics.
+    """
+    parse_duration.cache_clear()
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import string
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import FrozenInstanceError, dataclass, fields
 from datetime import timedelta
-from typing import Any, Self
-
-import pytimeparse
+from functools import cached_property
+from typing import Any, Literal, Self, cast, overload
+from weakref import WeakValueDictionary
 
+from workout_tracker.duration import parse_duration
 from workout_tracker.measurement import Distance, Weight
+from workout_tracker.movements import CATALOG, canonical_name
+
+DECODER_CACHE_SIZE = 256
 
 
 def to_str(obj: Any) -> str:
@@ -25,6 +29,105 @@ def to_str(obj: Any) -> str:
     return str(obj or "")
 
 
+def _exercise_name(
+    name: str,
+    reps: int | None,
+    duration: timedelta | None,
+    distance: Distance | None,
+    sub_exercises: Iterable[Exercise | FrozenExercise] | None,
+) -> str:
+    """
+    Checks the fields of an exercise and normalizes its name.
+
+    Args:
+        name (str): Name of the exercise, ignored for complexes.
+        reps (int | None): Number of repetitions.
+        duration (timedelta | None): Duration.
+        distance (Distance | None): Distance.
+        sub_exercises (Iterable[Exercise | FrozenExercise] | None): Sub
+            exercises of a complex.
+
+    Raises:
+        ValueError: Is raised if reps, duration and distance are all None
+            or if a sub exercise sets more than its reps.
+        TypeError: Is raised if an exercise other than a complex has no
+            string name.
+
+    Returns:
+        str: Normalized name, joined from the sub exercises for complexes.
+    """
+    if not (reps or duration or distance):
+        raise ValueError("Reps, duration or distance needs to be set.")
+
+    if sub_exercises is None:
+        if not isinstance(name, str):
+            raise TypeError("The name of an exercise needs to be a string.")
+        return canonical_name(name)
+    names = []
+    for ex in sub_exercises:
+        if (
+            ex.weight
+            or ex.distance
+            or ex.height
+            or ex.duration
+            or ex.sub_exercises
+        ):
+            raise ValueError(
+                "Weight, distance, height and duration can "
+                + "only be set for the entire complex."
+            )
+        names.append(str(ex))
+    return " + ".join(names)
+
+
+def _render_items(
+    exercise: Exercise | FrozenExercise,
+) -> tuple[tuple[str, Any], ...]:
+    """
+    Renders the non-empty fields of an exercise except the sub exercises.
+
+    Args:
+        exercise (Exercise | FrozenExercise): Exercise to render.
+
+    Returns:
+        tuple[tuple[str, Any], ...]: Keys and rendered values.
+    """
+    items = (
+        ("name", exercise.name),
+        ("reps", exercise.reps),
+        ("weight", to_str(exercise.weight)),
+        ("duration", to_str(exercise.duration)),
+        ("distance", to_str(exercise.distance)),
+        ("height", to_str(exercise.height)),
+    )
+    return tuple((key, value) for key, value in items if value)
+
+
+def _render_str(exercise: Exercise | FrozenExercise) -> str:
+    """
+    Renders an exercise as string.
+
+    Args:
+        exercise (Exercise | FrozenExercise): Exercise to render.
+
+    Returns:
+        str: Exercise as string.
+    """
+    return " ".join(
+        filter(
+            None,
+            [
+                to_str(exercise.duration),
+                to_str(exercise.reps),
+                to_str(exercise.distance),
+                exercise.name,
+                to_str(exercise.weight),
+                to_str(exercise.height),
+            ],
+        )
+    )
+
+
 @dataclass
 class Exercise:
     """
@@ -47,31 +150,76 @@ class Exercise:
             ValueError: Is raised if reps, duration and
                 distance attributes are all None.
         """
-        if not any([self.reps, self.duration, self.distance]):
-            raise ValueError("Reps, duration or distance needs to be set.")
-
-        if self.sub_exercises is not None:
-            self.name = " + ".join([str(ex) for ex in self.sub_exercises])
-            cond = (
-                any(ex.weight for ex in self.sub_exercises)
-                | any(ex.distance for ex in self.sub_exercises)
-                | any(ex.height for ex in self.sub_exercises)
-                | any(ex.duration for ex in self.sub_exercises)
-                | any(ex.sub_exercises for ex in self.sub_exercises)
-            )
-            if cond:
-                raise ValueError(
-                    "Weight, distance, height and duration can "
-                    + "only be set for the entire complex."
-                )
-        else:
-            self.name = string.capwords(self.name.strip())
+        self.name = _exercise_name(
+            self.name,
+            self.reps,
+            self.duration,
+            self.distance,
+            self.sub_exercises,
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute and invalidates the cached renderings when a field
+        is assigned.
 
+        Args:
+            name (str): Name of the attribute.
+            value (Any): Value of the attribute.
+        """
+        object.__setattr__(self, name, value)
+        if name in _EXERCISE_FIELDS:
+            instance_dict = self.__dict__
+            instance_dict.pop("_rendered_str", None)
+            instance_dict.pop("_rendered_items", None)
+
+    @overload
     @classmethod
-    def from_dict(cls, exercise_dict: dict) -> Self:
+    def from_dict(
+        cls, exercise_dict: dict, intern: Literal[False] = False
+    ) -> Self:
+        ...
+
+    @overload
+    @classmethod
+    def from_dict(
+        cls, exercise_dict: dict, intern: Literal[True]
+    ) -> FrozenExercise:
+        ...
+
+    @classmethod
+    def from_dict(
+        cls, exercise_dict: dict, intern: bool = False
+    ) -> Self | FrozenExercise:
         """
         Initializes an exercise instance from a given dictionary.
 
+        Dictionaries are decoded by a decoder specialized for their keys,
+        which is built on the first dictionary of each shape and touches
+        only the fields that are present.
+
+        Args:
+            exercise_dict (dict): Dictionary describing the exercise.
+            intern (bool): Whether to return a shared FrozenExercise
+                instead. Defaults to False.
+
+        Returns:
+            Self | FrozenExercise: Initialized Exercise instance or interned
+                FrozenExercise instance.
+        """
+        if intern:
+            return FrozenExercise.from_dict(exercise_dict)
+        if isinstance(exercise_dict, dict) and (
+            decoder := _shape_decoder(cls, exercise_dict)
+        ):
+            return decoder(exercise_dict)
+        return cls._from_any_dict(exercise_dict)
+
+    @classmethod
+    def _from_any_dict(cls, exercise_dict: dict) -> Self:
+        """
+        Initializes an exercise instance from a dictionary of any shape.
+
         Args:
             exercise_dict (dict): Dictionary describing the exercise.
 
@@ -84,8 +232,8 @@ class Exercise:
                 default_exercise_dict["weight"]
             )
         if default_exercise_dict["duration"] is not None:
-            default_exercise_dict["duration"] = timedelta(
-                seconds=pytimeparse.parse(default_exercise_dict["duration"])
+            default_exercise_dict["duration"] = parse_duration(
+                default_exercise_dict["duration"]
             )
         if default_exercise_dict["distance"] is not None:
             default_exercise_dict["distance"] = Distance.from_str(
@@ -111,6 +259,40 @@ class Exercise:
             sub_exercises=default_exercise_dict["sub_exercises"],
         )
 
+    @property
+    def movement_id(self) -> int | None:
+        """
+        ID of the movement in the CATALOG, so that exercises can be grouped
+        by integer keys regardless of the alias they were logged with. It is
+        looked up on every access, which the CATALOG caches, so that it
+        follows movements added to the CATALOG.
+
+        Returns:
+            int | None: ID of the movement or None for unknown movements
+                and complexes.
+        """
+        return None if self.sub_exercises else CATALOG.lookup(self.name)
+
+    @cached_property
+    def _rendered_items(self) -> tuple[tuple[str, Any], ...]:
+        """
+        Renders the non-empty fields except the sub exercises once.
+
+        Returns:
+            tuple[tuple[str, Any], ...]: Keys and rendered values.
+        """
+        return _render_items(self)
+
+    @cached_property
+    def _rendered_str(self) -> str:
+        """
+        Renders the exercise as string once.
+
+        Returns:
+            str: Exercise as string.
+        """
+        return _render_str(self)
+
     def to_dict(self) -> dict:
         """
         Parse exercise description to a dictionary.
@@ -118,22 +300,12 @@ class Exercise:
         Returns:
             dict: Dictionary containing the exercise description.
         """
-        sub_dicts = None
-        if self.sub_exercises is not None:
-            sub_dicts = [
+        return_dict = dict(self._rendered_items)
+        if self.sub_exercises:
+            return_dict["sub_exercises"] = [
                 sub_exercise.to_dict() for sub_exercise in self.sub_exercises
             ]
-
-        return_dict = {
-            "name": self.name,
-            "reps": self.reps,
-            "weight": to_str(self.weight),
-            "duration": to_str(self.duration),
-            "distance": to_str(self.distance),
-            "height": to_str(self.height),
-            "sub_exercises": sub_dicts,
-        }
-        return {key: value for key, value in return_dict.items() if value}
+        return return_dict
 
     def __str__(self) -> str:
         """
@@ -142,17 +314,377 @@ class Exercise:
         Returns:
             str: Exercise as string.
         """
+        return self._rendered_str
+
+    def freeze(self) -> FrozenExercise:
+        """
+        Gets the interned immutable version of the exercise.
+
+        Returns:
+            FrozenExercise: Shared exercise with the same content.
+        """
+        return FrozenExercise(
+            name=self.name,
+            reps=self.reps,
+            weight=self.weight,
+            duration=self.duration,
+            distance=self.distance,
+            height=self.height,
+            sub_exercises=self.sub_exercises,
+        )
+
+
+_EXERCISE_FIELDS_ORDERED = tuple(field.name for field in fields(Exercise))
+_EXERCISE_FIELDS = frozenset(_EXERCISE_FIELDS_ORDERED)
+
+
+def _decode_weight(value: str) -> Weight:
+    """Decodes a weight string."""
+    return Weight.from_str(value)
+
+
+def _decode_duration(value: str) -> timedelta:
+    """Decodes a duration string."""
+    return parse_duration(value)
+
+
+def _decode_distance(value: str) -> Distance:
+    """Decodes a distance or height string."""
+    return Distance.from_str(value)
+
+
+# Decoded fields in the order the generic path decodes them, so that the
+# first error raised for an invalid dictionary is the same. Functions are
+# looked up on every call, so instrumentation patches apply.
+_FIELD_DECODERS: tuple[tuple[str, Callable[[str], Any]], ...] = (
+    ("weight", _decode_weight),
+    ("duration", _decode_duration),
+    ("distance", _decode_distance),
+    ("height", _decode_distance),
+)
+
+_DECODERS: dict[tuple[type, tuple], Callable[[dict], Any]] = {}
+
+
+def _build_decoder(
+    cls: type[Exercise] | type[FrozenExercise], keys: tuple
+) -> Callable[[dict], Any]:
+    """
+    Builds a decoder for dictionaries with the given keys.
+
+    Args:
+        cls (type[Exercise] | type[FrozenExercise]): Class to initialize.
+        keys (tuple): Keys of the dictionaries.
+
+    Returns:
+        Callable[[dict], Any]: Decoder of a dictionary into an instance of
+            the class.
+    """
+    decoded = tuple(
+        (key, decode) for key, decode in _FIELD_DECODERS if key in keys
+    )
+    with_reps = "reps" in keys
+    with_sub_exercises = "sub_exercises" in keys
+    # Instances of classes with the generated __init__ are filled directly,
+    # skipping the cache invalidation of __setattr__ for every field.
+    direct = cls.__init__ is Exercise.__init__
+    defaults = dict.fromkeys(_EXERCISE_FIELDS_ORDERED)
+
+    def decoder(exercise_dict: dict) -> Any:
+        kwargs = defaults.copy()
+        for key, decode in decoded:
+            if (value := exercise_dict[key]) is not None:
+                kwargs[key] = decode(value)
+        if (
+            with_sub_exercises
+            and (sub_exercises := exercise_dict["sub_exercises"]) is not None
+        ):
+            kwargs["sub_exercises"] = [
+                cls.from_dict(sub_exercise) for sub_exercise in sub_exercises
+            ]
+        if with_reps:
+            kwargs["reps"] = exercise_dict["reps"]
+        kwargs["name"] = exercise_dict["name"]
+        if not direct:
+            return cls(**kwargs)
+        exercise = cast(Exercise, object.__new__(cls))
+        vars(exercise).update(kwargs)
+        exercise.__post_init__()
+        return exercise
+
+    return decoder
+
+
+def _shape_decoder(
+    cls: type[Exercise] | type[FrozenExercise], exercise_dict: dict
+) -> Callable[[dict], Any] | None:
+    """
+    Gets the decoder for the shape of a dictionary, building it on first
+    use.
+
+    Args:
+        cls (type[Exercise] | type[FrozenExercise]): Class to initialize.
+        exercise_dict (dict): Dictionary describing the exercise.
+
+    Returns:
+        Callable[[dict], Any] | None: Decoder or None if the cache is full.
+    """
+    shape = (cls, tuple(exercise_dict))
+    if (decoder := _DECODERS.get(shape)) is None:
+        if len(_DECODERS) >= DECODER_CACHE_SIZE:
+            return None
+        decoder = _DECODERS[shape] = _build_decoder(cls, shape[1])
+    return decoder
+
+
+def clear_decoder_cache() -> None:
+    """
+    Clears the decoders built for dictionary shapes.
+    """
+    _DECODERS.clear()
+
+
+class FrozenExercise:
+    """
+    Immutable exercise shared by all uses of the same content.
+
+    Instances are interned: creating an exercise with the content of a
+    living one returns that instance, so equality is identity. The intern
+    table only holds weak references, so exercises that are no longer used
+    anywhere are freed.
+    """
+
+    __slots__ = (*_EXERCISE_FIELDS_ORDERED, "__weakref__")
+
+    name: str
+    reps: int | None
+    weight: Weight | None
+    duration: timedelta | None
+    distance: Distance | None
+    height: Distance | None
+    sub_exercises: tuple[FrozenExercise, ...] | None
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __new__(
+        cls,
+        name: str,
+        reps: int | None = None,
+        weight: Weight | None = None,
+        duration: timedelta | None = None,
+        distance: Distance | None = None,
+        height: Distance | None = None,
+        sub_exercises: Iterable[Exercise | FrozenExercise] | None = None,
+    ) -> Self:
+        """
+        Gets the interned exercise with the given content.
 
-        return " ".join(
-            filter(
-                None,
-                [
-                    to_str(self.duration),
-                    to_str(self.reps),
-                    to_str(self.distance),
-                    self.name,
-                    to_str(self.weight),
-                    to_str(self.height),
-                ],
+        Args:
+            name (str): Name of the exercise, ignored for complexes.
+            reps (int | None): Number of repetitions. Defaults to None.
+            weight (Weight | None): Weight. Defaults to None.
+            duration (timedelta | None): Duration. Defaults to None.
+            distance (Distance | None): Distance. Defaults to None.
+            height (Distance | None): Height. Defaults to None.
+            sub_exercises (Iterable[Exercise | FrozenExercise] | None): Sub
+                exercises of a complex, frozen if needed. Defaults to None.
+
+        Returns:
+            Self: Shared exercise.
+        """
+        frozen_subs = None
+        if sub_exercises is not None:
+            frozen_subs = tuple(
+                sub if isinstance(sub, FrozenExercise) else sub.freeze()
+                for sub in sub_exercises
             )
+        name = _exercise_name(name, reps, duration, distance, frozen_subs)
+        values = (
+            name,
+            reps,
+            weight,
+            duration,
+            distance,
+            height,
+            frozen_subs,
+        )
+        key = (
+            cls,
+            name,
+            reps,
+            type(reps),
+            _content_key(weight),
+            duration,
+            _content_key(distance),
+            _content_key(height),
+            frozen_subs,
+        )
+        if (exercise := _INTERNED.get(key)) is None:
+            exercise = object.__new__(cls)
+            for field, value in zip(_EXERCISE_FIELDS_ORDERED, values):
+                object.__setattr__(exercise, field, value)
+            _INTERNED[key] = exercise
+        return cast(Self, exercise)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Prevents assignments.
+
+        Args:
+            name (str): Name of the attribute.
+            value (Any): Value of the attribute.
+
+        Raises:
+            FrozenInstanceError: Always.
+        """
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Prevents deletions.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Raises:
+            FrozenInstanceError: Always.
+        """
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self) -> tuple:
+        """
+        Supports pickling. Unpickled exercises are interned again.
+
+        Returns:
+            tuple: Class and field values.
+        """
+        return type(self), self._values()
+
+    def __repr__(self) -> str:
+        """
+        Represents the exercise for debugging.
+
+        Returns:
+            str: Class name and fields.
+        """
+        fields_repr = ", ".join(
+            f"{field}={value!r}"
+            for field, value in zip(_EXERCISE_FIELDS_ORDERED, self._values())
+        )
+        return f"{type(self).__name__}({fields_repr})"
+
+    def __str__(self) -> str:
+        """
+        Represents exercise as string.
+
+        Returns:
+            str: Exercise as string.
+        """
+        return _render_str(self)
+
+    @property
+    def movement_id(self) -> int | None:
+        """
+        ID of the movement in the CATALOG.
+
+        Returns:
+            int | None: ID of the movement or None for unknown movements
+                and complexes.
+        """
+        return None if self.sub_exercises else CATALOG.lookup(self.name)
+
+    def _values(self) -> tuple:
+        """
+        Gets the field values in field order.
+
+        Returns:
+            tuple: Field values.
+        """
+        return tuple(
+            getattr(self, field) for field in _EXERCISE_FIELDS_ORDERED
         )
+
+    @classmethod
+    def from_dict(cls, exercise_dict: dict) -> Self:
+        """
+        Gets the interned exercise described by a dictionary.
+
+        Args:
+            exercise_dict (dict): Dictionary describing the exercise.
+
+        Returns:
+            Self: Shared exercise.
+        """
+        exercise_dict = dict(exercise_dict)
+        decoder = _shape_decoder(cls, exercise_dict) or _build_decoder(
+            cls, tuple(exercise_dict)
+        )
+        return decoder(exercise_dict)
+
+    def to_dict(self) -> dict:
+        """
+        Parse exercise description to a dictionary.
+
+        Returns:
+            dict: Dictionary containing the exercise description.
+        """
+        return_dict = dict(_render_items(self))
+        if self.sub_exercises:
+            return_dict["sub_exercises"] = [
+                sub_exercise.to_dict() for sub_exercise in self.sub_exercises
+            ]
+        return return_dict
+
+    def thaw(self) -> Exercise:
+        """
+        Creates a mutable copy of the exercise.
+
+        Returns:
+            Exercise: Mutable exercise with the same content.
+        """
+        return Exercise(
+            name=self.name,
+            reps=self.reps,
+            weight=self.weight,
+            duration=self.duration,
+            distance=self.distance,
+            height=self.height,
+            sub_exercises=(
+                None
+                if self.sub_exercises is None
+                else [sub.thaw() for sub in self.sub_exercises]
+            ),
+        )
+
+
+_INTERNED: WeakValueDictionary[tuple, FrozenExercise] = WeakValueDictionary()
+
+# Mutable or interned exercise. Consumers reading exercises accept both,
+# also in isinstance checks.
+AnyExercise = Exercise | FrozenExercise
+
+
+def _content_key(measurement: Weight | Distance | None) -> tuple | None:
+    """
+    Gets a key of a measurement that differs for different renderings,
+    unlike the measurement itself, which equals its conversions.
+
+    Args:
+        measurement (Weight | Distance | None): Measurement or None.
+
+    Returns:
+        tuple | None: Value, type of the value and unit or None.
+    """
+    if measurement is None:
+        return None
+    value = measurement.value
+    return value, type(value), measurement.unit.name
+
+
+def interned_count() -> int:
+    """
+    Gets the number of living interned exercises.
+
+    Returns:
+        int: Number of interned exercises.
+    """
+    return len(_INTERNED)
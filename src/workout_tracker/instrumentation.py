@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from workout_tracker import (
+    exercise,
+    measurement,
+    measurement_array,
+    whiteboard,
+)
+
+# Every binding through which the hot paths are called. Module level
+# functions are also patched where other modules imported them by name.
+# parse_duration is only patched in its importers, as its own module keeps
+# using the LRU cache object for statistics and clearing.
+HOOKS: dict[str, tuple[tuple[Any, str], ...]] = {
+    "get_value_and_unit": (
+        (measurement, "get_value_and_unit"),
+        (measurement_array, "get_value_and_unit"),
+    ),
+    "measurement_from_str": ((measurement.Measurement, "from_str"),),
+    "parse_duration": (
+        (exercise, "parse_duration"),
+        (whiteboard, "parse_duration"),
+    ),
+    "exercise_from_dict": ((exercise.Exercise, "from_dict"),),
+    "exercise_to_dict": ((exercise.Exercise, "to_dict"),),
+}
+
+_METRICS = (
+    ("calls", "counter", "Calls of instrumented functions."),
+    ("errors", "counter", "Calls of instrumented functions that raised."),
+    ("seconds", "counter", "Cumulative time in instrumented functions."),
+)
+
+
+class HookStats:
+    """
+    Call statistics of a single hook.
+    """
+
+    __slots__ = ("calls", "errors", "nanoseconds")
+
+    def __init__(self) -> None:
+        """
+        Call statistics of a single hook.
+        """
+        self.calls = 0
+        self.errors = 0
+        self.nanoseconds = 0
+
+    def as_dict(self) -> dict[str, float]:
+        """
+        Represents the statistics as dictionary.
+
+        Returns:
+            dict[str, float]: Calls, errors and cumulative seconds.
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "seconds": self.nanoseconds / 1e9,
+        }
+
+
+_STATS: dict[str, HookStats] = {name: HookStats() for name in HOOKS}
+_ORIGINALS: list[tuple[Any, str, Any]] = []
+
+
+def _timed(name: str, function: Callable) -> Callable:
+    """
+    Wraps a function to count its calls, errors and time.
+
+    Args:
+        name (str): Name of the hook.
+        function (Callable): Function to wrap.
+
+    Returns:
+        Callable: Wrapped function.
+    """
+    stats = _STATS[name]
+    clock = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.calls += 1
+            stats.nanoseconds += clock() - start
+
+    return wrapper
+
+
+def enable(hooks: Iterable[str] | None = None) -> None:
+    """
+    Starts recording the given hooks by patching their functions. Until
+    then, and after disable, the hot paths run unpatched without any
+    overhead. Cumulative times of recursive calls, e.g. from_dict of sub
+    exercises, include the nested calls.
+
+    Args:
+        hooks (Iterable[str] | None): Names of the hooks to record, see
+            HOOKS. Defaults to all hooks.
+
+    Raises:
+        ValueError: If a hook is unknown.
+    """
+    names = list(HOOKS if hooks is None else hooks)
+    if unknown := set(names) - HOOKS.keys():
+        raise ValueError(f"Unknown hooks: {sorted(unknown)}")
+    disable()
+    for name in names:
+        for owner, attribute in HOOKS[name]:
+            original = vars(owner)[attribute]
+            if isinstance(original, classmethod):
+                patched: Any = classmethod(_timed(name, original.__func__))
+            else:
+                patched = _timed(name, original)
+            _ORIGINALS.append((owner, attribute, original))
+            setattr(owner, attribute, patched)
+
+
+def disable() -> None:
+    """
+    Stops recording and restores the original functions. Recorded
+    statistics are kept until reset.
+    """
+    while _ORIGINALS:
+        owner, attribute, original = _ORIGINALS.pop()
+        setattr(owner, attribute, original)
+
+
+def is_enabled() -> bool:
+    """
+    Checks whether any hook is being recorded.
+
+    Returns:
+        bool: Whether instrumentation is enabled.
+    """
+    return bool(_ORIGINALS)
+
+
+@contextmanager
+def instrumented(hooks: Iterable[str] | None = None) -> Iterator[None]:
+    """
+    Records the given hooks within a with block.
+
+    Args:
+        hooks (Iterable[str] | None): Names of the hooks to record.
+            Defaults to all hooks.
+
+    Yields:
+        None: Nothing.
+    """
+    enable(hooks)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def reset() -> None:
+    """
+    Clears the recorded statistics of all hooks.
+    """
+    for stats in _STATS.values():
+        stats.calls = stats.errors = stats.nanoseconds = 0
+
+
+def snapshot() -> dict[str, dict[str, float]]:
+    """
+    Gets the recorded statistics.
+
+    Returns:
+        dict[str, dict[str, float]]: Calls, errors and cumulative seconds
+            per hook.
+    """
+    return {name: stats.as_dict() for name, stats in _STATS.items()}
+
+
+def to_prometheus(prefix: str = "workout_tracker") -> str:
+    """
+    Renders the recorded statistics in the Prometheus text format.
+
+    Args:
+        prefix (str): Prefix of the metric names.
+            Defaults to "workout_tracker".
+
+    Returns:
+        str: Metrics in the Prometheus text format.
+    """
+    stats = snapshot()
+    lines = []
+    for key, kind, description in _METRICS:
+        metric = f"{prefix}_{key}_total"
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(
+            f'{metric}{{hook="{name}"}} {values[key]}'
+            for name, values in stats.items()
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable, Iterator
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import UnknownUnitError
+
+logger = logging.getLogger(__name__)
+
+RECORD_ERRORS = (ValueError, KeyError, TypeError, UnknownUnitError)
+
+WRITE_BUFFER_SIZE = 1 << 16
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+class RecordError(ValueError):
+    """Error raised when a single record of an export cannot be read."""
+
+    def __init__(self, line_number: int, line: str, error: Exception) -> None:
+        """
+        Error raised when a single record of an export cannot be read.
+
+        Args:
+            line_number (int): Line number of the record, starting at 1.
+            line (str): Raw text of the record.
+            error (Exception): Error raised while reading the record.
+        """
+        super().__init__(f"Invalid record in line {line_number}: {error!r}")
+        self.line_number = line_number
+        self.line = line
+        self.error = error
+
+    def __reduce__(self) -> tuple:
+        """
+        Supports pickling, e.g. to send errors between processes.
+
+        Returns:
+            tuple: Class and constructor arguments.
+        """
+        return type(self), (self.line_number, self.line, self.error)
+
+
+def log_record_error(error: RecordError) -> None:
+    """
+    Default error handler of the readers, which logs and skips invalid
+    records.
+
+    Args:
+        error (RecordError): Error of the invalid record.
+    """
+    logger.warning("Skipping %s", error)
+
+
+def parse_record(line_number: int, line: str) -> Exercise:
+    """
+    Parses a single JSON encoded exercise record.
+
+    Args:
+        line_number (int): Line number of the record, starting at 1.
+        line (str): JSON text of the record.
+
+    Raises:
+        RecordError: If the record is not a valid exercise.
+
+    Returns:
+        Exercise: Parsed exercise.
+    """
+    try:
+        record = json.loads(line)
+    except ValueError as error:
+        raise RecordError(line_number, line, error) from error
+    return build_record(line_number, record, line)
+
+
+def build_record(
+    line_number: int, record: object, line: str | None = None
+) -> Exercise:
+    """
+    Builds an exercise from a decoded JSON record.
+
+    Args:
+        line_number (int): Line or position of the record, starting at 1.
+        record (object): Decoded JSON record.
+        line (str | None): Raw text of the record for error reports.
+            Defaults to re-encoding the record.
+
+    Raises:
+        RecordError: If the record is not a valid exercise.
+
+    Returns:
+        Exercise: Parsed exercise.
+    """
+    try:
+        if not isinstance(record, dict):
+            raise TypeError("Record needs to be a JSON object.")
+        return Exercise.from_dict(exercise_dict=record)
+    except RECORD_ERRORS as error:
+        if line is None:
+            line = _ENCODER.encode(record)
+        raise RecordError(line_number, line, error) from error
+
+
+def iter_load(
+    path: str | os.PathLike,
+    on_error: Callable[[RecordError], None] | None = None,
+) -> Iterator[Exercise]:
+    """
+    Lazily loads exercises from a JSON Lines file.
+
+    Invalid records do not stop the stream. They are passed to on_error and
+    skipped. Empty lines are ignored.
+
+    Args:
+        path (str | os.PathLike): Path of the JSON Lines file.
+        on_error (Callable[[RecordError], None] | None): Called for every
+            invalid record. Defaults to logging a warning.
+
+    Yields:
+        Exercise: Exercise of each valid record.
+    """
+    handle_error = on_error or log_record_error
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield parse_record(line_number, line)
+            except RecordError as error:
+                handle_error(error)
+
+
+def dump_iter(
+    exercises: Iterable[Exercise],
+    path: str | os.PathLike,
+    append: bool = False,
+) -> int:
+    """
+    Writes exercises to a JSON Lines file, one record per line.
+
+    Exercises are consumed lazily and written through a large buffer, so
+    arbitrarily long streams can be written with constant memory.
+
+    Args:
+        exercises (Iterable[Exercise]): Exercises to write.
+        path (str | os.PathLike): Path of the JSON Lines file.
+        append (bool): Append to an existing file instead of replacing it.
+            Defaults to False.
+
+    Returns:
+        int: Number of written records.
+    """
+    count = 0
+    mode = "a" if append else "w"
+    with open(
+        path, mode, encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+    ) as file:
+        for exercise in exercises:
+            file.write(_ENCODER.encode(exercise.to_dict()))
+            file.write("\n")
+            count += 1
+    return count
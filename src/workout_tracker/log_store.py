@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date
+from pathlib import Path
+from typing import Any, Self
+
+from workout_tracker.codec import DecodeError, decode, encode
+from workout_tracker.exercise import AnyExercise, Exercise
+from workout_tracker.movements import canonical_name
+from workout_tracker.workout import Amrap, Workout
+
+_FRAME = struct.Struct("<II")
+_DATE = struct.Struct("<i")
+_ENTRY = struct.Struct("<IiQI")
+
+LogRecord = AnyExercise | Workout
+
+
+def record_names(record: LogRecord) -> set[str]:
+    """
+    Collects all exercise names within a workout or exercise.
+
+    Complexes contribute their own name as well as the names of their sub
+    exercises.
+
+    Args:
+        record (LogRecord): Exercise or workout.
+
+    Returns:
+        set[str]: Exercise names.
+    """
+    names: set[str] = set()
+    stack: list[Any] = [record]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, AnyExercise):
+            names.add(item.name)
+            stack.extend(item.sub_exercises or ())
+        elif isinstance(item, Amrap):
+            stack.extend(item.exercises)
+            stack.extend(filter(None, (item.buy_in, item.buy_out)))
+    return names
+
+
+class _Postings:
+    """
+    In memory index entries of a single exercise name.
+    """
+
+    __slots__ = ("dates", "offsets", "lengths", "ordered")
+
+    def __init__(self) -> None:
+        """
+        In memory index entries of a single exercise name, empty until
+        entries are added.
+        """
+        self.dates = array("i")
+        self.offsets = array("Q")
+        self.lengths = array("I")
+        self.ordered = True
+
+    def add(self, ordinal: int, offset: int, length: int) -> None:
+        """
+        Adds an index entry.
+
+        Args:
+            ordinal (int): Date ordinal of the workout.
+            offset (int): Offset of the frame in the data file.
+            length (int): Length of the frame.
+        """
+        if self.dates and self.dates[-1] > ordinal:
+            self.ordered = False
+        self.dates.append(ordinal)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+
+    def positions(self, first: int, last: int) -> Iterable[int]:
+        """
+        Finds the entries within a date range.
+
+        Args:
+            first (int): First date ordinal to include.
+            last (int): Last date ordinal to include.
+
+        Returns:
+            Iterable[int]: Positions of the matching entries.
+        """
+        if self.ordered:
+            return range(
+                bisect_left(self.dates, first),
+                bisect_right(self.dates, last),
+            )
+        return [
+            position
+            for position, ordinal in enumerate(self.dates)
+            if first <= ordinal <= last
+        ]
+
+
+class WorkoutLog:  # pylint: disable=too-many-instance-attributes
+    """
+    Append-only, memory mapped log of dated workouts with an index by
+    exercise name and date.
+
+    The data file is a sequence of frames. Each frame holds the payload
+    length and CRC32 (uint32 each), followed by the payload: the date as
+    proleptic Gregorian ordinal (int32) and the workout encoded with the
+    binary codec.
+
+    Two sidecar files make the log searchable without rescanning it:
+
+        <path>.names  exercise names, one per line, line number is the
+                      name id
+        <path>.idx    fixed width entries of name id (uint32), date
+                      ordinal (int32), frame offset (uint64) and frame
+                      length (uint32)
+
+    Frames are written before their index entries. When the log is opened,
+    the last indexed frame and all frames after it are indexed again, which
+    restores entries lost to a torn index write, and a torn frame at the
+    end of the data file is truncated, so a crash during an append never
+    corrupts the log.
+    """
+
+    def __init__(self, path: str | os.PathLike, sync: bool = False) -> None:
+        """
+        Opens or creates a workout log and recovers from interrupted
+        appends.
+
+        Args:
+            path (str | os.PathLike): Path of the data file.
+            sync (bool): Call fsync after every append. Defaults to False.
+        """
+        self.path = Path(path)
+        self.sync = sync
+        self._names_path = self.path.with_name(self.path.name + ".names")
+        self._index_path = self.path.with_name(self.path.name + ".idx")
+        self._open()
+
+    def _open(self) -> None:
+        """
+        Opens data and sidecar files and loads the index into memory.
+        """
+        # pylint: disable=consider-using-with
+        self._names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._postings: list[_Postings] = []
+        self._map: mmap.mmap | None = None
+
+        self._load_names()
+        self._data = open(self.path, "ab")
+        self._size = self._data.tell()
+        indexed_end = self._load_index()
+        self._index = open(self._index_path, "ab")
+        self._names_file = open(self._names_path, "a", encoding="utf-8")
+        self._recover(indexed_end)
+
+    def _load_names(self) -> None:
+        """
+        Loads the name sidecar and drops a torn last line. The line is cut
+        on bytes, as a torn write may split a multi-byte character.
+        """
+        if not self._names_path.exists():
+            return
+        data = self._names_path.read_bytes()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            with open(self._names_path, "r+b") as file:
+                file.truncate(end)
+        for name in data[:end].decode("utf-8").split("\n")[:-1]:
+            self._add_name(name)
+
+    def _add_name(self, name: str) -> int:
+        """
+        Registers a name in memory.
+
+        Args:
+            name (str): Exercise name.
+
+        Returns:
+            int: Id of the name.
+        """
+        name_id = self._name_ids[name] = len(self._names)
+        self._names.append(name)
+        self._postings.append(_Postings())
+        return name_id
+
+    def _load_index(self) -> int:
+        """
+        Loads the index sidecar and drops entries not backed by data.
+
+        Entries are written in frame order, so a torn write can only have
+        lost entries of the last indexed frame and the frames after it.
+        The entries of the last indexed frame are dropped as well, and the
+        frame is indexed again by _recover.
+
+        Returns:
+            int: Offset of the first frame to index again.
+        """
+        if not self._index_path.exists():
+            return 0
+        with open(self._index_path, "r+b") as file:
+            data = file.read()
+            valid = len(data) - len(data) % _ENTRY.size
+            entries = []
+            for entry in _ENTRY.iter_unpack(memoryview(data)[:valid]):
+                name_id, _, offset, length = entry
+                if offset + length > self._size or name_id >= len(self._names):
+                    break
+                entries.append(entry)
+            last_offset = entries[-1][2] if entries else 0
+            while entries and entries[-1][2] == last_offset:
+                entries.pop()
+            for name_id, ordinal, offset, length in entries:
+                self._postings[name_id].add(ordinal, offset, length)
+            valid = len(entries) * _ENTRY.size
+            if valid != len(data):
+                file.truncate(valid)
+        return last_offset
+
+    def _recover(self, indexed_end: int) -> None:
+        """
+        Indexes frames from the last indexed one on and truncates a torn
+        frame at the end of the data file.
+
+        Args:
+            indexed_end (int): Offset of the first frame to index.
+        """
+        with open(self.path, "rb") as file:
+            file.seek(indexed_end)
+            tail = file.read()
+        entries: list[tuple[str, int, int, int]] = []
+        end = indexed_end
+        for offset, payload in _iter_frames(tail):
+            ordinal, record = _decode_payload(payload)
+            length = _FRAME.size + len(payload)
+            entries.extend(
+                (name, ordinal, indexed_end + offset, length)
+                for name in record_names(record)
+            )
+            end = indexed_end + offset + length
+        if end != self._size:
+            self._data.truncate(end)
+            self._size = end
+        self._write_entries(entries)
+
+    def _write_entries(self, entries: list[tuple[str, int, int, int]]) -> None:
+        """
+        Persists new names and index entries.
+
+        Args:
+            entries (list[tuple[str, int, int, int]]): Name, date ordinal,
+                frame offset and frame length per entry.
+        """
+        if not entries:
+            return
+        index = bytearray()
+        for name, ordinal, offset, length in entries:
+            if (name_id := self._name_ids.get(name)) is None:
+                name_id = self._add_name(name)
+                self._names_file.write(name + "\n")
+            self._postings[name_id].add(ordinal, offset, length)
+            index += _ENTRY.pack(name_id, ordinal, offset, length)
+        self._names_file.flush()
+        self._index.write(index)
+        self._index.flush()
+        if self.sync:
+            os.fsync(self._names_file.fileno())
+            os.fsync(self._index.fileno())
+
+    def append(self, record: LogRecord, day: date) -> None:
+        """
+        Appends a single dated exercise or workout.
+
+        Args:
+            record (LogRecord): Exercise or workout to store.
+            day (date): Date of the workout.
+        """
+        self.extend([(day, record)])
+
+    def extend(self, records: Iterable[tuple[date, LogRecord]]) -> int:
+        """
+        Appends dated exercises or workouts with a single write.
+
+        Args:
+            records (Iterable[tuple[date, LogRecord]]): Dates and records.
+
+        Returns:
+            int: Number of appended records.
+        """
+        frames = bytearray()
+        entries: list[tuple[str, int, int, int]] = []
+        count = 0
+        for day, record in records:
+            ordinal = day.toordinal()
+            payload = _DATE.pack(ordinal) + encode([record])
+            length = _FRAME.size + len(payload)
+            entries.extend(
+                (name, ordinal, self._size + len(frames), length)
+                for name in record_names(record)
+            )
+            frames += _FRAME.pack(len(payload), zlib.crc32(payload))
+            frames += payload
+            count += 1
+        self._data.write(frames)
+        self._data.flush()
+        if self.sync:
+            os.fsync(self._data.fileno())
+        self._size += len(frames)
+        self._write_entries(entries)
+        return count
+
+    def _view(self) -> memoryview:
+        """
+        Maps the data file into memory, remapping it after appends.
+
+        Returns:
+            memoryview: View of the whole data file.
+        """
+        if self._size == 0:
+            return memoryview(b"")
+        if self._map is None or len(self._map) < self._size:
+            with open(self.path, "rb") as file:
+                self._map = mmap.mmap(
+                    file.fileno(), self._size, access=mmap.ACCESS_READ
+                )
+        return memoryview(self._map)
+
+    def names(self) -> list[str]:
+        """
+        Gets all indexed exercise names.
+
+        Returns:
+            list[str]: Exercise names.
+        """
+        return list(self._names)
+
+    def query(
+        self,
+        name: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> Iterator[tuple[date, LogRecord]]:
+        """
+        Finds all workouts containing an exercise within a date range.
+
+        Args:
+            name (str): Exercise name, normalized like Exercise names.
+            start (date | None): First date to include. Defaults to None.
+            end (date | None): Last date to include. Defaults to None.
+
+        Yields:
+            tuple[date, LogRecord]: Date and workout, in append order.
+        """
+        name_id = self._name_ids.get(canonical_name(name))
+        if name_id is None:
+            return
+        first = (
+            start.toordinal() if start is not None else date.min.toordinal()
+        )
+        last = end.toordinal() if end is not None else date.max.toordinal()
+        postings = self._postings[name_id]
+        view = self._view()
+        for position in postings.positions(first, last):
+            start_offset = postings.offsets[position] + _FRAME.size
+            end_offset = (
+                postings.offsets[position] + postings.lengths[position]
+            )
+            with view[start_offset:end_offset] as payload:
+                ordinal, record = _decode_payload(payload)
+            yield date.fromordinal(ordinal), record
+
+    def __iter__(self) -> Iterator[tuple[date, LogRecord]]:
+        """
+        Iterates over all records in append order.
+
+        Yields:
+            tuple[date, LogRecord]: Date and workout.
+        """
+        for _, payload in _iter_frames(self._view()):
+            ordinal, record = _decode_payload(payload)
+            yield date.fromordinal(ordinal), record
+
+    def compact(
+        self, keep: Callable[[date, LogRecord], bool] | None = None
+    ) -> None:
+        """
+        Rewrites the log ordered by date and rebuilds the index.
+
+        The new data file replaces the old one atomically. The sidecars are
+        removed before and rebuilt after the replacement, so an interrupted
+        compaction leaves a consistent log.
+
+        Args:
+            keep (Callable[[date, LogRecord], bool] | None): Only records for
+                which keep returns True are retained. Defaults to None.
+        """
+        view = self._view()
+        frames = []
+        for offset, payload in _iter_frames(view):
+            ordinal = _DATE.unpack_from(payload)[0]
+            if keep is not None:
+                _, record = _decode_payload(payload)
+                if not keep(date.fromordinal(ordinal), record):
+                    continue
+            frames.append((ordinal, offset, _FRAME.size + len(payload)))
+        frames.sort(key=lambda frame: frame[0])
+
+        temporary = self.path.with_name(self.path.name + ".compact")
+        with open(temporary, "wb") as file:
+            for _, offset, length in frames:
+                end = offset + length
+                file.write(view[offset:end])
+            file.flush()
+            os.fsync(file.fileno())
+        view.release()
+
+        self.close()
+        self._index_path.unlink(missing_ok=True)
+        self._names_path.unlink(missing_ok=True)
+        os.replace(temporary, self.path)
+        self._open()
+
+    def close(self) -> None:
+        """
+        Closes all files of the log.
+        """
+        self._data.close()
+        self._index.close()
+        self._names_file.close()
+        self._map = None
+
+    def __enter__(self) -> Self:
+        """
+        Uses the log as context manager.
+
+        Returns:
+            Self: The open log.
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Closes the log when leaving the context.
+
+        Args:
+            *args (object): Exception type, value and traceback, ignored.
+        """
+        self.close()
+
+
+def _iter_frames(buffer: Any) -> Iterator[tuple[int, memoryview]]:
+    """
+    Iterates over all complete frames with a valid checksum.
+
+    Stops at the first torn or corrupted frame.
+
+    Args:
+        buffer (Any): Object supporting the buffer protocol.
+
+    Yields:
+        tuple[int, memoryview]: Offset of the frame and its payload.
+    """
+    view = memoryview(buffer)
+    offset = 0
+    while offset + _FRAME.size <= len(view):
+        length, checksum = _FRAME.unpack_from(view, offset)
+        start = offset + _FRAME.size
+        end = start + length
+        if end > len(view):
+            return
+        payload = view[start:end]
+        if zlib.crc32(payload) != checksum:
+            return
+        yield offset, payload
+        offset = end
+
+
+def _decode_payload(payload: memoryview) -> tuple[int, LogRecord]:
+    """
+    Decodes the date ordinal and record of a frame payload.
+
+    Args:
+        payload (memoryview): Payload of a frame.
+
+    Raises:
+        DecodeError: If the payload does not hold exactly one record.
+
+    Returns:
+        tuple[int, LogRecord]: Date ordinal and record.
+    """
+    (ordinal,) = _DATE.unpack_from(payload)
+    start = _DATE.size
+    records = decode(payload[start:])
+    if len(records) != 1 or not isinstance(records[0], (Exercise, Workout)):
+        raise DecodeError("Frame needs to contain exactly one workout.")
+    return ordinal, records[0]
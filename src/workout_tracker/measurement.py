@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Self
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Self, TypeVar
 
 from workout_tracker.better_enum import BetterStrEnum
 
+_MEASUREMENT_PATTERN = re.compile(r"\s*(\d+\.?\d*)\s*([^\d\W]+)\s*")
+_TOKEN_PATTERN = re.compile(r"(\d+\.?\d*)|([^\d\W]+)")
+
 
 def get_value_and_unit(
     string: str,
@@ -14,6 +19,8 @@ def get_value_and_unit(
     """
     Extracts the value and unit from a string.
     Expects only one number and one word in the given input string.
+    Units may be given by any of their aliases (e.g. "kgs" or "meters")
+    and are resolved to the matching unit enum member.
 
     Args:
         string (str): String from which to extract value and unit.
@@ -26,16 +33,42 @@ def get_value_and_unit(
     Returns:
         tuple[float, DistanceUnit | WeightUnit]: Value and unit
     """
-    if len(values := re.findall(r"\d+\.?\d*", string)) != 1:
-        raise ValueError("Input text needs to contain exactly one number!")
-    if len(units := re.findall(r"[^\d\W]+", string)) != 1:
-        raise ValueError("Input text needs to contain exactly one unit!")
+    if match := _MEASUREMENT_PATTERN.fullmatch(string):
+        value, unit = match.groups()
+    else:
+        n_values = n_units = 0
+        for number, word in _TOKEN_PATTERN.findall(string):
+            if number:
+                n_values += 1
+                value = number
+            else:
+                n_units += 1
+                unit = word
+        if n_values != 1:
+            raise ValueError("Input text needs to contain exactly one number!")
+        if n_units != 1:
+            raise ValueError("Input text needs to contain exactly one unit!")
+
+    return float(value), lookup_unit(unit)
+
+
+def lookup_unit(unit: str) -> DistanceUnit | WeightUnit:
+    """
+    Resolves a unit name or alias to its unit enum member.
 
-    unit = units[0]
-    if (unit not in DistanceUnit) and (unit not in WeightUnit):
-        raise UnknownUnitError(f"The input unit of {unit} is unknown.")
+    Args:
+        unit (str): Unit name or alias, e.g. "kg", "kgs" or "kilograms".
+            Units are case-sensitive.
 
-    return float(values[0]), unit
+    Raises:
+        UnknownUnitError: If unit is unknown.
+
+    Returns:
+        DistanceUnit | WeightUnit: Unit enum member.
+    """
+    if (member := UNIT_ALIASES.get(unit)) is None:
+        raise UnknownUnitError(f"The input unit of {unit} is unknown.")
+    return member
 
 
 class UnknownUnitError(Exception):
@@ -80,7 +113,44 @@ class WeightUnit(BetterStrEnum):
     POOD = "pood"
 
 
-@dataclass
+UNIT_ALIASES: dict[str, DistanceUnit | WeightUnit] = {
+    **{unit.value: unit for unit in DistanceUnit},
+    **{unit.value: unit for unit in WeightUnit},
+    "kms": DistanceUnit.KM,
+    "kilometer": DistanceUnit.KM,
+    "kilometers": DistanceUnit.KM,
+    "kilometre": DistanceUnit.KM,
+    "kilometres": DistanceUnit.KM,
+    "meter": DistanceUnit.M,
+    "meters": DistanceUnit.M,
+    "metre": DistanceUnit.M,
+    "metres": DistanceUnit.M,
+    "centimeter": DistanceUnit.CM,
+    "centimeters": DistanceUnit.CM,
+    "centimetre": DistanceUnit.CM,
+    "centimetres": DistanceUnit.CM,
+    "mi": DistanceUnit.MILE,
+    "miles": DistanceUnit.MILE,
+    "yd": DistanceUnit.YARD,
+    "yds": DistanceUnit.YARD,
+    "yards": DistanceUnit.YARD,
+    "foot": DistanceUnit.FT,
+    "feet": DistanceUnit.FT,
+    "inch": DistanceUnit.INCH,
+    "inches": DistanceUnit.INCH,
+    "kgs": WeightUnit.KG,
+    "kilo": WeightUnit.KG,
+    "kilos": WeightUnit.KG,
+    "kilogram": WeightUnit.KG,
+    "kilograms": WeightUnit.KG,
+    "lbs": WeightUnit.LB,
+    "pound": WeightUnit.LB,
+    "pounds": WeightUnit.LB,
+    "poods": WeightUnit.POOD,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Unit:
     """
     Handles a measurement unit
@@ -114,16 +184,142 @@ class Unit:
         return value * self.in_si
 
 
+UNIT_REGISTRY: dict[str, Unit] = {
+    name: Unit(name=name, in_si=in_si)
+    for name, in_si in UNIT_CONVERSIONS.items()
+}
+
+UNITS_BY_CODE: tuple[DistanceUnit | WeightUnit, ...] = (
+    *DistanceUnit,
+    *WeightUnit,
+)
+UNIT_CODES: dict[str, int] = {
+    unit.value: code for code, unit in enumerate(UNITS_BY_CODE)
+}
+
+# Number of decimals of the SI value that count for equality, hashing and
+# ordering. Absorbs float noise of unit conversions, e.g. 1 ft vs 12 in.
+SI_DIGITS = 9
+
+# Factor from every unit to every other unit of the same family, e.g.
+# CONVERSION_MATRIX["lb"]["pood"]. Units of different families are absent.
+CONVERSION_MATRIX: dict[str, dict[str, float]] = {
+    source.value: {
+        target.value: UNIT_CONVERSIONS[source] / UNIT_CONVERSIONS[target]
+        for target in family
+    }
+    for family in (DistanceUnit, WeightUnit)
+    for source in family
+}
+
+
+def conversion_factor(source: str, target: str) -> float:
+    """
+    Gets the factor converting values from one unit to another.
+
+    Args:
+        source (str): Unit or alias to convert from.
+        target (str): Unit or alias to convert to.
+
+    Raises:
+        UnknownUnitError: If a unit is unknown or the units belong to
+            different families.
+
+    Returns:
+        float: Conversion factor.
+    """
+    factors = (
+        CONVERSION_MATRIX.get(source) or CONVERSION_MATRIX[lookup_unit(source)]
+    )
+    if (factor := factors.get(target)) is None:
+        factor = factors.get(lookup_unit(target))
+    if factor is None:
+        raise UnknownUnitError(f"Cannot convert {source} to {target}.")
+    return factor
+
+
+def round_half_up(value: float, ndigits: int) -> float:
+    """
+    Rounds half away from zero on the shortest decimal representation of
+    the value, so that e.g. 2.675 rounds to 2.68 on every platform, unlike
+    the binary round half to even of round().
+
+    Args:
+        value (float): Value to round.
+        ndigits (int): Number of decimals.
+
+    Returns:
+        float: Rounded value.
+    """
+    exponent = Decimal(1).scaleb(-ndigits)
+    return float(Decimal(repr(value)).quantize(exponent, ROUND_HALF_UP))
+
+
+def convert_values(
+    values: Iterable[float],
+    source: str,
+    target: str,
+    ndigits: int | None = None,
+) -> list[float]:
+    """
+    Converts many values of the same unit with a single factor lookup.
+
+    Args:
+        values (Iterable[float]): Values in the source unit.
+        source (str): Unit or alias to convert from.
+        target (str): Unit or alias to convert to.
+        ndigits (int | None): Number of decimals to round half up to.
+            Defaults to no rounding.
+
+    Returns:
+        list[float]: Values in the target unit.
+    """
+    factor = conversion_factor(source, target)
+    converted = [value * factor for value in values]
+    if ndigits is None:
+        return converted
+    return [round_half_up(value, ndigits) for value in converted]
+
+
+M = TypeVar("M", bound="Measurement")
+
+
+def convert_all(
+    measurements: Iterable[M], unit: str, ndigits: int | None = None
+) -> list[M]:
+    """
+    Converts measurements of mixed units to the same unit, e.g. to render
+    a leaderboard in the units of the viewer.
+
+    Args:
+        measurements (Iterable[M]): Measurements of the same family.
+        unit (str): Unit or alias to convert to.
+        ndigits (int | None): Number of decimals to round half up to.
+            Defaults to no rounding.
+
+    Returns:
+        list[M]: Converted measurements.
+    """
+    return [measurement.to(unit, ndigits) for measurement in measurements]
+
+
 class Measurement(ABC):
     """
     Class to handle distance measurement together with its unit.
+
+    Measurements are immutable. The unit is shared through the
+    UNIT_REGISTRY and the value in SI units is computed once at
+    construction.
     """
 
+    __slots__ = ("_value", "_unit", "_si_value")
+    si_unit: str = "Undefined"
+
     @abstractmethod
     def __init__(self, value: float, unit: DistanceUnit | WeightUnit) -> None:
-        self.value = value
-        self.si_unit = "Undefined"
-        self.unit = Unit(name=str(unit), in_si=UNIT_CONVERSIONS[unit])
+        self._value = value
+        self._unit = UNIT_REGISTRY[unit]
+        self._si_value = value * self._unit.in_si
 
     def __str__(self) -> str:
         """
@@ -132,12 +328,72 @@ class Measurement(ABC):
         Returns:
             str: Measurement and unit
         """
-        return str(self.value) + " " + self.unit.name
+        return str(self._value) + " " + self._unit.name
+
+    def __repr__(self) -> str:
+        """
+        Represents measurement for debugging.
+
+        Returns:
+            str: Class name, value and unit.
+        """
+        return f"{type(self).__name__}({self._value!r}, {self._unit.name!r})"
+
+    @classmethod
+    def _from_value(cls, value: float, unit: Unit) -> Self:
+        """
+        Creates a measurement without validation.
+
+        Args:
+            value (float): Value in the given unit.
+            unit (Unit): Shared unit instance of the result.
+
+        Returns:
+            Self: Measurement in the given unit.
+        """
+        measurement = object.__new__(cls)
+        measurement._value = value
+        measurement._unit = unit
+        measurement._si_value = value * unit.in_si
+        return measurement
+
+    def to(self, unit: str, ndigits: int | None = None) -> Self:
+        """
+        Converts the measurement to another unit of its family.
+
+        Args:
+            unit (str): Unit or alias to convert to.
+            ndigits (int | None): Number of decimals to round half up to.
+                Defaults to no rounding.
+
+        Returns:
+            Self: Measurement in the given unit.
+        """
+        if (factor := CONVERSION_MATRIX[self._unit.name].get(unit)) is None:
+            unit = lookup_unit(unit)
+            factor = conversion_factor(self._unit.name, unit)
+        if unit == self._unit.name and ndigits is None:
+            return self
+        value = self._value * factor
+        if ndigits is not None:
+            value = round_half_up(value, ndigits)
+        return self._from_value(value, UNIT_REGISTRY[unit])
+
+    def __reduce__(self) -> tuple:
+        """
+        Supports pickling, e.g. to send measurements between processes.
+        Unpickled measurements share the unit of the UNIT_REGISTRY.
+
+        Returns:
+            tuple: Class and constructor arguments.
+        """
+        return type(self), (self._value, self._unit.name)
 
     def __eq__(self, other: object) -> bool:
         """
         Check equality between instances. Returns True if object is of the
-        same class and represents the same value in SI units.
+        same class and represents the same value in SI units up to
+        SI_DIGITS decimals.
 
         Args:
             other (object): Object to compare self to.
@@ -147,10 +403,185 @@ class Measurement(ABC):
         """
         if not isinstance(other, self.__class__):
             return NotImplemented
+        return self.si_key == other.si_key
+
+    def __hash__(self) -> int:
+        """
+        Hashes the measurement consistently with equality.
+
+        Returns:
+            int: Hash of the class and the rounded SI value.
+        """
+        return hash((self.si_unit, self.si_key))
+
+    def __lt__(self, other: object) -> bool:
+        """
+        Orders measurements of the same class by their SI value.
+
+        Args:
+            other (object): Object to compare self to.
+
+        Returns:
+            bool: Whether self is smaller.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.si_key < other.si_key
 
-        same_value = self.si_value == other.si_value
-        same_si = self.si_unit == other.si_unit
-        return same_si and same_value
+    def __le__(self, other: object) -> bool:
+        """
+        Orders measurements of the same class by their SI value.
+
+        Args:
+            other (object): Object to compare self to.
+
+        Returns:
+            bool: Whether self is smaller or equal.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.si_key <= other.si_key
+
+    def __gt__(self, other: object) -> bool:
+        """
+        Orders measurements of the same class by their SI value.
+
+        Args:
+            other (object): Object to compare self to.
+
+        Returns:
+            bool: Whether self is larger.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.si_key > other.si_key
+
+    def __ge__(self, other: object) -> bool:
+        """
+        Orders measurements of the same class by their SI value.
+
+        Args:
+            other (object): Object to compare self to.
+
+        Returns:
+            bool: Whether self is larger or equal.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.si_key >= other.si_key
+
+    def _value_in_unit(self, other: Measurement) -> float:
+        """
+        Gets the value of a measurement of the same family in the unit of
+        self, without converting values already in the same unit.
+
+        Args:
+            other (Measurement): Measurement of the same family.
+
+        Returns:
+            float: Value of other in the unit of self.
+        """
+        if other.unit is self._unit:
+            return other.value
+        factors = CONVERSION_MATRIX[other.unit.name]
+        return other.value * factors[self._unit.name]
+
+    def __add__(self, other: object) -> Self:
+        """
+        Adds a measurement of the same class in the unit of self.
+
+        Args:
+            other (object): Measurement to add.
+
+        Returns:
+            Self: Sum in the unit of self.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        value = self._value + self._value_in_unit(other)
+        return self._from_value(value, self._unit)
+
+    def __radd__(self, other: object) -> Self:
+        """
+        Supports sum() over measurements, which starts at 0.
+
+        Args:
+            other (object): Zero.
+
+        Returns:
+            Self: Self unchanged.
+        """
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: object) -> Self:
+        """
+        Subtracts a measurement of the same class in the unit of self.
+
+        Args:
+            other (object): Measurement to subtract.
+
+        Returns:
+            Self: Difference in the unit of self.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        value = self._value - self._value_in_unit(other)
+        return self._from_value(value, self._unit)
+
+    def __mul__(self, factor: object) -> Self:
+        """
+        Scales the measurement by a number.
+
+        Args:
+            factor (object): Scaling factor.
+
+        Returns:
+            Self: Scaled measurement in the unit of self.
+        """
+        if not isinstance(factor, (int, float)):
+            return NotImplemented
+        return self._from_value(self._value * factor, self._unit)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: object) -> Self | float:
+        """
+        Divides by a number or by a measurement of the same class.
+
+        Args:
+            other (object): Divisor.
+
+        Returns:
+            Self | float: Scaled measurement in the unit of self or the
+                ratio of both measurements.
+        """
+        if isinstance(other, self.__class__):
+            return self._value / self._value_in_unit(other)
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return self._from_value(self._value / other, self._unit)
+
+    @property
+    def value(self) -> float:
+        """
+        Get value of measurement in its unit.
+
+        Returns:
+            float: Measurement value.
+        """
+        return self._value
+
+    @property
+    def unit(self) -> Unit:
+        """
+        Get unit of measurement.
+
+        Returns:
+            Unit: Shared unit instance from the UNIT_REGISTRY.
+        """
+        return self._unit
 
     @property
     def si_value(self) -> float:
@@ -160,7 +591,19 @@ class Measurement(ABC):
         Returns:
             float: Measurement value in SI units.
         """
-        return self.unit.to_si(self.value)
+        return self._si_value
+
+    @property
+    def si_key(self) -> float:
+        """
+        Get the value in SI units rounded to SI_DIGITS decimals. Used for
+        equality, hashing and ordering, and as key for sorting or
+        bisecting.
+
+        Returns:
+            float: Rounded measurement value in SI units.
+        """
+        return round(self._si_value, SI_DIGITS)
 
     @classmethod
     def from_str(cls, string: str) -> Self:
@@ -183,6 +626,9 @@ class Distance(Measurement):
     Class to handle distance measurement together with its unit.
     """
 
+    __slots__ = ()
+    si_unit = DistanceUnit.M
+
     def __init__(self, value: float, unit: DistanceUnit) -> None:
         """
         Class to handle distance measurement together with its unit.
@@ -197,7 +643,6 @@ class Distance(Measurement):
         if unit not in DistanceUnit:
             raise UnknownUnitError(f"The input unit of {unit} is unknown.")
         super().__init__(value=value, unit=unit)
-        self.si_unit = DistanceUnit.M
 
 
 class Weight(Measurement):
@@ -205,6 +650,9 @@ class Weight(Measurement):
     Class to handle weight measurement together with its unit.
     """
 
+    __slots__ = ()
+    si_unit = WeightUnit.KG
+
     def __init__(self, value: float, unit: WeightUnit) -> None:
         """
         Class to handle weight measurement together with its unit.
@@ -219,4 +667,3 @@ class Weight(Measurement):
         if unit not in WeightUnit:
             raise UnknownUnitError(f"The input unit of {unit} is unknown.")
         super().__init__(value=value, unit=unit)
-        self.si_unit = WeightUnit.KG
@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+import itertools
+import math
+import operator
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from typing import Generic, Self, TypeVar
+
+from workout_tracker.measurement import (
+    SI_DIGITS,
+    UNIT_CODES,
+    UNIT_CONVERSIONS,
+    UNITS_BY_CODE,
+    Distance,
+    DistanceUnit,
+    Measurement,
+    UnknownUnitError,
+    Weight,
+    WeightUnit,
+    get_value_and_unit,
+    round_half_up,
+)
+
+M = TypeVar("M", bound=Measurement)
+
+UNIT_FAMILIES: dict[type[Measurement], type[DistanceUnit | WeightUnit]] = {
+    Distance: DistanceUnit,
+    Weight: WeightUnit,
+}
+
+_SI_FACTORS = array("d", (UNIT_CONVERSIONS[unit] for unit in UNITS_BY_CODE))
+
+# Conversion factors from each unit code into each target unit.
+_UNIT_FACTORS = {
+    target: array("d", (factor / in_si for factor in _SI_FACTORS))
+    for target, in_si in UNIT_CONVERSIONS.items()
+}
+
+
+class MeasurementArray(Generic[M]):
+    """
+    Columnar container for measurements of a single kind.
+
+    Values are stored in a float array and units as one byte codes from
+    UNIT_CODES, so large amounts of measurements can be converted and
+    aggregated without creating one Python object per measurement.
+    """
+
+    __slots__ = ("measurement_cls", "values", "codes")
+
+    def __init__(
+        self,
+        measurement_cls: type[M],
+        values: Iterable[float] = (),
+        units: Iterable[str] = (),
+    ) -> None:
+        """
+        Columnar container for measurements of a single kind.
+
+        Args:
+            measurement_cls (type[M]): Distance or Weight.
+            values (Iterable[float]): Values of the measurements.
+                Defaults to ().
+            units (Iterable[str]): Units of the measurements.
+                Defaults to ().
+
+        Raises:
+            TypeError: If the measurement class is not supported.
+            ValueError: If values and units differ in length.
+        """
+        if measurement_cls not in UNIT_FAMILIES:
+            raise TypeError(
+                f"Unsupported measurement class {measurement_cls.__name__}."
+            )
+        self.measurement_cls = measurement_cls
+        self.values = array("d", values)
+        self.codes = array("B", map(self._unit_code, units))
+        if len(self.values) != len(self.codes):
+            raise ValueError("Values and units need to have the same length.")
+
+    @classmethod
+    def from_measurements(
+        cls, measurement_cls: type[M], measurements: Iterable[M]
+    ) -> Self:
+        """
+        Generates an array from measurement instances.
+
+        Args:
+            measurement_cls (type[M]): Distance or Weight.
+            measurements (Iterable[M]): Measurements to store.
+
+        Returns:
+            Self: Initialized array.
+        """
+        result = cls(measurement_cls)
+        for measurement in measurements:
+            result.append(measurement.value, measurement.unit.name)
+        return result
+
+    @classmethod
+    def from_strings(
+        cls, measurement_cls: type[M], strings: Iterable[str]
+    ) -> Self:
+        """
+        Parses measurement strings directly into an array.
+
+        Args:
+            measurement_cls (type[M]): Distance or Weight.
+            strings (Iterable[str]): Strings consisting of a number and a
+                word denoting the value and unit of each measurement.
+
+        Returns:
+            Self: Initialized array.
+        """
+        result = cls(measurement_cls)
+        for string in strings:
+            result.append(*get_value_and_unit(string=string))
+        return result
+
+    def _unit_code(self, unit: str) -> int:
+        """
+        Looks up the code of a unit belonging to the measurement class.
+
+        Args:
+            unit (str): Unit of a measurement.
+
+        Raises:
+            UnknownUnitError: If unit is unknown for the measurement class.
+
+        Returns:
+            int: Code of the unit.
+        """
+        if unit not in UNIT_FAMILIES[self.measurement_cls]:
+            raise UnknownUnitError(f"The input unit of {unit} is unknown.")
+        return UNIT_CODES[unit]
+
+    def append(self, value: float, unit: str) -> None:
+        """
+        Appends a single measurement.
+
+        Args:
+            value (float): Value of the measurement.
+            unit (str): Unit of the measurement.
+        """
+        code = self._unit_code(unit)
+        self.values.append(value)
+        self.codes.append(code)
+
+    def __len__(self) -> int:
+        """
+        Number of measurements in the array.
+
+        Returns:
+            int: Number of measurements.
+        """
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> M:
+        """
+        Gets a single measurement as instance.
+
+        Args:
+            index (int): Position of the measurement.
+
+        Returns:
+            M: Measurement instance.
+        """
+        return self.measurement_cls(
+            self.values[index], UNITS_BY_CODE[self.codes[index]]
+        )
+
+    def __iter__(self) -> Iterator[M]:
+        """
+        Iterates over all measurements as instances.
+
+        Yields:
+            M: Measurement instance.
+        """
+        for value, code in zip(self.values, self.codes):
+            yield self.measurement_cls(value, UNITS_BY_CODE[code])
+
+    def _factors(self, unit: str | None) -> array:
+        """
+        Gets the conversion factor for each unit code into the given unit.
+
+        Args:
+            unit (str | None): Target unit or None for SI units.
+
+        Returns:
+            array: Conversion factors indexed by unit code.
+        """
+        if unit is None:
+            return _SI_FACTORS
+        self._unit_code(unit)
+        return _UNIT_FACTORS[unit]
+
+    def si_values(self) -> array:
+        """
+        Converts all values to SI units.
+
+        Returns:
+            array: Values in SI units.
+        """
+        return self.to_unit(None)
+
+    def si_keys(self) -> array:
+        """
+        Converts all values to SI units rounded to SI_DIGITS decimals, the
+        same keys measurements use for equality and ordering.
+
+        Returns:
+            array: Rounded values in SI units.
+        """
+        digits = itertools.repeat(SI_DIGITS)
+        return array("d", map(round, self.si_values(), digits))
+
+    def to_unit(self, unit: str | None, ndigits: int | None = None) -> array:
+        """
+        Converts all values to the given unit.
+
+        Args:
+            unit (str | None): Target unit or None for SI units.
+            ndigits (int | None): Number of decimals to round half up to.
+                Defaults to no rounding.
+
+        Returns:
+            array: Values in the target unit.
+        """
+        factors = self._factors(unit)
+        values = map(
+            operator.mul, self.values, map(factors.__getitem__, self.codes)
+        )
+        if ndigits is not None:
+            values = map(round_half_up, values, itertools.repeat(ndigits))
+        return array("d", values)
+
+    def _result(self, value: float, unit: str | None) -> M:
+        """
+        Wraps an aggregated value as measurement instance.
+
+        Args:
+            value (float): Aggregated value.
+            unit (str | None): Unit of the value or None for SI units.
+
+        Returns:
+            M: Measurement instance.
+        """
+        code = self._unit_code(unit or self.measurement_cls.si_unit)
+        return self.measurement_cls(value, UNITS_BY_CODE[code])
+
+    def _non_empty_values(self, unit: str | None) -> array:
+        """
+        Converts all values to the given unit and checks for emptiness.
+
+        Args:
+            unit (str | None): Target unit or None for SI units.
+
+        Raises:
+            ValueError: If the array is empty.
+
+        Returns:
+            array: Values in the target unit.
+        """
+        if not self.values:
+            raise ValueError("Operation is not defined for an empty array.")
+        return self.to_unit(unit)
+
+    def sum(
+        self,
+        unit: str | None = None,
+        weights: Iterable[float] | None = None,
+    ) -> M:
+        """
+        Sums all measurements, e.g. to compute tonnage when weighted by reps.
+
+        Args:
+            unit (str | None): Unit of the result. Defaults to SI units.
+            weights (Iterable[float] | None): Optional factor per
+                measurement. Defaults to None.
+
+        Raises:
+            ValueError: If weights and measurements differ in length.
+
+        Returns:
+            M: Sum of all measurements.
+        """
+        values: Iterable[float] = self.to_unit(unit)
+        if weights is not None:
+            factors = list(weights)
+            if len(factors) != len(self):
+                raise ValueError(
+                    "Weights and measurements need to have the same length."
+                )
+            values = map(operator.mul, values, factors)
+        return self._result(math.fsum(values), unit)
+
+    def mean(self, unit: str | None = None) -> M:
+        """
+        Computes the mean of all measurements.
+
+        Args:
+            unit (str | None): Unit of the result. Defaults to SI units.
+
+        Returns:
+            M: Mean of all measurements.
+        """
+        values = self._non_empty_values(unit)
+        return self._result(math.fsum(values) / len(values), unit)
+
+    def min(self, unit: str | None = None) -> M:
+        """
+        Gets the smallest measurement.
+
+        Args:
+            unit (str | None): Unit of the result. Defaults to SI units.
+
+        Returns:
+            M: Smallest measurement.
+        """
+        return self._result(min(self._non_empty_values(unit)), unit)
+
+    def max(self, unit: str | None = None) -> M:
+        """
+        Gets the largest measurement.
+
+        Args:
+            unit (str | None): Unit of the result. Defaults to SI units.
+
+        Returns:
+            M: Largest measurement.
+        """
+        return self._result(max(self._non_empty_values(unit)), unit)
+
+    def _compare(
+        self, other: object, compare: Callable[[float, float], bool]
+    ) -> array:
+        """
+        Compares all measurements element-wise by their SI keys.
+
+        Args:
+            other (object): Measurement or array of the same kind and length.
+            compare (Callable[[float, float], bool]): Comparison operator.
+
+        Raises:
+            ValueError: If the arrays differ in length.
+
+        Returns:
+            array: Mask with 1 where the comparison holds and 0 otherwise.
+        """
+        if isinstance(other, self.measurement_cls):
+            si_key = other.si_key
+            return array("B", (compare(key, si_key) for key in self.si_keys()))
+        if (
+            isinstance(other, MeasurementArray)
+            and other.measurement_cls is self.measurement_cls
+        ):
+            if len(other) != len(self):
+                raise ValueError("Arrays need to have the same length.")
+            return array("B", map(compare, self.si_keys(), other.si_keys()))
+        return NotImplemented
+
+    def __eq__(self, other: object) -> array:  # type: ignore[override]
+        """
+        Element-wise equality in SI units.
+
+        Args:
+            other (object): Measurement or array of the same kind and length.
+
+        Returns:
+            array: Mask with 1 where the measurements are equal.
+        """
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other: object) -> array:  # type: ignore[override]
+        """
+        Element-wise inequality in SI units.
+
+        Args:
+            other (object): Measurement or array of the same kind and length.
+
+        Returns:
+            array: Mask with 1 where the measurements differ.
+        """
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other: object) -> array:
+        """
+        Element-wise less than comparison in SI units.
+
+        Args:
+            other (object): Measurement or array of the same kind and length.
+
+        Returns:
+            array: Mask with 1 where self is smaller.
+        """
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: object) -> array:
+        """
+        Element-wise less than or equal comparison in SI units.
+
+        Args:
+            other (object): Measurement or array of the same kind and length.
+
+        Returns:
+            array: Mask with 1 where self is smaller or equal.
+        """
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: object) -> array:
+        """
+        Element-wise greater than comparison in SI units.
+
+        Args:
+            other (object): Measurement or array of the same kind and length.
+
+        Returns:
+            array: Mask with 1 where self is larger.
+        """
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: object) -> array:
+        """
+        Element-wise greater than or equal comparison in SI units.
+
+        Args:
+            other (object): Measurement or array of the same kind and length.
+
+        Returns:
+            array: Mask with 1 where self is larger or equal.
+        """
+        return self._compare(other, operator.ge)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def compress(self, mask: Iterable[int]) -> Self:
+        """
+        Selects the measurements where the mask is set.
+
+        Args:
+            mask (Iterable[int]): Selection mask, e.g. from a comparison.
+
+        Returns:
+            Self: New array with the selected measurements.
+        """
+        selection = list(mask)
+        result = type(self)(self.measurement_cls)
+        result.values = array("d", itertools.compress(self.values, selection))
+        result.codes = array("B", itertools.compress(self.codes, selection))
+        return result
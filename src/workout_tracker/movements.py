@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import string
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+NAME_CACHE_SIZE = 4096
+
+DEFAULT_MOVEMENTS: list[tuple[str, tuple[str, ...]]] = [
+    ("Back Squat", ("BS", "Squat")),
+    ("Front Squat", ("FS",)),
+    ("Overhead Squat", ("OHS",)),
+    ("Deadlift", ("DL",)),
+    ("Sumo Deadlift High Pull", ("SDHP",)),
+    ("Bench Press", ("BP", "Bench")),
+    ("Strict Press", ("Shoulder Press", "Press", "SP")),
+    ("Push Press", ("PP",)),
+    ("Push Jerk", ("PJ",)),
+    ("Split Jerk", ("Jerk",)),
+    ("Clean", ("Squat Clean", "SQC")),
+    ("Power Clean", ("PC",)),
+    ("Hang Power Clean", ("HPC",)),
+    ("Clean & Jerk", ("Clean And Jerk", "C&J", "CJ")),
+    ("Snatch", ("Squat Snatch", "SQS")),
+    ("Power Snatch", ("PS",)),
+    ("Hang Power Snatch", ("HPS",)),
+    ("Thruster", ()),
+    ("Wall Ball", ("Wall Ball Shot", "WB", "WBS")),
+    ("Kettlebell Swing", ("KB Swing", "KBS", "American Swing")),
+    ("Pull Up", ("Pullup", "PU")),
+    ("Chest To Bar Pull Up", ("C2B", "CTB")),
+    ("Toes To Bar", ("T2B", "TTB")),
+    ("Muscle Up", ("MU", "Bar Muscle Up", "BMU")),
+    ("Ring Muscle Up", ("RMU",)),
+    ("Handstand Push Up", ("HSPU",)),
+    ("Push Up", ("Pushup",)),
+    ("Burpee", ()),
+    ("Box Jump", ("BJ",)),
+    ("Double Under", ("DU", "Dubs")),
+    ("Run", ("Running",)),
+    ("Row", ("Rowing", "Erg")),
+    ("Bike", ("Assault Bike", "Echo Bike")),
+    ("Ski", ("Ski Erg",)),
+    ("Plank", ()),
+]
+
+
+class MovementDefinition(NamedTuple):
+    """
+    Movement of a catalog with its canonical name and aliases.
+    """
+
+    id: int
+    name: str
+    aliases: tuple[str, ...]
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def canonical_name(name: str) -> str:
+    """
+    Normalizes an exercise name, e.g. " back squat" to "Back Squat".
+
+    Results are kept in a bounded LRU cache, as logs repeat a few hundred
+    distinct names.
+
+    Args:
+        name (str): Exercise name.
+
+    Returns:
+        str: Normalized exercise name.
+    """
+    return string.capwords(name.strip())
+
+
+def _key(text: str) -> str:
+    """
+    Builds the lookup key of a name, alias or prefix.
+
+    Args:
+        text (str): Name, alias or prefix.
+
+    Returns:
+        str: Case folded text with single spaces and no hyphens.
+    """
+    return " ".join(text.casefold().replace("-", " ").split())
+
+
+def _singular_keys(key: str) -> Iterator[str]:
+    """
+    Yields the keys of the singular forms a plural key may have.
+
+    Args:
+        key (str): Lookup key.
+
+    Yields:
+        str: Key without a plural "s" or "es".
+    """
+    if key.endswith("s"):
+        yield key[:-1]
+    if key.endswith("es"):
+        yield key[:-2]
+
+
+class _TrieNode:
+    """
+    Node of the alias prefix tree.
+    """
+
+    __slots__ = ("children", "movement_ids")
+
+    def __init__(self) -> None:
+        """
+        Node of the alias prefix tree.
+        """
+        self.children: dict[str, _TrieNode] = {}
+        self.movement_ids: list[int] = []
+
+
+class MovementCatalog:
+    """
+    Catalog mapping names and aliases of movements to integer IDs.
+
+    Names are matched ignoring case, spacing, hyphens and a plural "s" or
+    "es", so "BS", "back squats" and "Back Squat" resolve to the same ID.
+    Resolved names are kept in a bounded LRU cache. Aliases are also
+    indexed in a prefix tree to complete partial input.
+    """
+
+    def __init__(
+        self,
+        movements: Iterable[tuple[str, Iterable[str]]] = (),
+        cache_size: int = NAME_CACHE_SIZE,
+    ) -> None:
+        """
+        Catalog mapping names and aliases of movements to integer IDs.
+
+        Args:
+            movements (Iterable[tuple[str, Iterable[str]]]): Names and
+                aliases of the initial movements. Defaults to ().
+            cache_size (int): Number of resolved names to cache.
+                Defaults to NAME_CACHE_SIZE.
+        """
+        self._movements: list[MovementDefinition] = []
+        self._ids: dict[str, int] = {}
+        self._trie = _TrieNode()
+        self._cached_lookup = lru_cache(maxsize=cache_size)(self._lookup)
+        for name, aliases in movements:
+            self.add(name, aliases)
+
+    def __len__(self) -> int:
+        """
+        Number of movements.
+
+        Returns:
+            int: Number of movements.
+        """
+        return len(self._movements)
+
+    def __iter__(self) -> Iterator[MovementDefinition]:
+        """
+        Iterates over the movements in the order of their IDs.
+
+        Returns:
+            Iterator[MovementDefinition]: Movements.
+        """
+        return iter(self._movements)
+
+    def __getitem__(self, movement_id: int) -> MovementDefinition:
+        """
+        Gets a movement by ID.
+
+        Args:
+            movement_id (int): ID of the movement.
+
+        Returns:
+            MovementDefinition: Movement.
+        """
+        return self._movements[movement_id]
+
+    def add(self, name: str, aliases: Iterable[str] = ()) -> int:
+        """
+        Adds a movement or further aliases of a known movement.
+
+        Args:
+            name (str): Canonical name of the movement.
+            aliases (Iterable[str]): Other names of the movement.
+                Defaults to no aliases.
+
+        Raises:
+            ValueError: If an alias already belongs to another movement.
+
+        Returns:
+            int: ID of the movement.
+        """
+        name = canonical_name(name)
+        movement_id = self._ids.get(_key(name), len(self._movements))
+        if movement_id == len(self._movements):
+            self._movements.append(MovementDefinition(movement_id, name, ()))
+        movement = self._movements[movement_id]
+        new_aliases = []
+        for alias in (name, *aliases):
+            key = _key(alias)
+            if (known_id := self._ids.get(key)) == movement_id:
+                continue
+            if known_id is not None:
+                raise ValueError(
+                    f"The alias {alias!r} already belongs to "
+                    f"{self._movements[known_id].name}."
+                )
+            self._ids[key] = movement_id
+            self._insert(key, movement_id)
+            if alias != name:
+                new_aliases.append(alias)
+        self._movements[movement_id] = movement._replace(
+            aliases=movement.aliases + tuple(new_aliases)
+        )
+        self._cached_lookup.cache_clear()
+        return movement_id
+
+    def _insert(self, key: str, movement_id: int) -> None:
+        """
+        Indexes an alias key in the prefix tree.
+
+        Args:
+            key (str): Lookup key of the alias.
+            movement_id (int): ID of the movement.
+        """
+        node = self._trie
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.movement_ids.append(movement_id)
+
+    def lookup(self, name: str) -> int | None:
+        """
+        Gets the ID of a movement by name or alias.
+
+        Args:
+            name (str): Name or alias in any case, spacing or plural.
+
+        Returns:
+            int | None: ID of the movement or None if it is unknown.
+        """
+        return self._cached_lookup(name)
+
+    def _lookup(self, name: str) -> int | None:
+        """
+        Gets the ID of a movement by name or alias without the cache.
+
+        Args:
+            name (str): Name or alias in any case, spacing or plural.
+
+        Returns:
+            int | None: ID of the movement or None if it is unknown.
+        """
+        key = _key(name)
+        if (movement_id := self._ids.get(key)) is not None:
+            return movement_id
+        for singular in _singular_keys(key):
+            if (movement_id := self._ids.get(singular)) is not None:
+                return movement_id
+        return None
+
+    def resolve(self, name: str) -> MovementDefinition | None:
+        """
+        Gets a movement by name or alias.
+
+        Args:
+            name (str): Name or alias in any case, spacing or plural.
+
+        Returns:
+            MovementDefinition | None: Movement or None if it is unknown.
+        """
+        movement_id = self.lookup(name)
+        return None if movement_id is None else self._movements[movement_id]
+
+    def complete(
+        self, prefix: str, limit: int = 10
+    ) -> list[MovementDefinition]:
+        """
+        Finds the movements with a name or alias starting with a prefix.
+
+        Args:
+            prefix (str): Start of a name or alias.
+            limit (int): Maximum number of movements. Defaults to 10.
+
+        Returns:
+            list[MovementDefinition]: Movements by alphabetical order of
+                their matching names and aliases.
+        """
+        node = self._trie
+        for char in _key(prefix):
+            if (child := node.children.get(char)) is None:
+                return []
+            node = child
+        found: dict[int, None] = {}
+        stack = [node]
+        while stack and len(found) < limit:
+            node = stack.pop()
+            found.update(dict.fromkeys(node.movement_ids))
+            stack.extend(
+                node.children[char] for char in sorted(node.children)[::-1]
+            )
+        movements = [self._movements[movement_id] for movement_id in found]
+        return movements[:limit]
+
+    def cache_info(self) -> Any:
+        """
+        Gets hit and miss statistics of the name cache.
+
+        Returns:
+            Any: Cache info named tuple of functools.lru_cache with hits,
+                misses, maxsize and currsize.
+        """
+        return self._cached_lookup.cache_info()
+
+
+CATALOG = MovementCatalog(DEFAULT_MOVEMENTS)
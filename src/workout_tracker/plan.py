@@ -0,0 +1,494 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Hashable, Iterator
+from datetime import timedelta
+from typing import Any
+
+from workout_tracker.analytics import Movement
+from workout_tracker.exercise import AnyExercise, FrozenExercise
+from workout_tracker.movements import CATALOG
+from workout_tracker.workout import Amrap, Workout
+
+PLAN_CACHE_SIZE = 256
+
+Record = AnyExercise | Workout
+
+# Kinds of plan rows. Complex rows follow the rows of their sub exercises
+# and carry the distance and duration of the complex.
+WORKOUT = 0
+EXERCISE = 1
+SUB_EXERCISE = 2
+COMPLEX = 3
+
+# Roles of rows within their parent workout.
+MAIN = 0
+BUY_IN = 1
+BUY_OUT = 2
+
+_ROLE_LABELS = {MAIN: "", BUY_IN: "Buy-in: ", BUY_OUT: "Buy-out: "}
+
+
+class Plan:  # pylint: disable=too-many-instance-attributes
+    """
+    Flat, array-backed form of an exercise or workout.
+
+    Every workout, exercise and sub exercise is one row of contiguous
+    columns, in the order analytics.iter_movements yields their movements:
+    a workout row precedes its buy-in, its exercises and its buy-out, and
+    the sub exercises of a complex precede the complex row. Quantities are
+    in SI units and already multiplied by the reps of their exercise, so
+    consumers iterate the rows linearly without walking any trees.
+
+    Compiled plans are shared by all callers and therefore read-only: the
+    array columns are exposed as read-only memoryviews, the lists as tuples,
+    and attributes cannot be assigned.
+
+    Attributes:
+        kinds (memoryview): Row kind, one of WORKOUT, EXERCISE, SUB_EXERCISE
+            or COMPLEX.
+        parents (memoryview): Row of the parent workout or complex, -1 for
+            the root.
+        depths (memoryview): Nesting depth of buy-in and buy-out workouts.
+        roles (memoryview): Role within the parent workout, one of MAIN,
+            BUY_IN or BUY_OUT.
+        repeats (memoryview): Repeats of the workout containing the row and
+            of workout rows themselves.
+        scaled (memoryview): Whether AMRAP rounds apply, i.e. the row is in
+            the main part of the root workout.
+        reps (memoryview): Reps, counting sub exercise reps per complex rep.
+        loads (memoryview): Loads in kg.
+        distances (memoryview): Distances in m for all reps.
+        durations (memoryview): Durations in s for all reps, and work
+            windows of workout rows.
+        rests (memoryview): Rests in s between repeats of workout rows.
+        movement_ids (memoryview): Movement IDs in the CATALOG or -1.
+        names (tuple[str | None, ...]): Exercise names, None for workouts.
+        labels (tuple[str, ...]): Rendered exercises and workout headers.
+    """
+
+    _frozen = False
+
+    def __init__(self) -> None:
+        """
+        Flat, array-backed form of an exercise or workout, empty until
+        rows are appended.
+        """
+        self.kinds = array("B")
+        self.parents = array("i")
+        self.depths = array("B")
+        self.roles = array("B")
+        self.repeats = array("I")
+        self.scaled = array("B")
+        self.reps = array("d")
+        self.loads = array("d")
+        self.distances = array("d")
+        self.durations = array("d")
+        self.rests = array("d")
+        self.movement_ids = array("i")
+        self.names: list[str | None] = []
+        self.labels: list[str] = []
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute while the plan is being compiled.
+
+        Args:
+            name (str): Name of the attribute.
+            value (Any): Value of the attribute.
+
+        Raises:
+            AttributeError: If the plan is compiled.
+        """
+        if self._frozen:
+            raise AttributeError("Compiled plans are read-only.")
+        object.__setattr__(self, name, value)
+
+    def _freeze(self) -> None:
+        """
+        Makes the columns read-only once all rows are appended.
+        """
+        for name, column in list(vars(self).items()):
+            if isinstance(column, array):
+                column = memoryview(column).toreadonly()
+            elif isinstance(column, list):
+                column = tuple(column)
+            object.__setattr__(self, name, column)
+        object.__setattr__(self, "_frozen", True)
+
+    def __len__(self) -> int:
+        """
+        Number of rows.
+
+        Returns:
+            int: Number of rows.
+        """
+        return len(self.kinds)
+
+    def _append(  # pylint: disable=too-many-arguments
+        self,
+        source: AnyExercise | Amrap,
+        kind: int,
+        parent: int,
+        *,
+        depth: int,
+        role: int,
+        repeats: int,
+        scaled: bool,
+        quantities: tuple[float, float, float, float] = (0, 0, 0, 0),
+        rest: float = 0.0,
+    ) -> int:
+        """
+        Appends a row.
+
+        Args:
+            source (AnyExercise | Amrap): Exercise or workout of the row.
+            kind (int): Row kind.
+            parent (int): Row of the parent.
+            depth (int): Nesting depth.
+            role (int): Role within the parent workout.
+            repeats (int): Repeats of the containing or the row workout.
+            scaled (bool): Whether AMRAP rounds apply.
+            quantities (tuple[float, float, float, float]): Reps, load,
+                distance and duration. Defaults to zeros.
+            rest (float): Rest between repeats of a workout row.
+                Defaults to 0.
+
+        Returns:
+            int: Index of the row.
+        """
+        name = source.name if isinstance(source, AnyExercise) else None
+        movement_id = None if name is None else CATALOG.lookup(name)
+        self.kinds.append(kind)
+        self.parents.append(parent)
+        self.depths.append(depth)
+        self.roles.append(role)
+        self.repeats.append(repeats)
+        self.scaled.append(scaled)
+        columns = (self.reps, self.loads, self.distances, self.durations)
+        for column, value in zip(columns, quantities):
+            column.append(value)
+        self.rests.append(rest)
+        self.movement_ids.append(-1 if movement_id is None else movement_id)
+        self.names.append(name)
+        self.labels.append(_label(source))
+        return len(self.kinds) - 1
+
+    def movements(self, rounds: float = 1) -> Iterator[Movement]:
+        """
+        Yields the same movements as analytics.iter_movements.
+
+        Args:
+            rounds (float): Completed rounds of AMRAP workouts.
+                Defaults to 1.
+
+        Yields:
+            Movement: Flattened movement.
+        """
+        columns = zip(
+            self.kinds,
+            self.names,
+            self.reps,
+            self.loads,
+            self.distances,
+            self.durations,
+            self.repeats,
+            self.scaled,
+        )
+        for (
+            kind,
+            name,
+            reps,
+            load,
+            distance,
+            duration,
+            repeats,
+            scaled,
+        ) in columns:
+            if kind == WORKOUT:
+                continue
+            if kind == COMPLEX and not (distance or duration):
+                continue
+            factor: float = rounds * repeats if scaled else repeats
+            yield Movement(
+                name,
+                reps * factor,
+                load,
+                distance * factor,
+                duration * factor,
+            )
+
+    def work_time(self) -> float:
+        """
+        Computes the time under work like analytics.work_time.
+
+        Returns:
+            float: Time under work in seconds.
+        """
+        if self.kinds[0] != WORKOUT:
+            # The row of an exercise or complex follows its sub exercises.
+            return self.durations[-1]
+        return sum(
+            duration * repeats
+            for kind, duration, repeats in zip(
+                self.kinds, self.durations, self.repeats
+            )
+            if kind == WORKOUT
+        )
+
+    def total_duration(self) -> timedelta:
+        """
+        Computes the length of the workout like timeline.total_duration.
+        Plans of single exercises have no length.
+
+        Returns:
+            timedelta: Length including rests, buy-in and buy-out.
+        """
+        seconds = 0.0
+        for row, kind in enumerate(self.kinds):
+            if kind == WORKOUT:
+                repeats = self.repeats[row]
+                seconds += self.durations[row] * repeats
+                seconds += self.rests[row] * max(repeats - 1, 0)
+        return timedelta(seconds=seconds)
+
+    def outline(self, indent: str = "  ") -> Iterator[str]:
+        """
+        Renders the plan as indented lines, one per workout and exercise.
+
+        Args:
+            indent (str): Indent per nesting depth. Defaults to two spaces.
+
+        Yields:
+            str: Rendered line.
+        """
+        for row, kind in enumerate(self.kinds):
+            if kind == SUB_EXERCISE:
+                continue
+            prefix = indent * self.depths[row]
+            if kind != WORKOUT:
+                prefix += indent
+            role = _ROLE_LABELS[self.roles[row]] if kind == WORKOUT else ""
+            yield f"{prefix}{role}{self.labels[row]}"
+
+
+def _label(record: AnyExercise | Amrap) -> str:
+    """
+    Renders an exercise or the header of a workout.
+
+    Args:
+        record (AnyExercise | Amrap): Exercise or AMRAP workout.
+
+    Returns:
+        str: Rendered exercise or header.
+    """
+    if isinstance(record, AnyExercise):
+        return str(record)
+    text = f"{record.duration} AMRAP"
+    if record.repeats > 1:
+        text = f"{record.repeats} x {text}"
+    if record.rest:
+        text += f", rest {record.rest}"
+    return text
+
+
+_PLANS: dict[Hashable, Plan] = {}
+
+
+def compile_plan(record: Record) -> Plan:
+    """
+    Lowers an exercise or workout into a flat plan.
+
+    Plans are cached by the content of the record, so repeated consumers
+    of the same definition compile it once, and changed records compile
+    again. The cache keeps the PLAN_CACHE_SIZE most recent definitions.
+
+    Args:
+        record (Record): Exercise or workout.
+
+    Raises:
+        TypeError: If the workout type is not supported.
+
+    Returns:
+        Plan: Compiled plan.
+    """
+    key = _definition(record)
+    if (plan := _PLANS.pop(key, None)) is None:
+        plan = Plan()
+        _lower(plan, record, parent=-1, depth=0, role=MAIN)
+        plan._freeze()  # pylint: disable=protected-access
+        if len(_PLANS) >= PLAN_CACHE_SIZE:
+            del _PLANS[next(iter(_PLANS))]
+    _PLANS[key] = plan
+    return plan
+
+
+def _definition(record: Record) -> Hashable:
+    """
+    Builds the hashable content of an exercise or workout, including sub
+    exercises and nested workouts.
+
+    Args:
+        record (Record): Exercise or workout.
+
+    Raises:
+        TypeError: If the workout type is not supported.
+
+    Returns:
+        Hashable: Content of the record.
+    """
+    if isinstance(record, AnyExercise):
+        return _exercise_definition(record)
+    if not isinstance(record, Amrap):
+        raise TypeError(f"Cannot compile workout of type {type(record)}.")
+    return (
+        type(record),
+        record.duration,
+        record.repeats,
+        record.rest,
+        None if record.buy_in is None else _definition(record.buy_in),
+        tuple(map(_exercise_definition, record.exercises)),
+        None if record.buy_out is None else _definition(record.buy_out),
+    )
+
+
+def _exercise_definition(exercise: AnyExercise) -> Hashable:
+    """
+    Builds the hashable content of an exercise. Interned exercises never
+    change and are their own content. Mutable exercises are represented by
+    their cached renderings, which list all their fields and are dropped
+    when a field is assigned. The rendering of a complex is not dropped
+    when its sub exercises change, so these are added separately.
+
+    Args:
+        exercise (AnyExercise): Exercise.
+
+    Returns:
+        Hashable: Content of the exercise.
+    """
+    if isinstance(exercise, FrozenExercise):
+        return exercise
+    if exercise.sub_exercises is None:
+        return str(exercise)
+    return str(exercise), tuple(
+        map(_exercise_definition, exercise.sub_exercises)
+    )
+
+
+def clear_plan_cache() -> None:
+    """
+    Clears the compiled plans.
+    """
+    _PLANS.clear()
+
+
+def _lower(
+    plan: Plan, record: Record, *, parent: int, depth: int, role: int
+) -> None:
+    """
+    Appends the rows of an exercise or workout.
+
+    Args:
+        plan (Plan): Plan to extend.
+        record (Record): Exercise or workout.
+        parent (int): Row of the parent workout.
+        depth (int): Nesting depth.
+        role (int): Role within the parent workout.
+
+    Raises:
+        TypeError: If the workout type is not supported.
+    """
+    if isinstance(record, AnyExercise):
+        _lower_exercise(plan, record, parent, depth, repeats=1, scaled=False)
+        return
+    if not isinstance(record, Amrap):
+        raise TypeError(f"Cannot compile workout of type {type(record)}.")
+    row = plan._append(  # pylint: disable=protected-access
+        record,
+        WORKOUT,
+        parent,
+        depth=depth,
+        role=role,
+        repeats=record.repeats,
+        scaled=False,
+        quantities=(0, 0, 0, record.duration.total_seconds()),
+        rest=record.rest.total_seconds() if record.rest else 0.0,
+    )
+    if record.buy_in is not None:
+        _lower(plan, record.buy_in, parent=row, depth=depth + 1, role=BUY_IN)
+    for exercise in record.exercises:
+        _lower_exercise(
+            plan,
+            exercise,
+            row,
+            depth,
+            repeats=record.repeats,
+            scaled=depth == 0,
+        )
+    if record.buy_out is not None:
+        _lower(plan, record.buy_out, parent=row, depth=depth + 1, role=BUY_OUT)
+
+
+def _lower_exercise(  # pylint: disable=too-many-arguments
+    plan: Plan,
+    exercise: AnyExercise,
+    parent: int,
+    depth: int,
+    *,
+    repeats: int,
+    scaled: bool,
+) -> None:
+    """
+    Appends the rows of an exercise and its sub exercises.
+
+    Args:
+        plan (Plan): Plan to extend.
+        exercise (AnyExercise): Exercise.
+        parent (int): Row of the containing workout or -1.
+        depth (int): Nesting depth of the containing workout.
+        repeats (int): Repeats of the containing workout.
+        scaled (bool): Whether AMRAP rounds apply.
+    """
+    # pylint: disable=protected-access
+    count = exercise.reps or 1
+    load = exercise.weight.si_value if exercise.weight else 0.0
+    distance = exercise.distance.si_value * count if exercise.distance else 0.0
+    duration = (
+        exercise.duration.total_seconds() * count if exercise.duration else 0.0
+    )
+    if exercise.sub_exercises is None:
+        plan._append(
+            exercise,
+            EXERCISE,
+            parent,
+            depth=depth,
+            role=MAIN,
+            repeats=repeats,
+            scaled=scaled,
+            quantities=(exercise.reps or 0, load, distance, duration),
+        )
+        return
+    first = len(plan)
+    for sub_exercise in exercise.sub_exercises:
+        plan._append(
+            sub_exercise,
+            SUB_EXERCISE,
+            parent,
+            depth=depth,
+            role=MAIN,
+            repeats=repeats,
+            scaled=scaled,
+            quantities=(count * sub_exercise.reps, load, 0, 0),
+        )
+    row = plan._append(
+        exercise,
+        COMPLEX,
+        parent,
+        depth=depth,
+        role=MAIN,
+        repeats=repeats,
+        scaled=scaled,
+        quantities=(0, 0, distance, duration),
+    )
+    for sub_row in range(first, row):
+        plan.parents[sub_row] = row
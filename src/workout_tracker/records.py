@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from datetime import date, timedelta
+from typing import NamedTuple, Self, cast
+
+from workout_tracker.better_enum import BetterStrEnum
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import Distance, Weight
+from workout_tracker.movements import canonical_name
+
+SNAPSHOT_VERSION = 1
+
+Scheme = int | Distance | None
+RecordValue = Weight | timedelta | int
+
+
+class RecordKind(BetterStrEnum):
+    """
+    Class to store all kinds of personal records
+    """
+
+    WEIGHT = "weight"
+    DURATION = "duration"
+    REPS = "reps"
+
+
+class PersonalRecord(NamedTuple):
+    """
+    Best performance of an exercise for a kind and scheme of record.
+
+    The scheme is the rep count for weight records, the distance for
+    duration records and None for rep records.
+    """
+
+    kind: RecordKind
+    name: str
+    scheme: Scheme
+    value: RecordValue
+    day: date | None = None
+
+    def is_better(self, value: RecordValue) -> bool:
+        """
+        Checks whether a value beats this record. Ties do not.
+
+        Args:
+            value (RecordValue): Value of the same kind.
+
+        Returns:
+            bool: Whether the value sets a new record.
+        """
+        if self.kind == RecordKind.DURATION:
+            return value < self.value  # type: ignore[operator]
+        return value > self.value  # type: ignore[operator]
+
+
+RecordKey = tuple[RecordKind, str, Scheme]
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalizes an exercise name the way exercises normalize theirs.
+
+    Args:
+        name (str): Exercise name.
+
+    Returns:
+        str: Normalized exercise name.
+    """
+    return canonical_name(name)
+
+
+class PersonalRecordIndex:
+    """
+    Incrementally updated index of personal records.
+
+    Tracks the heaviest weight per exercise and rep count, the fastest
+    duration per exercise and distance, and the most reps per exercise.
+    Each set updates a constant number of entries, and the rep counts with
+    weight records are kept sorted per exercise for range lookups.
+    """
+
+    def __init__(self) -> None:
+        """
+        Incrementally updated index of personal records.
+        """
+        self._records: dict[RecordKey, PersonalRecord] = {}
+        self._rep_schemes: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        """
+        Number of personal records.
+
+        Returns:
+            int: Number of personal records.
+        """
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[PersonalRecord]:
+        """
+        Iterates over all personal records.
+
+        Returns:
+            Iterator[PersonalRecord]: Personal records.
+        """
+        return iter(self._records.values())
+
+    def add(
+        self, exercise: Exercise, day: date | None = None
+    ) -> list[PersonalRecord]:
+        """
+        Updates the index with a performed set.
+
+        Complexes count as exercise of their own name.
+
+        Args:
+            exercise (Exercise): Performed set.
+            day (date | None): Date of the set. Defaults to None.
+
+        Returns:
+            list[PersonalRecord]: Records newly set by the exercise.
+        """
+        name = exercise.name
+        candidates: list[tuple[RecordKind, Scheme, RecordValue]] = []
+        if exercise.weight is not None and exercise.reps:
+            candidates.append(
+                (RecordKind.WEIGHT, exercise.reps, exercise.weight)
+            )
+        if exercise.distance is not None and exercise.duration is not None:
+            candidates.append(
+                (RecordKind.DURATION, exercise.distance, exercise.duration)
+            )
+        if exercise.reps:
+            candidates.append((RecordKind.REPS, None, exercise.reps))
+
+        new_records = []
+        for kind, scheme, value in candidates:
+            record = PersonalRecord(kind, name, scheme, value, day)
+            if self._update(record):
+                new_records.append(record)
+        return new_records
+
+    def extend(
+        self, exercises: Iterable[tuple[date, Exercise]]
+    ) -> list[PersonalRecord]:
+        """
+        Updates the index with dated sets.
+
+        Args:
+            exercises (Iterable[tuple[date, Exercise]]): Dates and sets.
+
+        Returns:
+            list[PersonalRecord]: Records newly set, in order.
+        """
+        new_records = []
+        for day, exercise in exercises:
+            new_records.extend(self.add(exercise, day))
+        return new_records
+
+    def _update(self, record: PersonalRecord) -> bool:
+        """
+        Stores a record if it beats the current one.
+
+        Args:
+            record (PersonalRecord): Candidate record.
+
+        Returns:
+            bool: Whether the record was stored.
+        """
+        key = (record.kind, record.name, record.scheme)
+        current = self._records.get(key)
+        if current is not None and not current.is_better(record.value):
+            return False
+        if current is None and record.kind == RecordKind.WEIGHT:
+            schemes = self._rep_schemes.setdefault(record.name, [])
+            insort(schemes, cast(int, record.scheme))
+        self._records[key] = record
+        return True
+
+    def get(
+        self, kind: RecordKind, name: str, scheme: Scheme = None
+    ) -> PersonalRecord | None:
+        """
+        Gets a personal record.
+
+        Args:
+            kind (RecordKind): Kind of the record.
+            name (str): Exercise name.
+            scheme (Scheme): Rep count for weight records,
+                distance for duration records. Defaults to None.
+
+        Returns:
+            PersonalRecord | None: Record or None if there is none yet.
+        """
+        return self._records.get((kind, normalize_name(name), scheme))
+
+    def heaviest(self, name: str, reps: int) -> PersonalRecord | None:
+        """
+        Gets the heaviest weight for an exact rep count.
+
+        Args:
+            name (str): Exercise name.
+            reps (int): Rep count.
+
+        Returns:
+            PersonalRecord | None: Record or None if there is none yet.
+        """
+        return self.get(RecordKind.WEIGHT, name, reps)
+
+    def best_for_reps(self, name: str, reps: int) -> PersonalRecord | None:
+        """
+        Gets the heaviest weight lifted for at least the given reps, e.g.
+        a heavier 5 rep set also beats the 3 rep max.
+
+        Args:
+            name (str): Exercise name.
+            reps (int): Minimum rep count.
+
+        Returns:
+            PersonalRecord | None: Record or None if there is none yet.
+        """
+        name = normalize_name(name)
+        schemes = self._rep_schemes.get(name, [])
+        first = bisect_left(schemes, reps)
+        records = [
+            self._records[(RecordKind.WEIGHT, name, scheme)]
+            for scheme in schemes[first:]
+        ]
+        return max(records, key=lambda record: record.value, default=None)
+
+    def rep_maxes(self, name: str) -> list[PersonalRecord]:
+        """
+        Gets the weight records of an exercise.
+
+        Args:
+            name (str): Exercise name.
+
+        Returns:
+            list[PersonalRecord]: Weight records by ascending rep count.
+        """
+        name = normalize_name(name)
+        return [
+            self._records[(RecordKind.WEIGHT, name, scheme)]
+            for scheme in self._rep_schemes.get(name, [])
+        ]
+
+    def fastest(self, name: str, distance: Distance) -> PersonalRecord | None:
+        """
+        Gets the fastest duration over a distance.
+
+        Args:
+            name (str): Exercise name.
+            distance (Distance): Distance in any unit.
+
+        Returns:
+            PersonalRecord | None: Record or None if there is none yet.
+        """
+        return self.get(RecordKind.DURATION, name, distance)
+
+    def max_reps(self, name: str) -> PersonalRecord | None:
+        """
+        Gets the most reps in a single set.
+
+        Args:
+            name (str): Exercise name.
+
+        Returns:
+            PersonalRecord | None: Record or None if there is none yet.
+        """
+        return self.get(RecordKind.REPS, name)
+
+    def snapshot(self) -> dict:
+        """
+        Represents the index as JSON serializable dictionary.
+
+        Returns:
+            dict: Snapshot of all records.
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "records": [
+                [
+                    record.kind.value,
+                    record.name,
+                    _dump_value(record.scheme),
+                    _dump_value(record.value),
+                    record.day.isoformat() if record.day else None,
+                ]
+                for record in self._records.values()
+            ],
+        }
+
+    @classmethod
+    def restore(cls, snapshot: dict) -> Self:
+        """
+        Rebuilds an index from a snapshot.
+
+        Args:
+            snapshot (dict): Snapshot created by snapshot.
+
+        Raises:
+            ValueError: If the snapshot version is not supported.
+
+        Returns:
+            Self: Restored index.
+        """
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {snapshot.get('version')}."
+            )
+        index = cls()
+        for kind, name, scheme, value, day in snapshot["records"]:
+            kind = RecordKind(kind)
+            if kind == RecordKind.WEIGHT:
+                value = _load_measurement(Weight, value)
+            elif kind == RecordKind.DURATION:
+                scheme = _load_measurement(Distance, scheme)
+                value = timedelta(seconds=value)
+            index._update(
+                PersonalRecord(
+                    kind,
+                    name,
+                    scheme,
+                    value,
+                    date.fromisoformat(day) if day else None,
+                )
+            )
+        return index
+
+
+def _dump_value(value: object) -> object:
+    """
+    Converts a record value to a JSON serializable value.
+
+    Args:
+        value (object): Measurement, duration, count or None.
+
+    Returns:
+        object: Value and unit of measurements, seconds of durations and
+            other values unchanged.
+    """
+    if isinstance(value, (Weight, Distance)):
+        return [value.value, value.unit.name]
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+def _load_measurement(
+    cls: type[Weight] | type[Distance], value: list
+) -> Weight | Distance:
+    """
+    Converts a dumped measurement back.
+
+    Args:
+        cls (type[Weight] | type[Distance]): Class of the measurement.
+        value (list): Value and unit.
+
+    Returns:
+        Weight | Distance: Measurement.
+    """
+    number, unit = value
+    return cls(number, unit)
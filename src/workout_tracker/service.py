@@ -0,0 +1,500 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from http import HTTPStatus
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.jsonl import RecordError, build_record, dump_iter
+from workout_tracker.sqlite_store import WorkoutRepository
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_SIZE = 1 << 20
+MAX_HEADER_COUNT = 100
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+class Storage(ABC):
+    """
+    Parent class for all storage backends of the ingestion service.
+
+    Writes are called from a worker thread, one batch at a time.
+    """
+
+    @abstractmethod
+    def write(self, exercises: list[Exercise]) -> None:
+        """
+        Persists a batch of exercises.
+
+        Args:
+            exercises (list[Exercise]): Exercises to persist.
+        """
+
+    def close(self) -> None:
+        """
+        Releases the resources of the backend.
+        """
+
+
+class JsonlStorage(Storage):
+    """
+    Appends exercises to a JSON Lines file.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """
+        Appends exercises to a JSON Lines file.
+
+        Args:
+            path (str | os.PathLike): Path of the JSON Lines file.
+        """
+        self.path = path
+
+    def write(self, exercises: list[Exercise]) -> None:
+        """
+        Appends a batch of exercises to the file.
+
+        Args:
+            exercises (list[Exercise]): Exercises to persist.
+        """
+        dump_iter(exercises, self.path, append=True)
+
+
+class SqliteStorage(Storage):
+    """
+    Stores exercises in a normalized SQLite database.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """
+        Stores exercises in a normalized SQLite database.
+
+        Args:
+            path (str | os.PathLike): Path of the database.
+        """
+        self.repository = WorkoutRepository(path)
+
+    def write(self, exercises: list[Exercise]) -> None:
+        """
+        Inserts a batch of exercises in a single transaction.
+
+        Args:
+            exercises (list[Exercise]): Exercises to persist.
+        """
+        self.repository.extend((None, exercise) for exercise in exercises)
+
+    def close(self) -> None:
+        """
+        Closes the database connections.
+        """
+        self.repository.close()
+
+
+class BatchWriter:
+    """
+    Groups submitted exercises into batches bounded in size and delay and
+    persists them one batch at a time in a worker thread.
+
+    Submissions are queued up to max_pending requests. Beyond that submit
+    raises asyncio.QueueFull, so that callers can push back on clients
+    while the storage falls behind.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        max_batch_size: int = 500,
+        max_delay: float = 0.05,
+        max_pending: int = 10_000,
+    ) -> None:
+        """
+        Groups submitted exercises into batches bounded in size and delay.
+
+        Args:
+            storage (Storage): Backend to persist the batches to.
+            max_batch_size (int): Exercises after which a batch is written.
+                Defaults to 500.
+            max_delay (float): Seconds after which a batch is written.
+                Defaults to 0.05.
+            max_pending (int): Requests to queue before rejecting new ones.
+                Defaults to 10_000.
+        """
+        self.storage = storage
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue[
+            tuple[list[Exercise], asyncio.Future[None]]
+        ] = asyncio.Queue(max_pending)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """
+        Starts writing batches in the running event loop.
+        """
+        self._task = asyncio.create_task(self._run())
+
+    def submit(self, exercises: list[Exercise]) -> asyncio.Future[None]:
+        """
+        Queues exercises for the next batch.
+
+        Args:
+            exercises (list[Exercise]): Exercises to persist.
+
+        Raises:
+            QueueFull: If too many requests are pending.
+
+        Returns:
+            asyncio.Future[None]: Resolved once the exercises are persisted.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((exercises, future))
+        return future
+
+    async def _next_batch(
+        self,
+    ) -> list[tuple[list[Exercise], asyncio.Future[None]]]:
+        """
+        Waits for the next batch of submissions.
+
+        Returns:
+            list[tuple[list[Exercise], asyncio.Future[None]]]: Submissions
+                of the batch.
+        """
+        batch = [await self._queue.get()]
+        size = len(batch[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_delay
+        while size < self.max_batch_size:
+            if self._queue.empty():
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._queue.get_nowait()
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def _run(self) -> None:
+        """
+        Writes batches until cancelled.
+        """
+        while True:
+            batch = await self._next_batch()
+            exercises = [
+                exercise for submitted, _ in batch for exercise in submitted
+            ]
+            try:
+                await asyncio.to_thread(self.storage.write, exercises)
+                error = None
+            except Exception as exception:  # pylint: disable=broad-except
+                logger.exception(
+                    "Failed to persist %d exercises", len(exercises)
+                )
+                error = exception
+            for _, future in batch:
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def close(self) -> None:
+        """
+        Writes all pending submissions and stops the writer.
+        """
+        await self._queue.join()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+class HTTPError(Exception):
+    """Error raised to answer a request with an error status."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        """
+        Error raised to answer a request with an error status.
+
+        Args:
+            status (HTTPStatus): Status of the response.
+            message (str): Error message of the response.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class IngestionService:
+    """
+    Minimal HTTP/JSON service ingesting completed exercises.
+
+    POST /exercises takes an exercise object or an array of them in the
+    format of Exercise.to_dict. Payloads are validated through
+    Exercise.from_dict and answered with 201 once persisted, with 400 if
+    invalid and with 503 if the storage falls behind. Unexpected errors
+    are answered with 500. GET /health answers
+    with 200. Connections are kept alive between requests.
+    """
+
+    def __init__(
+        self,
+        writer: BatchWriter,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+    ) -> None:
+        """
+        Minimal HTTP/JSON service ingesting completed exercises.
+
+        Args:
+            writer (BatchWriter): Writer to persist the exercises with.
+            host (str): Address to listen on. Defaults to "127.0.0.1".
+            port (int): Port to listen on, 0 for any free port.
+                Defaults to 8080.
+        """
+        self.writer = writer
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """
+        Starts the batch writer and listens for connections. Updates port
+        with the port actually bound.
+        """
+        self.writer.start()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Stops accepting connections and persists all pending exercises.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.writer.close()
+
+    async def __aenter__(self) -> IngestionService:
+        """
+        Starts the service when entering the context.
+
+        Returns:
+            IngestionService: The started service.
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """
+        Closes the service when leaving the context.
+
+        Args:
+            *exc_info (object): Exception type, value and traceback,
+                ignored.
+        """
+        await self.close()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answers the requests of a connection until it is closed.
+
+        Args:
+            reader (asyncio.StreamReader): Incoming stream.
+            writer (asyncio.StreamWriter): Outgoing stream.
+        """
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, target, body, keep_alive = request
+                    status, payload = await self._dispatch(
+                        method, target, body
+                    )
+                except HTTPError as error:
+                    keep_alive = False
+                    status, payload = error.status, {"error": str(error)}
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Failed to answer a request")
+                    keep_alive = False
+                    status = HTTPStatus.INTERNAL_SERVER_ERROR
+                    payload = {"error": "Internal error."}
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(
+        self, method: str, target: str, body: bytes
+    ) -> tuple[HTTPStatus, dict]:
+        """
+        Routes a request.
+
+        Args:
+            method (str): HTTP method.
+            target (str): Request target.
+            body (bytes): Request body.
+
+        Raises:
+            HTTPError: If the route does not exist.
+
+        Returns:
+            tuple[HTTPStatus, dict]: Status and payload of the response.
+        """
+        if target == "/exercises" and method == "POST":
+            return await self._ingest(body)
+        if target == "/health" and method == "GET":
+            return HTTPStatus.OK, {"status": "ok"}
+        if target in ("/exercises", "/health"):
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Wrong method.")
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {target}.")
+
+    async def _ingest(self, body: bytes) -> tuple[HTTPStatus, dict]:
+        """
+        Validates and persists posted exercises.
+
+        Args:
+            body (bytes): JSON exercise object or array of them.
+
+        Returns:
+            tuple[HTTPStatus, dict]: Status and payload of the response.
+        """
+        try:
+            exercises = parse_payload(body)
+        except RecordError as error:
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+        try:
+            persisted = self.writer.submit(exercises)
+        except asyncio.QueueFull:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Busy."}
+        try:
+            await persisted
+        except Exception:  # pylint: disable=broad-except
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Not stored."}
+        return HTTPStatus.CREATED, {"accepted": len(exercises)}
+
+
+def parse_payload(body: bytes) -> list[Exercise]:
+    """
+    Parses the posted exercise object or array of exercise objects.
+
+    Args:
+        body (bytes): JSON payload.
+
+    Raises:
+        RecordError: If the payload or any of its records is invalid. The
+            line number is the position of the record, starting at 1.
+
+    Returns:
+        list[Exercise]: Parsed exercises.
+    """
+    text = body.decode("utf-8", errors="replace")
+    try:
+        payload = json.loads(text)
+    except ValueError as error:
+        raise RecordError(1, text, error) from error
+    if not isinstance(payload, list):
+        return [build_record(1, payload, text)]
+    return [
+        build_record(position, record)
+        for position, record in enumerate(payload, start=1)
+    ]
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> tuple[str, str, bytes, bool] | None:
+    """
+    Reads an HTTP/1.x request.
+
+    Args:
+        reader (asyncio.StreamReader): Incoming stream.
+
+    Raises:
+        HTTPError: If the request is malformed or too large.
+
+    Returns:
+        tuple[str, str, bytes, bool] | None: Method, target, body and
+            whether to keep the connection alive, or None if the client
+            closed the connection.
+    """
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError as error:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Bad request line.") from error
+
+    headers = {}
+    for _ in range(MAX_HEADER_COUNT):
+        line = await reader.readline()
+        if not line.strip():
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Too many headers.")
+
+    length_text = headers.get("content-length", "0")
+    if not (length_text.isascii() and length_text.isdigit()):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Bad length.")
+    length = int(length_text)
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Too large.")
+    body = await reader.readexactly(length) if length else b""
+
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        keep_alive = connection == "keep-alive"
+    else:
+        keep_alive = connection != "close"
+    return method, target, body, keep_alive
+
+
+def _response(status: HTTPStatus, payload: dict, keep_alive: bool) -> bytes:
+    """
+    Renders an HTTP/1.1 JSON response.
+
+    Args:
+        status (HTTPStatus): Status of the response.
+        payload (dict): JSON payload.
+        keep_alive (bool): Whether the connection stays open.
+
+    Returns:
+        bytes: Response.
+    """
+    body = _ENCODER.encode(payload).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+    )
+    if status == HTTPStatus.SERVICE_UNAVAILABLE:
+        head += "Retry-After: 1\r\n"
+    return head.encode("latin-1") + b"\r\n" + body
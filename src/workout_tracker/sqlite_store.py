@@ -0,0 +1,735 @@
+from __future__ import annotations
+
+import os
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import count
+from typing import TypeVar
+
+from workout_tracker.exercise import AnyExercise, Exercise
+from workout_tracker.measurement import (
+    SI_DIGITS,
+    UNIT_CODES,
+    UNIT_CONVERSIONS,
+    UNITS_BY_CODE,
+    Distance,
+    Measurement,
+    Weight,
+)
+from workout_tracker.movements import canonical_name
+from workout_tracker.workout import Amrap, Workout
+
+Record = AnyExercise | Workout
+M = TypeVar("M", bound=Measurement)
+
+DEFAULT_POOL_SIZE = 4
+
+_INTEGRAL = 0x80
+
+_EXERCISE = 0
+_AMRAP = 1
+
+_BUY_IN = 1
+_BUY_OUT = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workouts (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER REFERENCES workouts (id),
+    role INTEGER,
+    day INTEGER,
+    kind INTEGER NOT NULL,
+    duration REAL,
+    repeats INTEGER,
+    rest REAL
+);
+CREATE TABLE IF NOT EXISTS exercises (
+    id INTEGER PRIMARY KEY,
+    workout_id INTEGER NOT NULL REFERENCES workouts (id),
+    parent_id INTEGER REFERENCES exercises (id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    reps INTEGER,
+    weight REAL,
+    weight_unit INTEGER,
+    duration REAL,
+    distance REAL,
+    distance_unit INTEGER,
+    height REAL,
+    height_unit INTEGER
+);
+CREATE INDEX IF NOT EXISTS workouts_by_day ON workouts (day);
+CREATE INDEX IF NOT EXISTS workouts_by_parent ON workouts (parent_id);
+CREATE INDEX IF NOT EXISTS exercises_by_workout ON exercises (workout_id);
+CREATE INDEX IF NOT EXISTS exercises_by_name ON exercises (name, weight);
+"""
+
+_INSERT_WORKOUT = "INSERT INTO workouts VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_EXERCISE = (
+    "INSERT INTO exercises VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_WORKOUT_COLUMNS = "id, parent_id, role, day, kind, duration, repeats, rest"
+_EXERCISE_COLUMNS = (
+    "id, workout_id, parent_id, name, reps, weight, weight_unit, duration, "
+    "distance, distance_unit, height, height_unit"
+)
+
+
+@dataclass
+class _Rows:
+    """
+    Rows of records to insert in one transaction.
+    """
+
+    workout_ids: Iterator[int]
+    exercise_ids: Iterator[int]
+    workouts: list[tuple]
+    exercises: list[tuple]
+
+
+class ConnectionPool:
+    """
+    Fixed size pool of SQLite connections shared between threads.
+    """
+
+    def __init__(self, path: str | os.PathLike, size: int) -> None:
+        """
+        Fixed size pool of SQLite connections shared between threads.
+
+        Args:
+            path (str | os.PathLike): Path of the database.
+            size (int): Number of connections.
+        """
+        self._connections: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(size):
+            self._connections.put(
+                sqlite3.connect(path, check_same_thread=False)
+            )
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrows a connection, waiting until one is free.
+
+        Yields:
+            sqlite3.Connection: Connection for the duration of the block.
+        """
+        connection = self._connections.get()
+        try:
+            yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        """
+        Closes all idle connections.
+        """
+        while not self._connections.empty():
+            self._connections.get_nowait().close()
+
+
+class WorkoutRepository:
+    """
+    SQLite repository for exercises and AMRAP workouts.
+
+    Writes go through a single connection in one transaction per call.
+    Reads borrow connections from a pool and run concurrently with writes
+    thanks to the write-ahead log.
+
+    Every stored record is a row of the workouts table: a single exercise
+    (kind 0) or an AMRAP (kind 1) with its duration, repeats and rest in
+    seconds. Buy-in and buy-out workouts are child rows referencing their
+    parent. Exercises are rows of the exercises table referencing their
+    workout, sub exercises of complexes additionally reference their
+    complex.
+
+    Measurements are stored in SI units (kg and m) next to the code of
+    their original unit from UNIT_CODES, so that loads can be compared
+    across units by an index while the original unit is restored on
+    reading. The high bit of the unit code marks integral values.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike, pool_size: int = DEFAULT_POOL_SIZE
+    ) -> None:
+        """
+        SQLite repository for exercises and AMRAP workouts.
+
+        Args:
+            path (str | os.PathLike): Path of the database.
+            pool_size (int): Number of read connections.
+                Defaults to DEFAULT_POOL_SIZE.
+        """
+        self._writer = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._writer.executescript(_SCHEMA)
+        self._write_lock = threading.Lock()
+        self._pool = ConnectionPool(path, pool_size)
+
+    def close(self) -> None:
+        """
+        Closes all connections.
+        """
+        self._pool.close()
+        self._writer.close()
+
+    def __enter__(self) -> WorkoutRepository:
+        """
+        Uses the repository as context manager.
+
+        Returns:
+            WorkoutRepository: The open repository.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Closes all connections when leaving the context.
+
+        Args:
+            *exc_info (object): Exception type, value and traceback,
+                ignored.
+        """
+        self.close()
+
+    def add(self, record: Record, day: date | None = None) -> int:
+        """
+        Stores an exercise or workout.
+
+        Args:
+            record (Record): Exercise or workout.
+            day (date | None): Date of the record. Defaults to None.
+
+        Returns:
+            int: Id of the stored record.
+        """
+        return self.extend([(day, record)])[0]
+
+    def extend(
+        self, records: Iterable[tuple[date | None, Record]]
+    ) -> list[int]:
+        """
+        Stores dated exercises or workouts in a single transaction with
+        one bulk insert per table.
+
+        Args:
+            records (Iterable[tuple[date | None, Record]]): Dates and
+                exercises or workouts.
+
+        Returns:
+            list[int]: Ids of the stored records.
+        """
+        records = list(records)
+        with self._write_lock:
+            cursor = self._writer.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                rows = _Rows(
+                    workout_ids=count(_next_id(cursor, "workouts")),
+                    exercise_ids=count(_next_id(cursor, "exercises")),
+                    workouts=[],
+                    exercises=[],
+                )
+                ids = [
+                    _add_workout_rows(rows, record, day)
+                    for day, record in records
+                ]
+                cursor.executemany(_INSERT_WORKOUT, rows.workouts)
+                cursor.executemany(_INSERT_EXERCISE, rows.exercises)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+        return ids
+
+    def get(self, record_id: int) -> tuple[date | None, Record]:
+        """
+        Loads a stored record.
+
+        Args:
+            record_id (int): Id of the record.
+
+        Raises:
+            KeyError: If there is no record with the id.
+
+        Returns:
+            tuple[date | None, Record]: Date and exercise or workout.
+        """
+        records = self._load("id = ? AND parent_id IS NULL", (record_id,))
+        if not records:
+            raise KeyError(record_id)
+        return records[0]
+
+    def __iter__(self) -> Iterator[tuple[date | None, Record]]:
+        """
+        Iterates over all stored records in insertion order.
+
+        Returns:
+            Iterator[tuple[date | None, Record]]: Dates and records.
+        """
+        return iter(self._load("parent_id IS NULL", ()))
+
+    def query(  # pylint: disable=too-many-arguments
+        self,
+        name: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        min_load: Weight | None = None,
+        max_load: Weight | None = None,
+    ) -> list[tuple[date | None, Exercise]]:
+        """
+        Finds exercises by name, date and load range through the indexes.
+
+        Exercises within AMRAPs match as well. Complexes match by their
+        complex name, e.g. "1 Clean + 1 Jerk".
+
+        Args:
+            name (str | None): Exercise name. Defaults to None.
+            start (date | None): First date, inclusive. Defaults to None.
+            end (date | None): Last date, inclusive. Defaults to None.
+            min_load (Weight | None): Lightest load, inclusive.
+                Defaults to None.
+            max_load (Weight | None): Heaviest load, inclusive.
+                Defaults to None.
+
+        Returns:
+            list[tuple[date | None, Exercise]]: Dates and exercises in
+                insertion order.
+        """
+        conditions = ["exercises.parent_id IS NULL"]
+        parameters: list[object] = []
+        for condition, parameter in (
+            ("name = ?", _normalize(name)),
+            ("day >= ?", start.toordinal() if start else None),
+            ("day <= ?", end.toordinal() if end else None),
+            ("weight >= ?", _si_key(min_load)),
+            ("weight <= ?", _si_key(max_load)),
+        ):
+            if parameter is not None:
+                conditions.append(condition)
+                parameters.append(parameter)
+        where = " AND ".join(conditions)
+        with self._pool.connection() as connection:
+            rows = connection.execute(
+                f"SELECT day, exercises.id FROM exercises "  # nosec B608
+                f"JOIN workouts ON workouts.id = workout_id "
+                f"WHERE {where} ORDER BY exercises.id",
+                parameters,
+            ).fetchall()
+            exercises, _ = _load_exercises(
+                connection, "id", [row[1] for row in rows]
+            )
+        return [
+            (_to_date(day), exercises[exercise_id])
+            for day, exercise_id in rows
+        ]
+
+    def _load(
+        self, where: str, parameters: tuple
+    ) -> list[tuple[date | None, Record]]:
+        """
+        Loads the top-level records selected by a condition on workouts.
+
+        Args:
+            where (str): SQL condition on the workouts table.
+            parameters (tuple): Parameters of the condition.
+
+        Returns:
+            list[tuple[date | None, Record]]: Dates and records.
+        """
+        with self._pool.connection() as connection:
+            roots = connection.execute(
+                f"SELECT {_WORKOUT_COLUMNS} FROM workouts "  # nosec B608
+                f"WHERE {where} ORDER BY id",
+                parameters,
+            ).fetchall()
+            workouts = {row[0]: row for row in roots}
+            level = list(workouts)
+            while level:
+                children = _select_in(
+                    connection, _SELECT_WORKOUTS, "parent_id", level
+                )
+                workouts.update((row[0], row) for row in children)
+                level = [row[0] for row in children]
+            exercises, workout_ids = _load_exercises(
+                connection, "workout_id", list(workouts)
+            )
+
+        builder = _WorkoutBuilder(workouts)
+        for exercise_id, exercise in exercises.items():
+            builder.exercises_of.setdefault(
+                workout_ids[exercise_id], []
+            ).append(exercise)
+        return [(_to_date(row[3]), builder.build(row[0])) for row in roots]
+
+
+class _WorkoutBuilder:
+    """
+    Assembles loaded workout and exercise rows into records.
+    """
+
+    def __init__(self, workouts: dict[int, tuple]) -> None:
+        """
+        Assembles loaded workout and exercise rows into records.
+
+        Args:
+            workouts (dict[int, tuple]): Workout rows by id. Exercise rows
+                are added to exercises_of before building.
+        """
+        self.workouts = workouts
+        self.exercises_of: dict[int, list[Exercise]] = {}
+        self.children_of: dict[int, dict[int, int]] = {}
+        for row in workouts.values():
+            if row[1] is not None:
+                self.children_of.setdefault(row[1], {})[row[2]] = row[0]
+
+    def build(self, workout_id: int) -> Record:
+        """
+        Assembles a record.
+
+        Args:
+            workout_id (int): Id of the workout row.
+
+        Returns:
+            Record: Exercise or workout.
+        """
+        _, _, _, _, kind, duration, repeats, rest = self.workouts[workout_id]
+        if kind == _EXERCISE:
+            return self.exercises_of[workout_id][0]
+        children = self.children_of.get(workout_id, {})
+        return Amrap(
+            duration=timedelta(seconds=duration),
+            exercises=self.exercises_of.get(workout_id, []),
+            buy_in=self._child(children, _BUY_IN),
+            repeats=repeats,
+            rest=None if rest is None else timedelta(seconds=rest),
+            buy_out=self._child(children, _BUY_OUT),
+        )
+
+    def _child(self, children: dict[int, int], role: int) -> Workout | None:
+        """
+        Assembles the buy-in or buy-out of a workout.
+
+        Args:
+            children (dict[int, int]): Child workout ids by role.
+            role (int): Role of the child.
+
+        Raises:
+            ValueError: If the child row holds no workout.
+
+        Returns:
+            Workout | None: Child workout or None.
+        """
+        if role not in children:
+            return None
+        child = self.build(children[role])
+        if not isinstance(child, Workout):
+            raise ValueError(f"Child row {children[role]} is no workout.")
+        return child
+
+
+def _next_id(cursor: sqlite3.Cursor, table: str) -> int:
+    """
+    Gets the next free id of a table.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor within the write transaction.
+        table (str): Table name.
+
+    Returns:
+        int: Next free id.
+    """
+    query = f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}"  # nosec B608
+    return cursor.execute(query).fetchone()[0]
+
+
+def _add_workout_rows(
+    rows: _Rows,
+    record: Record,
+    day: date | None,
+    parent_id: int | None = None,
+    role: int | None = None,
+) -> int:
+    """
+    Collects the rows of a record.
+
+    Args:
+        rows (_Rows): Rows to insert.
+        record (Record): Exercise or workout.
+        day (date | None): Date of the record.
+        parent_id (int | None): Id of the parent workout. Defaults to None.
+        role (int | None): Role within the parent workout. Defaults to None.
+
+    Raises:
+        TypeError: If the workout type is not supported.
+
+    Returns:
+        int: Id of the workout row.
+    """
+    workout_id = next(rows.workout_ids)
+    ordinal = day.toordinal() if day else None
+    if isinstance(record, AnyExercise):
+        rows.workouts.append(
+            (workout_id, parent_id, role, ordinal, _EXERCISE, None, None, None)
+        )
+        _add_exercise_rows(rows, record, workout_id, 0)
+        return workout_id
+    if not isinstance(record, Amrap):
+        raise TypeError(f"Cannot store workout of type {type(record)}.")
+    rows.workouts.append(
+        (
+            workout_id,
+            parent_id,
+            role,
+            ordinal,
+            _AMRAP,
+            record.duration.total_seconds(),
+            record.repeats,
+            record.rest.total_seconds() if record.rest is not None else None,
+        )
+    )
+    for position, exercise in enumerate(record.exercises):
+        _add_exercise_rows(rows, exercise, workout_id, position)
+    if record.buy_in is not None:
+        _add_workout_rows(rows, record.buy_in, day, workout_id, _BUY_IN)
+    if record.buy_out is not None:
+        _add_workout_rows(rows, record.buy_out, day, workout_id, _BUY_OUT)
+    return workout_id
+
+
+def _add_exercise_rows(
+    rows: _Rows,
+    exercise: AnyExercise,
+    workout_id: int,
+    position: int,
+    parent_id: int | None = None,
+) -> None:
+    """
+    Collects the rows of an exercise and its sub exercises.
+
+    Args:
+        rows (_Rows): Rows to insert.
+        exercise (AnyExercise): Exercise.
+        workout_id (int): Id of the workout row.
+        position (int): Position within the workout or complex.
+        parent_id (int | None): Id of the complex. Defaults to None.
+    """
+    exercise_id = next(rows.exercise_ids)
+    duration = exercise.duration
+    rows.exercises.append(
+        (
+            exercise_id,
+            workout_id,
+            parent_id,
+            position,
+            exercise.name,
+            exercise.reps,
+            *_measurement_columns(exercise.weight),
+            duration.total_seconds() if duration is not None else None,
+            *_measurement_columns(exercise.distance),
+            *_measurement_columns(exercise.height),
+        )
+    )
+    sub_exercises: Iterable[AnyExercise] = exercise.sub_exercises or ()
+    for sub_position, sub_exercise in enumerate(sub_exercises):
+        _add_exercise_rows(
+            rows, sub_exercise, workout_id, sub_position, exercise_id
+        )
+
+
+def _measurement_columns(
+    measurement: Measurement | None,
+) -> tuple[float | None, int | None]:
+    """
+    Converts a measurement to its SI value and unit code columns.
+
+    Args:
+        measurement (Measurement | None): Distance or weight.
+
+    Returns:
+        tuple[float | None, int | None]: SI value and unit code.
+    """
+    if measurement is None:
+        return None, None
+    code = UNIT_CODES[measurement.unit.name]
+    if isinstance(measurement.value, int):
+        code |= _INTEGRAL
+    return measurement.si_value, code
+
+
+def _measurement(
+    cls: type[M], si_value: float | None, code: int | None
+) -> M | None:
+    """
+    Restores a measurement in its original unit.
+
+    Args:
+        cls (type[M]): Distance or Weight.
+        si_value (float | None): Value in SI units.
+        code (int | None): Unit code.
+
+    Returns:
+        M | None: Distance or weight.
+    """
+    if si_value is None or code is None:
+        return None
+    unit = UNITS_BY_CODE[code & ~_INTEGRAL]
+    value: float = round(si_value / UNIT_CONVERSIONS[unit], SI_DIGITS)
+    if code & _INTEGRAL:
+        value = int(value)
+    return cls(value, unit)
+
+
+_SELECT_WORKOUTS = f"SELECT {_WORKOUT_COLUMNS} FROM workouts"
+_SELECT_EXERCISES = f"SELECT {_EXERCISE_COLUMNS} FROM exercises"
+
+# Stays below the default limit of SQLite host parameters per statement.
+_MAX_PARAMETERS = 900
+
+
+def _select_in(
+    connection: sqlite3.Connection,
+    select: str,
+    column: str,
+    values: list[int],
+    condition: str | None = None,
+) -> list[tuple]:
+    """
+    Selects the rows where a column takes one of the given values.
+
+    Args:
+        connection (sqlite3.Connection): Connection.
+        select (str): SELECT clause.
+        column (str): Column to match.
+        values (list[int]): Values to match.
+        condition (str | None): Additional condition. Defaults to None.
+
+    Returns:
+        list[tuple]: Rows ordered by id.
+    """
+    rows: list[tuple] = []
+    for first in range(0, len(values), _MAX_PARAMETERS):
+        last = first + _MAX_PARAMETERS
+        chunk = values[first:last]
+        where = f"{column} IN ({', '.join('?' * len(chunk))})"
+        if condition:
+            where += f" AND {condition}"
+        rows.extend(
+            connection.execute(f"{select} WHERE {where}", chunk)  # nosec B608
+        )
+    rows.sort()
+    return rows
+
+
+def _load_exercises(
+    connection: sqlite3.Connection, column: str, values: list[int]
+) -> tuple[dict[int, Exercise], dict[int, int]]:
+    """
+    Loads top-level exercises with their sub exercises.
+
+    Args:
+        connection (sqlite3.Connection): Connection.
+        column (str): Column to select the exercises by.
+        values (list[int]): Values to match.
+
+    Returns:
+        tuple[dict[int, Exercise], dict[int, int]]: Exercises and their
+            workout ids by exercise id, in id order.
+    """
+    rows = _select_in(
+        connection, _SELECT_EXERCISES, column, values, "parent_id IS NULL"
+    )
+    sub_rows = _select_in(
+        connection, _SELECT_EXERCISES, "parent_id", [row[0] for row in rows]
+    )
+    sub_exercises: dict[int, list[Exercise]] = {}
+    for row in sub_rows:
+        sub_exercises.setdefault(row[2], []).append(_exercise(row, None))
+    exercises = {
+        row[0]: _exercise(row, sub_exercises.get(row[0])) for row in rows
+    }
+    return exercises, {row[0]: row[1] for row in rows}
+
+
+def _exercise(row: tuple, sub_exercises: list[Exercise] | None) -> Exercise:
+    """
+    Restores an exercise from its row.
+
+    Args:
+        row (tuple): Exercise row.
+        sub_exercises (list[Exercise] | None): Sub exercises of a complex.
+
+    Returns:
+        Exercise: Exercise.
+    """
+    (
+        _,
+        _,
+        _,
+        name,
+        reps,
+        weight,
+        weight_unit,
+        duration,
+        distance,
+        distance_unit,
+        height,
+        height_unit,
+    ) = row
+    return Exercise(
+        name=name,
+        reps=reps,
+        weight=_measurement(Weight, weight, weight_unit),
+        duration=None if duration is None else timedelta(seconds=duration),
+        distance=_measurement(Distance, distance, distance_unit),
+        height=_measurement(Distance, height, height_unit),
+        sub_exercises=sub_exercises,
+    )
+
+
+def _normalize(name: str | None) -> str | None:
+    """
+    Normalizes an exercise name the way exercises normalize theirs.
+
+    Args:
+        name (str | None): Exercise name.
+
+    Returns:
+        str | None: Normalized name.
+    """
+    return None if name is None else canonical_name(name)
+
+
+def _si_key(weight: Weight | None) -> float | None:
+    """
+    Gets the SI value of an optional load.
+
+    Args:
+        weight (Weight | None): Load.
+
+    Returns:
+        float | None: Load in kg.
+    """
+    return None if weight is None else weight.si_value
+
+
+def _to_date(ordinal: int | None) -> date | None:
+    """
+    Converts a stored date ordinal.
+
+    Args:
+        ordinal (int | None): Proleptic Gregorian ordinal.
+
+    Returns:
+        date | None: Date.
+    """
+    return None if ordinal is None else date.fromordinal(ordinal)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import itertools
+import math
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+from typing import NamedTuple
+
+from workout_tracker.analytics import Movement, VolumeStats, iter_movements
+from workout_tracker.better_enum import BetterStrEnum
+from workout_tracker.exercise import Exercise
+from workout_tracker.plan import compile_plan
+from workout_tracker.workout import Amrap, Workout
+
+
+class EventKind(BetterStrEnum):
+    """
+    Class to store all kinds of timeline events
+    """
+
+    WORK = "work"
+    REST = "rest"
+
+
+class Event(NamedTuple):
+    """
+    Timed section of a workout.
+    """
+
+    start: timedelta
+    end: timedelta
+    kind: EventKind
+    workout: Amrap
+    repeat: int
+    depth: int = 0
+
+    @property
+    def duration(self) -> timedelta:
+        """
+        Get the length of the event.
+
+        Returns:
+            timedelta: Length of the event.
+        """
+        return self.end - self.start
+
+
+def total_duration(workout: Workout) -> timedelta:
+    """
+    Computes the length of a workout including rests, buy-in and buy-out.
+
+    Args:
+        workout (Workout): Workout to time.
+
+    Raises:
+        TypeError: If the workout type is not supported.
+
+    Returns:
+        timedelta: Length of the workout.
+    """
+    if not isinstance(workout, Amrap):
+        raise TypeError(f"Cannot time workout of type {type(workout)}.")
+    length = workout.duration * workout.repeats
+    if workout.rest is not None and workout.repeats > 1:
+        length += workout.rest * (workout.repeats - 1)
+    if workout.buy_in is not None:
+        length += total_duration(workout.buy_in)
+    if workout.buy_out is not None:
+        length += total_duration(workout.buy_out)
+    return length
+
+
+def timeline(
+    workout: Workout, start: timedelta = timedelta(0), depth: int = 0
+) -> Iterator[Event]:
+    """
+    Expands a workout lazily into its timed work and rest events.
+
+    The buy-in comes first, then one work window per repeat with a rest
+    between consecutive repeats, then the buy-out. Nested buy-in and
+    buy-out workouts are expanded in place with a depth one higher.
+
+    Args:
+        workout (Workout): Workout to expand.
+        start (timedelta): Offset of the workout. Defaults to 0.
+        depth (int): Nesting depth of the workout. Defaults to 0.
+
+    Raises:
+        TypeError: If the workout type is not supported.
+
+    Yields:
+        Event: Work and rest events in chronological order.
+    """
+    if not isinstance(workout, Amrap):
+        raise TypeError(f"Cannot expand workout of type {type(workout)}.")
+    offset = start
+    if workout.buy_in is not None:
+        yield from timeline(workout.buy_in, offset, depth + 1)
+        offset += total_duration(workout.buy_in)
+    for repeat in range(1, workout.repeats + 1):
+        if repeat > 1 and workout.rest:
+            end = offset + workout.rest
+            yield Event(offset, end, EventKind.REST, workout, repeat, depth)
+            offset = end
+        end = offset + workout.duration
+        yield Event(offset, end, EventKind.WORK, workout, repeat, depth)
+        offset = end
+    if workout.buy_out is not None:
+        yield from timeline(workout.buy_out, offset, depth + 1)
+
+
+def iter_rounds(amrap: Amrap) -> Iterator[tuple[int, Exercise]]:
+    """
+    Cycles endlessly through the exercises of an AMRAP, e.g. to show the
+    next movement on a timer. Slice the stream with itertools.islice.
+
+    Args:
+        amrap (Amrap): AMRAP workout.
+
+    Yields:
+        tuple[int, Exercise]: Round number starting at 1 and exercise.
+    """
+    for round_number in itertools.count(1):
+        for exercise in amrap.exercises:
+            yield round_number, exercise
+
+
+def round_reps(amrap: Amrap) -> int:
+    """
+    Counts the reps of one round as scored. Exercises without reps, e.g. a
+    run over a distance, count as a single rep.
+
+    Args:
+        amrap (Amrap): AMRAP workout.
+
+    Returns:
+        int: Reps per round.
+    """
+    return sum(exercise.reps or 1 for exercise in amrap.exercises)
+
+
+def score_volume(amrap: Amrap, rounds: int, reps: int = 0) -> VolumeStats:
+    """
+    Computes the volume of an AMRAP score in closed form.
+
+    The score of rounds plus extra reps applies to every repeat. Full
+    rounds are scaled from the volume of a single round and only the
+    partial round is walked, so the cost does not grow with the score.
+    Buy-in and buy-out count once in full. The workout is compiled once
+    into a flat plan, so repeated scores of it do not walk its tree.
+
+    Args:
+        amrap (Amrap): AMRAP workout.
+        rounds (int): Completed rounds per repeat.
+        reps (int): Reps into the next round. Defaults to 0.
+
+    Raises:
+        ValueError: If the score is negative or the extra reps complete
+            a round.
+
+    Returns:
+        VolumeStats: Volume of the score with the time under work.
+    """
+    if rounds < 0 or reps < 0:
+        raise ValueError("Score needs to be non-negative!")
+    if reps and reps >= round_reps(amrap):
+        raise ValueError("Extra reps need to be less than one round!")
+    plan = compile_plan(amrap)
+    movements = list(plan.movements(rounds=rounds))
+    for exercise, done in _partial_round(amrap.exercises, reps):
+        fraction = done / (exercise.reps or 1) * amrap.repeats
+        movements.extend(
+            movement._replace(
+                reps=movement.reps * fraction,
+                distance=movement.distance * fraction,
+                duration=movement.duration * fraction,
+            )
+            for movement in iter_movements(exercise)
+        )
+    return _sum_movements(movements, plan.work_time())
+
+
+def _partial_round(
+    exercises: Iterable[Exercise], reps: int
+) -> Iterator[tuple[Exercise, int]]:
+    """
+    Splits extra reps over the exercises of a round in order.
+
+    Args:
+        exercises (Iterable[Exercise]): Exercises of the round.
+        reps (int): Extra reps.
+
+    Yields:
+        tuple[Exercise, int]: Exercise and reps done of it.
+    """
+    for exercise in exercises:
+        if reps <= 0:
+            return
+        done = min(reps, exercise.reps or 1)
+        reps -= done
+        yield exercise, done
+
+
+def _sum_movements(movements: list[Movement], time: float) -> VolumeStats:
+    """
+    Sums flattened movements.
+
+    Args:
+        movements (list[Movement]): Flattened movements.
+        time (float): Time under work in seconds.
+
+    Returns:
+        VolumeStats: Summed volume.
+    """
+    return VolumeStats(
+        reps=math.fsum(movement.reps for movement in movements),
+        loaded_reps=math.fsum(
+            movement.reps for movement in movements if movement.load
+        ),
+        tonnage=math.fsum(
+            movement.reps * movement.load for movement in movements
+        ),
+        distance=math.fsum(movement.distance for movement in movements),
+        time=time,
+    )
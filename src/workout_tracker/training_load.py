@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import date
+from typing import NamedTuple, Self
+
+from workout_tracker.analytics import iter_movements
+from workout_tracker.exercise import AnyExercise
+from workout_tracker.movements import CATALOG, canonical_name
+from workout_tracker.workout import Workout
+
+SNAPSHOT_VERSION = 1
+
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+# Movements of the CATALOG are keyed by ID, others by name. The key None
+# sums all movements of an athlete.
+MovementKey = int | str | None
+
+
+class LoadMetrics(NamedTuple):
+    """
+    Training load of an athlete as of a day, in kg of tonnage.
+
+    The ratios are the acute chronic workload ratios of the rolling sums,
+    with the chronic sum scaled to the length of the acute window, and of
+    the exponentially weighted daily averages. They are None without any
+    chronic load.
+    """
+
+    acute: float
+    chronic: float
+    acute_ewma: float
+    chronic_ewma: float
+    ratio: float | None
+    ewma_ratio: float | None
+
+
+class _Window:
+    """
+    Rolling daily tonnage of one athlete and movement.
+
+    Daily sums are kept in a ring buffer over the chronic window, so that
+    moving to the next day drops a single bucket from the running sums.
+    The number of training days per window is tracked as well, and a sum
+    is reset to exactly zero once its window holds none, so that rounding
+    residue of the subtractions does not outlive a break.
+    The averages decay by a constant factor per day and include the load
+    of the current day so far.
+    """
+
+    __slots__ = (
+        "day",
+        "buckets",
+        "acute",
+        "chronic",
+        "acute_count",
+        "chronic_count",
+        "acute_ewma",
+        "chronic_ewma",
+    )
+
+    def __init__(self, day: int, chronic_days: int) -> None:
+        """
+        Rolling daily tonnage of one athlete and movement.
+
+        Args:
+            day (int): Ordinal of the current day.
+            chronic_days (int): Length of the chronic window.
+        """
+        self.day = day
+        self.buckets = array("d", bytes(8 * chronic_days))
+        self.acute = 0.0
+        self.chronic = 0.0
+        self.acute_count = 0
+        self.chronic_count = 0
+        self.acute_ewma = 0.0
+        self.chronic_ewma = 0.0
+
+    def advance(self, day: int, load: TrainingLoad) -> None:
+        """
+        Moves the window to a later day.
+
+        Args:
+            day (int): Ordinal of the day.
+            load (TrainingLoad): Aggregator with the window lengths.
+        """
+        if (gap := day - self.day) <= 0:
+            return
+        buckets = self.buckets
+        size = len(buckets)
+        if gap >= size:
+            self.buckets = array("d", bytes(8 * size))
+            self.acute_count = self.chronic_count = 0
+        else:
+            for current in range(self.day + 1, day + 1):
+                if dropped := buckets[(current - load.acute_days) % size]:
+                    self.acute -= dropped
+                    self.acute_count -= 1
+                if dropped := buckets[current % size]:
+                    self.chronic -= dropped
+                    self.chronic_count -= 1
+                    buckets[current % size] = 0.0
+        if not self.acute_count:
+            self.acute = 0.0
+        if not self.chronic_count:
+            self.chronic = 0.0
+        self.acute_ewma *= (1 - load.acute_decay) ** gap
+        self.chronic_ewma *= (1 - load.chronic_decay) ** gap
+        self.day = day
+
+    def add(self, tonnage: float, load: TrainingLoad) -> None:
+        """
+        Adds tonnage to the current day.
+
+        Args:
+            tonnage (float): Tonnage in kg.
+            load (TrainingLoad): Aggregator with the decay factors.
+        """
+        index = self.day % len(self.buckets)
+        if not self.buckets[index]:
+            self.acute_count += 1
+            self.chronic_count += 1
+        self.buckets[index] += tonnage
+        self.acute += tonnage
+        self.chronic += tonnage
+        self.acute_ewma += load.acute_decay * tonnage
+        self.chronic_ewma += load.chronic_decay * tonnage
+
+
+class TrainingLoad:
+    """
+    Incremental rolling training load per athlete and movement.
+
+    Fed by a stream of dated exercises and workouts, it keeps the tonnage
+    of an acute and a chronic window and exponentially weighted averages
+    of the daily tonnage, so that every update and query costs the same
+    regardless of the length of the history. Loads are converted to kg by
+    the measurements, and aliases of a movement count for the same one.
+
+    Records need to arrive in order of their days. Days without training
+    decay the loads when the next record or advance moves time forward.
+
+    Attributes:
+        acute_days (int): Length of the acute window.
+        chronic_days (int): Length of the chronic window.
+        acute_decay (float): Daily weight of the acute average.
+        chronic_decay (float): Daily weight of the chronic average.
+    """
+
+    def __init__(
+        self, acute_days: int = ACUTE_DAYS, chronic_days: int = CHRONIC_DAYS
+    ) -> None:
+        """
+        Incremental rolling training load per athlete and movement.
+
+        Args:
+            acute_days (int): Length of the acute window.
+                Defaults to ACUTE_DAYS.
+            chronic_days (int): Length of the chronic window.
+                Defaults to CHRONIC_DAYS.
+
+        Raises:
+            ValueError: If the acute window is not within the chronic one.
+        """
+        if not 0 < acute_days <= chronic_days:
+            raise ValueError(
+                "The acute window needs to be within the chronic window!"
+            )
+        self.acute_days = acute_days
+        self.chronic_days = chronic_days
+        self.acute_decay = 2 / (acute_days + 1)
+        self.chronic_decay = 2 / (chronic_days + 1)
+        self._day: int | None = None
+        self._windows: dict[tuple[str, MovementKey], _Window] = {}
+
+    def __len__(self) -> int:
+        """
+        Number of tracked athlete and movement windows.
+
+        Returns:
+            int: Number of windows.
+        """
+        return len(self._windows)
+
+    @property
+    def day(self) -> date | None:
+        """
+        Latest day of the stream.
+
+        Returns:
+            date | None: Latest day or None before the first record.
+        """
+        return None if self._day is None else date.fromordinal(self._day)
+
+    def advance(self, day: date) -> None:
+        """
+        Moves the stream to a day, e.g. today before reading the metrics.
+
+        Args:
+            day (date): Day on or after the latest day.
+
+        Raises:
+            ValueError: If the day is before the latest day.
+        """
+        ordinal = day.toordinal()
+        if self._day is not None and ordinal < self._day:
+            raise ValueError(f"Days need to be in order, {day} is too early.")
+        self._day = ordinal
+
+    def add(
+        self,
+        record: AnyExercise | Workout,
+        day: date,
+        athlete: str = "",
+        rounds: float = 1,
+    ) -> None:
+        """
+        Adds the tonnage of an exercise or workout.
+
+        Args:
+            record (AnyExercise | Workout): Exercise or workout.
+            day (date): Date of the record.
+            athlete (str): Name of the athlete. Defaults to "".
+            rounds (float): Completed rounds of AMRAP workouts.
+                Defaults to 1.
+
+        Raises:
+            ValueError: If the day is before the latest day.
+            TypeError: If the workout type is not supported.
+        """
+        self.advance(day)
+        for movement in iter_movements(record, rounds=rounds):
+            if not (tonnage := movement.reps * movement.load):
+                continue
+            for key in (_movement_key(movement.name), None):
+                self._window(athlete, key).add(tonnage, self)
+
+    def extend(
+        self,
+        records: Iterable[tuple[date, AnyExercise | Workout]],
+        athlete: str = "",
+    ) -> None:
+        """
+        Adds dated exercises or workouts in order.
+
+        Args:
+            records (Iterable[tuple[date, AnyExercise | Workout]]): Dates and
+                exercises or workouts.
+            athlete (str): Name of the athlete. Defaults to "".
+
+        Raises:
+            ValueError: If the days are not in order.
+        """
+        for day, record in records:
+            self.add(record, day, athlete=athlete)
+
+    def _window(self, athlete: str, key: MovementKey) -> _Window:
+        """
+        Gets a window moved to the latest day, creating it if needed.
+
+        Args:
+            athlete (str): Name of the athlete.
+            key (MovementKey): Key of the movement.
+
+        Returns:
+            _Window: Window of the athlete and movement.
+        """
+        day = self._day or 0
+        if (window := self._windows.get((athlete, key))) is None:
+            window = self._windows[athlete, key] = _Window(
+                day, self.chronic_days
+            )
+        window.advance(day, self)
+        return window
+
+    def metrics(
+        self, athlete: str = "", movement: str | None = None
+    ) -> LoadMetrics:
+        """
+        Gets the training load as of the latest day.
+
+        Args:
+            athlete (str): Name of the athlete. Defaults to "".
+            movement (str | None): Name or alias of a movement. Defaults
+                to None for all movements.
+
+        Returns:
+            LoadMetrics: Training load, zero for unknown athletes.
+        """
+        key = None if movement is None else _movement_key(movement)
+        if (athlete, key) not in self._windows:
+            return LoadMetrics(0.0, 0.0, 0.0, 0.0, None, None)
+        return self._metrics(self._window(athlete, key))
+
+    def _metrics(self, window: _Window) -> LoadMetrics:
+        """
+        Computes the metrics of a window.
+
+        Args:
+            window (_Window): Window moved to the latest day.
+
+        Returns:
+            LoadMetrics: Training load.
+        """
+        acute, chronic = window.acute, window.chronic
+        acute_ewma, chronic_ewma = window.acute_ewma, window.chronic_ewma
+        scale = self.chronic_days / self.acute_days
+        return LoadMetrics(
+            acute,
+            chronic,
+            acute_ewma,
+            chronic_ewma,
+            acute * scale / chronic if chronic > 0 else None,
+            acute_ewma / chronic_ewma if chronic_ewma > 0 else None,
+        )
+
+    def by_movement(self, athlete: str = "") -> dict[int | str, LoadMetrics]:
+        """
+        Gets the training load of an athlete per movement.
+
+        Args:
+            athlete (str): Name of the athlete. Defaults to "".
+
+        Returns:
+            dict[int | str, LoadMetrics]: Training load per movement ID,
+                or name for movements missing in the CATALOG.
+        """
+        return {
+            key: self._metrics(self._window(athlete, key))
+            for name, key in list(self._windows)
+            if name == athlete and key is not None
+        }
+
+    def athletes(self) -> Iterator[str]:
+        """
+        Iterates over the names of the athletes.
+
+        Returns:
+            Iterator[str]: Names of the athletes.
+        """
+        return (athlete for athlete, key in self._windows if key is None)
+
+    def snapshot(self) -> dict:
+        """
+        Represents the aggregator as JSON serializable dictionary.
+
+        Returns:
+            dict: Snapshot of all windows.
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "acute_days": self.acute_days,
+            "chronic_days": self.chronic_days,
+            "day": self.day.isoformat() if self.day else None,
+            "windows": [
+                [
+                    athlete,
+                    key,
+                    window.day,
+                    window.acute_ewma,
+                    window.chronic_ewma,
+                    window.buckets.tolist(),
+                ]
+                for (athlete, key), window in self._windows.items()
+            ],
+        }
+
+    @classmethod
+    def restore(cls, snapshot: dict) -> Self:
+        """
+        Rebuilds an aggregator from a snapshot.
+
+        Args:
+            snapshot (dict): Snapshot created by snapshot.
+
+        Raises:
+            ValueError: If the snapshot version is not supported.
+
+        Returns:
+            Self: Restored aggregator.
+        """
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {snapshot.get('version')}."
+            )
+        load = cls(snapshot["acute_days"], snapshot["chronic_days"])
+        if day := snapshot["day"]:
+            load.advance(date.fromisoformat(day))
+        for athlete, key, day, acute, chronic, buckets in snapshot["windows"]:
+            window = _Window(day, load.chronic_days)
+            window.buckets = array("d", buckets)
+            size = len(buckets)
+            acute_buckets = [
+                buckets[(day - offset) % size]
+                for offset in range(load.acute_days)
+            ]
+            window.chronic = math.fsum(buckets)
+            window.acute = math.fsum(acute_buckets)
+            window.chronic_count = sum(map(bool, buckets))
+            window.acute_count = sum(map(bool, acute_buckets))
+            window.acute_ewma = acute
+            window.chronic_ewma = chronic
+            load._windows[athlete, key] = window
+        return load
+
+
+def _movement_key(name: str) -> int | str:
+    """
+    Gets the key of a movement.
+
+    Args:
+        name (str): Name or alias of the movement.
+
+    Returns:
+        int | str: ID in the CATALOG or the normalized name.
+    """
+    movement_id = CATALOG.lookup(name)
+    return canonical_name(name) if movement_id is None else movement_id
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import csv
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator
+from datetime import timedelta
+from typing import Any
+
+from workout_tracker.duration import UNIT_SECONDS, parse_duration
+from workout_tracker.exercise import Exercise
+from workout_tracker.jsonl import RECORD_ERRORS, RecordError, log_record_error
+from workout_tracker.measurement import (
+    UNIT_ALIASES,
+    Distance,
+    DistanceUnit,
+    Weight,
+    WeightUnit,
+)
+from workout_tracker.workout import Amrap
+
+CSV_FIELDS = ("name", "reps", "weight", "duration", "distance", "height")
+
+_TOKEN_PATTERN = re.compile(
+    r"(?P<clock>\d+:\d{2}(?::\d{2})?(?:\.\d+)?)"
+    r"|(?P<number>\d+(?:\.\d+)?)"
+    r"|(?P<plus>\+)"
+    r"|(?P<word>[^\s+\d][^\s+]*)"
+)
+_AMRAP_PATTERN = re.compile(
+    r"\s*(?:amrap\s+(?:in\s+)?(?P<after>.+?)|(?P<before>.+?)\s+amrap)\s*:?\s*",
+    re.IGNORECASE,
+)
+
+# Parsed tokens are (kind, value) pairs with the kinds below.
+_REPS = "reps"
+_WORD = "word"
+_PLUS = "plus"
+_DURATION = "duration"
+_WEIGHT = "weight"
+_DISTANCE = "distance"
+
+Token = tuple[str, Any]
+
+
+def tokenize(line: str) -> list[Token]:
+    """
+    Splits a line into tokens in a single pass.
+
+    Numbers followed by a unit of the measurement tables become weights
+    or distances, numbers followed by a time unit and clock times become
+    durations, and other numbers become reps.
+
+    Args:
+        line (str): Line of whiteboard text.
+
+    Raises:
+        ValueError: If reps are no integer or a duration is invalid.
+
+    Returns:
+        list[Token]: Kinds and values of the tokens.
+    """
+    tokens: list[Token] = []
+    number = None
+    for match in _TOKEN_PATTERN.finditer(line):
+        kind = match.lastgroup
+        text = match.group()
+        if number is not None:
+            if kind == _WORD and (quantity := _quantity(number, text)):
+                tokens.append(quantity)
+                number = None
+                continue
+            tokens.append((_REPS, int(number)))
+            number = None
+        if kind == "number":
+            number = text
+        elif kind == "clock":
+            tokens.append((_DURATION, parse_duration(text)))
+        else:
+            tokens.append((kind, text))
+    if number is not None:
+        tokens.append((_REPS, int(number)))
+    return tokens
+
+
+def _quantity(number: str, unit: str) -> Token | None:
+    """
+    Builds a quantity token from a number and a unit. Units of the
+    measurement tables take precedence, so "400 m" is a distance.
+
+    Args:
+        number (str): Number text.
+        unit (str): Word following the number.
+
+    Raises:
+        ValueError: If a duration is out of range.
+
+    Returns:
+        Token | None: Weight, distance or duration token or None if the
+            word is no unit.
+    """
+    if (member := UNIT_ALIASES.get(unit)) is None:
+        member = UNIT_ALIASES.get(unit.lower())
+    if isinstance(member, WeightUnit):
+        return _WEIGHT, Weight(float(number), member)
+    if isinstance(member, DistanceUnit):
+        return _DISTANCE, Distance(float(number), member)
+    if (seconds := UNIT_SECONDS.get(unit.lower())) is not None:
+        try:
+            return _DURATION, timedelta(seconds=int(number) * seconds)
+        except OverflowError as error:
+            raise ValueError(
+                f"The duration {number} {unit} is too long."
+            ) from error
+    return None
+
+
+def _split(tokens: list[Token]) -> list[tuple[list, list[str], list]]:
+    """
+    Splits tokens at "+" into segments of leading quantities, name words
+    and trailing quantities.
+
+    Args:
+        tokens (list[Token]): Tokens of a line.
+
+    Raises:
+        ValueError: If a segment has no name or a split name.
+
+    Returns:
+        list[tuple[list, list[str], list]]: Leading tokens, name words and
+            trailing tokens per segment.
+    """
+    segments = []
+    leading: list[Token] = []
+    words: list[str] = []
+    trailing: list[Token] = []
+    for kind, value in [*tokens, (_PLUS, "+")]:
+        if kind == _PLUS:
+            if not words:
+                raise ValueError("Every exercise needs a name.")
+            segments.append((leading, words, trailing))
+            leading, words, trailing = [], [], []
+        elif kind == _WORD:
+            if trailing:
+                raise ValueError(f"Unexpected name part {value!r}.")
+            words.append(value)
+        elif words:
+            trailing.append((kind, value))
+        else:
+            leading.append((kind, value))
+    return segments
+
+
+def _assign(
+    fields: dict[str, Any], tokens: list[Token], leading: bool
+) -> None:
+    """
+    Assigns quantity tokens to the fields of an exercise. Distances before
+    the name are distances and distances after the name are heights.
+
+    Args:
+        fields (dict[str, Any]): Fields of the exercise.
+        tokens (list[Token]): Quantity tokens.
+        leading (bool): Whether the tokens precede the name.
+
+    Raises:
+        ValueError: If a field is given twice or reps follow the name.
+    """
+    for kind, value in tokens:
+        key = kind
+        if kind == _DISTANCE and not leading:
+            key = "height"
+        elif kind == _REPS and not leading:
+            raise ValueError(f"Unexpected number {value} after the name.")
+        if key in fields:
+            raise ValueError(f"The {key} is given twice.")
+        fields[key] = value
+
+
+def _sub_exercise(
+    leading: list[Token], words: list[str], trailing: list[Token]
+) -> dict[str, Any]:
+    """
+    Gets the fields of an exercise of a complex.
+
+    Args:
+        leading (list[Token]): Tokens before the name.
+        words (list[str]): Name words.
+        trailing (list[Token]): Tokens after the name.
+
+    Raises:
+        ValueError: If the tokens are not just the reps.
+
+    Returns:
+        dict[str, Any]: Name and reps.
+    """
+    if trailing or len(leading) != 1 or leading[0][0] != _REPS:
+        raise ValueError("Exercises of a complex need reps and a name only.")
+    return {"name": " ".join(words), "reps": leading[0][1]}
+
+
+def parse_line(line: str) -> Exercise:
+    """
+    Parses an exercise from its text, the inverse of str(exercise).
+
+    Expects "duration reps distance name weight height" with any of the
+    quantities left out, e.g. "5 Back Squat 100 kg" or "400 m Run". Units
+    may be given by any of their aliases. Complexes join their exercises
+    with "+", e.g. "5 3 Clean + 1 Jerk 50 lb" for 5 rounds of the complex.
+    Names starting with a unit like "M" or "In" cannot follow a number.
+
+    Args:
+        line (str): Text of the exercise.
+
+    Raises:
+        ValueError: If the text is no valid exercise.
+
+    Returns:
+        Exercise: Parsed exercise.
+    """
+    segments = _split(tokenize(line))
+    fields: dict[str, Any] = {}
+    if len(segments) == 1:
+        leading, words, trailing = segments[0]
+        _assign(fields, leading, leading=True)
+        _assign(fields, trailing, leading=False)
+        return Exercise(name=" ".join(words), **fields)
+
+    # The quantities before the reps of the first exercise and after the
+    # name of the last exercise belong to the complex.
+    leading, words, trailing = segments[0]
+    _assign(fields, leading[:-1], leading=True)
+    segments[0] = (leading[-1:], words, trailing)
+    leading, words, trailing = segments[-1]
+    _assign(fields, trailing, leading=False)
+    segments[-1] = (leading, words, [])
+    sub_exercises = [
+        Exercise(**_sub_exercise(*segment)) for segment in segments
+    ]
+    return Exercise(name=None, sub_exercises=sub_exercises, **fields)
+
+
+def parse_amrap_header(line: str) -> timedelta | None:
+    """
+    Parses an AMRAP header like "20 min AMRAP" or "AMRAP in 12:00".
+
+    Args:
+        line (str): Line of whiteboard text.
+
+    Raises:
+        ValueError: If the line is a header with an invalid duration.
+
+    Returns:
+        timedelta | None: Duration of the AMRAP or None for other lines.
+    """
+    if "amrap" not in line.lower():
+        return None
+    if not (match := _AMRAP_PATTERN.fullmatch(line)):
+        return None
+    return parse_duration(match["after"] or match["before"])
+
+
+def iter_parse(
+    lines: Iterable[str],
+    on_error: Callable[[RecordError], None] | None = None,
+) -> Iterator[Exercise | Amrap]:
+    """
+    Lazily parses whiteboard text into exercises and AMRAP workouts.
+
+    Each line holds one exercise as parsed by parse_line. An AMRAP header
+    starts a workout that collects the exercises of the following lines
+    until an empty line, the next header or the end of the text. Lines
+    starting with "#" are comments.
+
+    Invalid lines do not stop the stream. They are passed to on_error and
+    skipped.
+
+    Args:
+        lines (Iterable[str]): Lines of whiteboard text.
+        on_error (Callable[[RecordError], None] | None): Called for every
+            invalid line. Defaults to logging a warning.
+
+    Yields:
+        Exercise | Amrap: Exercises outside of AMRAPs and AMRAP workouts.
+    """
+    handle_error = on_error or log_record_error
+    amrap = None
+    for line_number, line in enumerate(lines, start=1):
+        text = line.strip()
+        if not text:
+            if amrap is not None:
+                yield amrap
+                amrap = None
+            continue
+        if text.startswith("#"):
+            continue
+        try:
+            if (duration := parse_amrap_header(text)) is not None:
+                if amrap is not None:
+                    yield amrap
+                amrap = Amrap(duration=duration, exercises=[])
+                continue
+            exercise = parse_line(text)
+        except RECORD_ERRORS as error:
+            handle_error(RecordError(line_number, text, error))
+            continue
+        if amrap is None:
+            yield exercise
+        else:
+            amrap.exercises.append(exercise)
+    if amrap is not None:
+        yield amrap
+
+
+def iter_parse_file(
+    path: str | os.PathLike,
+    on_error: Callable[[RecordError], None] | None = None,
+) -> Iterator[Exercise | Amrap]:
+    """
+    Lazily parses a whiteboard text file, see iter_parse.
+
+    Args:
+        path (str | os.PathLike): Path of the text file.
+        on_error (Callable[[RecordError], None] | None): Called for every
+            invalid line. Defaults to logging a warning.
+
+    Yields:
+        Exercise | Amrap: Exercises outside of AMRAPs and AMRAP workouts.
+    """
+    with open(path, encoding="utf-8") as file:
+        yield from iter_parse(file, on_error=on_error)
+
+
+def iter_parse_csv(
+    lines: Iterable[str],
+    on_error: Callable[[RecordError], None] | None = None,
+) -> Iterator[Exercise]:
+    """
+    Lazily parses CSV rows with a header of the CSV_FIELDS in any order.
+
+    Cells hold the values of Exercise.to_dict. Empty cells are left out.
+    Names of complexes list their exercises like "3 Clean + 1 Jerk".
+
+    Args:
+        lines (Iterable[str]): Lines of CSV text including the header.
+        on_error (Callable[[RecordError], None] | None): Called for every
+            invalid row. Defaults to logging a warning.
+
+    Yields:
+        Exercise: Exercise of each valid row.
+    """
+    handle_error = on_error or log_record_error
+    reader = csv.DictReader(lines)
+    for row in reader:
+        try:
+            yield _parse_row(row)
+        except RECORD_ERRORS as error:
+            line = ",".join(value or "" for value in row.values())
+            handle_error(RecordError(reader.line_num, line, error))
+
+
+def _parse_row(row: dict[str, str]) -> Exercise:
+    """
+    Parses a CSV row into an exercise.
+
+    Args:
+        row (dict[str, str]): Cells by column name.
+
+    Returns:
+        Exercise: Parsed exercise.
+    """
+    exercise_dict: dict[str, Any] = {
+        key: value for key in CSV_FIELDS if (value := row.get(key))
+    }
+    if "reps" in exercise_dict:
+        exercise_dict["reps"] = int(exercise_dict["reps"])
+    if "+" in exercise_dict.get("name", ""):
+        segments = _split(tokenize(exercise_dict["name"]))
+        exercise_dict["name"] = None
+        exercise_dict["sub_exercises"] = [
+            _sub_exercise(*segment) for segment in segments
+        ]
+    return Exercise.from_dict(exercise_dict)
@@ -0,0 +1,173 @@
+from datetime import date, timedelta
+
+import pytest
+
+from workout_tracker.analytics import (
+    Movement,
+    VolumeStats,
+    VolumeTable,
+    iter_movements,
+    work_time,
+)
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import Distance, Weight
+from workout_tracker.movements import CATALOG
+from workout_tracker.workout import Amrap
+
+
+@pytest.fixture
+def complex_exercise():
+    return Exercise(
+        name=None,
+        reps=5,
+        weight=Weight(50, "lb"),
+        sub_exercises=[
+            Exercise(name="Clean", reps=3),
+            Exercise(name="Jerk", reps=1),
+        ],
+    )
+
+
+@pytest.fixture
+def amrap():
+    return Amrap(
+        duration=timedelta(minutes=10),
+        exercises=[
+            Exercise(name="Run", reps=2, distance=Distance(200, "m")),
+            Exercise(
+                name="Kettlebell Swing", reps=10, weight=Weight(24, "kg")
+            ),
+        ],
+        repeats=2,
+        buy_in=Amrap(
+            duration=timedelta(minutes=2),
+            exercises=[Exercise(name="Burpee", reps=10)],
+        ),
+    )
+
+
+def test_iter_movements_complex(complex_exercise):
+    assert list(iter_movements(complex_exercise)) == [
+        Movement("Clean", 15, 50 * 0.45359237, 0, 0),
+        Movement("Jerk", 5, 50 * 0.45359237, 0, 0),
+    ]
+
+
+def test_iter_movements_amrap(amrap):
+    assert list(iter_movements(amrap, rounds=3)) == [
+        Movement("Burpee", 10, 0, 0, 0),
+        Movement("Run", 12, 0, 2400, 0),
+        Movement("Kettlebell Swing", 60, 24, 0, 0),
+    ]
+
+
+def test_frozen_exercises(complex_exercise, amrap):
+    frozen = complex_exercise.freeze()
+    assert list(iter_movements(frozen)) == list(
+        iter_movements(complex_exercise)
+    )
+    plank = Exercise(name="Plank", reps=3, duration=timedelta(seconds=30))
+    assert work_time(plank.freeze()) == 90
+    table = VolumeTable()
+    table.add(amrap)
+    amrap.exercises = [exercise.freeze() for exercise in amrap.exercises]
+    table.add(amrap)
+    assert table.by_workout()[0] == table.by_workout()[1]
+
+
+def test_iter_movements_raises():
+    with pytest.raises(TypeError):
+        _ = list(iter_movements("5 Burpee"))
+
+
+def test_work_time(amrap):
+    assert work_time(amrap) == 22 * 60
+    plank = Exercise(name="Plank", reps=3, duration=timedelta(seconds=30))
+    assert work_time(plank) == 90
+    assert work_time(Exercise(name="Burpee", reps=3)) == 0
+
+
+def test_volume_stats():
+    stats = VolumeStats(reps=12, loaded_reps=10, tonnage=1000, time=120)
+    assert stats.intensity == 100
+    assert stats.density == pytest.approx(500)
+    assert VolumeStats().intensity is None
+    assert VolumeStats().density is None
+
+
+class TestVolumeTable:
+    @pytest.fixture
+    def table(self, amrap, complex_exercise):
+        table = VolumeTable()
+        table.extend(
+            [
+                (
+                    date(2025, 1, 6),
+                    Exercise(
+                        name="Back Squat", reps=5, weight=Weight(100, "kg")
+                    ),
+                ),
+                (date(2025, 1, 8), amrap),
+                (date(2025, 2, 3), complex_exercise),
+            ]
+        )
+        table.add(
+            Exercise(name="Plank", duration=timedelta(minutes=1)),
+            day=date(2025, 2, 4),
+        )
+        return table
+
+    def test_len(self, table):
+        assert len(table) == 7
+
+    def test_totals(self, table):
+        totals = table.totals()
+        assert totals.reps == 5 + 10 + 4 + 20 + 20
+        assert totals.loaded_reps == 5 + 20 + 20
+        assert totals.tonnage == pytest.approx(
+            500 + 20 * 24 + 20 * 50 * 0.45359237
+        )
+        assert totals.distance == 800
+        assert totals.time == 22 * 60 + 60
+
+    def test_by_exercise(self, table):
+        stats = table.by_exercise()
+        assert list(stats) == [
+            "Back Squat",
+            "Burpee",
+            "Run",
+            "Kettlebell Swing",
+            "Clean",
+            "Jerk",
+            "Plank",
+        ]
+        assert stats["Back Squat"].tonnage == 500
+        assert stats["Back Squat"].intensity == 100
+        assert stats["Run"].distance == 800
+        assert stats["Plank"].time == 60
+
+    def test_by_movement(self, table):
+        table.add(
+            Exercise(name="back squats", reps=5, weight=Weight(80, "kg"))
+        )
+        table.add(Exercise(name="Pistol", reps=10))
+        stats = table.by_movement()
+        assert stats[CATALOG.lookup("BS")].tonnage == 900
+        assert stats[CATALOG.lookup("Split Jerk")].reps == 5
+        assert stats[None].reps == 10
+
+    def test_by_workout(self, table):
+        stats = table.by_workout()
+        assert list(stats) == [0, 1, 2, 3]
+        assert stats[1].tonnage == 480
+        assert stats[1].time == 22 * 60
+        assert stats[1].density == pytest.approx(480 / 22)
+
+    def test_by_period(self, table):
+        weekly = table.by_period()
+        assert list(weekly) == [(2025, 2), (2025, 6)]
+        assert weekly[(2025, 2)].tonnage == 980
+        assert weekly[(2025, 6)].time == 60
+
+        yearly = table.by_period(lambda day: day.year)
+        assert yearly[2025].reps == table.totals().reps
@@ -0,0 +1,41 @@
+import pytest
+
+from workout_tracker.better_enum import BetterStrEnum
+
+
+class Color(BetterStrEnum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Fruit(BetterStrEnum):
+    APPLE = "apple"
+
+
+@pytest.mark.parametrize(
+    "item, expected",
+    [
+        ("red", True),
+        (Color.GREEN, True),
+        ("blue", False),
+        ("RED", False),
+        (Fruit.APPLE, False),
+        (None, False),
+        (["red"], False),
+    ],
+)
+def test_contains(item, expected):
+    assert (item in Color) is expected
+
+
+def test_get():
+    assert Color.get("red") is Color.RED
+    assert Color.get(Color.GREEN) is Color.GREEN
+    assert Color.get("blue") is None
+    assert Color.get("blue", Color.RED) is Color.RED
+    assert Color.get(["red"], "default") == "default"
+
+
+def test_value_index_is_frozen():
+    with pytest.raises(TypeError):
+        Color._value_index_["blue"] = Color.RED
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from workout_tracker.bulk_import import bulk_import, iter_import
+from workout_tracker.exercise import Exercise
+from workout_tracker.jsonl import dump_iter, iter_load
+from workout_tracker.measurement import Weight
+
+
+def squat(kilos):
+    return Exercise(name="Back Squat", reps=5, weight=Weight(kilos, "kg"))
+
+
+@pytest.fixture
+def export(tmp_path):
+    path = tmp_path / "export.jsonl"
+    dump_iter((squat(kilos) for kilos in range(60, 160)), path)
+    with open(path, "a", encoding="utf-8") as file:
+        file.write("\nnot json\n")
+        file.write('{"name": "Row", "distance": "500 parsecs"}\n')
+        file.write('{"name": "Row", "reps": 10}\n')
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_bulk_import_matches_serial(export, workers):
+    serial_errors = []
+    serial = list(iter_load(export, on_error=serial_errors.append))
+
+    result = bulk_import(export, workers=workers, chunk_size=7)
+    assert result.exercises == serial
+    assert [error.line_number for error in result.errors] == [
+        error.line_number for error in serial_errors
+    ]
+    assert [error.line_number for error in result.errors] == [102, 103]
+    assert isinstance(result.errors[1].error, Exception)
+
+
+def test_iter_import_unordered(export):
+    exercises = list(
+        iter_import(export, workers=2, chunk_size=5, ordered=False)
+    )
+    assert len(exercises) == 101
+    assert sorted(exercises, key=str) == sorted(iter_load(export), key=str)
+
+
+def test_iter_import_progress(export):
+    progress = []
+    _ = list(
+        iter_import(
+            export, workers=2, chunk_size=50, on_progress=progress.append
+        )
+    )
+    assert progress == [50, 100, 103]
+
+
+def test_bulk_import_json_array(tmp_path):
+    path = tmp_path / "export.json"
+    records = [squat(100).to_dict(), {"reps": 5}, squat(105).to_dict()]
+    path.write_text("  \n" + json.dumps(records), encoding="utf-8")
+
+    result = bulk_import(path, workers=2, chunk_size=1)
+    assert result.exercises == [squat(100), squat(105)]
+    assert [error.line_number for error in result.errors] == [2]
+    assert json.loads(result.errors[0].line) == {"reps": 5}
+
+
+@pytest.mark.parametrize(
+    "options", [{"chunk_size": 0}, {"workers": 0}, {"workers": -1}]
+)
+def test_iter_import_raises(export, options):
+    with pytest.raises(ValueError):
+        _ = list(iter_import(export, **options))
@@ -0,0 +1,161 @@
+import mmap
+from datetime import timedelta
+
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis.strategies import (
+    booleans,
+    builds,
+    composite,
+    floats,
+    from_regex,
+    integers,
+    lists,
+    none,
+    one_of,
+    sampled_from,
+    timedeltas,
+)
+
+from workout_tracker.codec import DecodeError, decode, encode, iter_decode
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import (
+    Distance,
+    DistanceUnit,
+    Weight,
+    WeightUnit,
+)
+from workout_tracker.workout import Amrap
+
+names = from_regex(r"\A[A-Za-z]+( [A-Za-z]+){0,2}\Z")
+values = one_of(
+    floats(min_value=0.1, max_value=1_000),
+    integers(min_value=1, max_value=500),
+)
+weights = builds(Weight, value=values, unit=sampled_from(WeightUnit))
+distances = builds(Distance, value=values, unit=sampled_from(DistanceUnit))
+durations = timedeltas(
+    min_value=timedelta(seconds=1), max_value=timedelta(hours=2)
+)
+reps = integers(min_value=1, max_value=1_000)
+
+
+@composite
+def exercises(draw):
+    return Exercise(
+        name=draw(names),
+        reps=draw(reps),
+        weight=draw(one_of(none(), weights)),
+        duration=draw(one_of(none(), durations)),
+        distance=draw(one_of(none(), distances)),
+        height=draw(one_of(none(), distances)),
+    )
+
+
+@composite
+def complexes(draw):
+    sub_exercises = draw(
+        lists(builds(Exercise, name=names, reps=reps), min_size=1, max_size=4)
+    )
+    return Exercise(
+        name=None,
+        reps=draw(reps),
+        weight=draw(one_of(none(), weights)),
+        sub_exercises=sub_exercises,
+    )
+
+
+@composite
+def amraps(draw, nested=True):
+    buy_in = draw(one_of(none(), amraps(nested=False))) if nested else None
+    return Amrap(
+        duration=draw(durations),
+        exercises=draw(lists(one_of(exercises(), complexes()), max_size=3)),
+        buy_in=buy_in,
+        repeats=draw(integers(min_value=1, max_value=10)),
+        rest=draw(one_of(none(), durations)),
+        buy_out=draw(one_of(none(), amraps(nested=False)))
+        if draw(booleans()) and nested
+        else None,
+    )
+
+
+@given(objects=lists(one_of(exercises(), complexes(), amraps()), max_size=5))
+@settings(max_examples=50, suppress_health_check=[HealthCheck.too_slow])
+def test_round_trip(objects):
+    assert decode(encode(objects)) == objects
+
+
+@given(
+    objects=lists(one_of(weights, distances, durations), min_size=1),
+)
+@settings(max_examples=50)
+def test_round_trip_values(objects):
+    decoded = decode(encode(objects))
+    assert decoded == objects
+    assert [str(obj) for obj in decoded] == [str(obj) for obj in objects]
+
+
+def test_round_trip_mmap(tmp_path):
+    objects = [
+        Exercise(name="Back Squat", reps=5, weight=Weight(100, "kg")),
+        Exercise(name="Back Squat", reps=3, weight=Weight(110, "kg")),
+    ]
+    path = tmp_path / "data.bin"
+    path.write_bytes(encode(objects))
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert decode(mapped) == objects
+
+
+def test_encode_frozen():
+    exercise = Exercise(
+        name=None,
+        reps=2,
+        weight=Weight(60, "kg"),
+        sub_exercises=[Exercise(name="Clean", reps=1)],
+    )
+    amrap = Amrap(duration=timedelta(minutes=5), exercises=[exercise.freeze()])
+    assert encode([exercise.freeze(), amrap]) == encode(
+        [exercise, Amrap(duration=timedelta(minutes=5), exercises=[exercise])]
+    )
+
+
+def test_string_table_deduplicates():
+    data = encode([Exercise(name="Back Squat", reps=5)] * 3)
+    assert data.count(b"Back Squat") == 1
+
+
+@pytest.mark.parametrize("reps", [5.0, 2.5])
+def test_float_reps(reps):
+    exercise = Exercise.from_dict({"name": "Burpee", "reps": reps})
+    (decoded,) = decode(encode([exercise]))
+    assert decoded == exercise
+    assert type(decoded.reps) is float
+
+
+def test_encode_raises():
+    with pytest.raises(TypeError):
+        _ = encode(["5 Back Squat"])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"JSON\x01",
+        b"WTRK\x02\x00\x00\x00\x00",
+        encode([Exercise(name="Row", reps=5)])[:-3],
+        encode([Weight(1, WeightUnit.KG)]).replace(b"\x03\x87", b"\x09\x87"),
+        encode([Weight(1, WeightUnit.KG)]).replace(b"\x87", b"\x8f"),
+    ],
+)
+def test_decode_raises(data):
+    with pytest.raises(DecodeError):
+        _ = decode(data)
+
+
+def test_iter_decode_is_lazy():
+    data = encode([Exercise(name="Row", reps=5), Weight(1, "kg")])
+    records = iter_decode(data)
+    assert next(records) == Exercise(name="Row", reps=5)
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+import pytest
+import pytimeparse
+from hypothesis import given
+from hypothesis.strategies import from_regex
+
+from workout_tracker.duration import (
+    clear_duration_cache,
+    duration_cache_info,
+    parse_duration,
+)
+
+
+@pytest.mark.parametrize(
+    "string, seconds",
+    [
+        ("20:00", 1200),
+        ("01:30", 90),
+        ("1:02:03", 3723),
+        ("0:00:30", 30),
+        ("90s", 90),
+        ("1 min", 60),
+        (" 2 Hours ", 7200),
+        ("1.5 min", 90),
+        ("1 day, 0:00:00", 86400),
+        ("0:00:30.500000", 30.5),
+    ],
+)
+def test_parse_duration(string, seconds):
+    assert parse_duration(string) == timedelta(seconds=seconds)
+
+
+@pytest.mark.parametrize("string", ["", "soon", "123:45", "5 parsecs"])
+def test_parse_duration_raises(string):
+    with pytest.raises(ValueError):
+        _ = parse_duration(string)
+
+
+@given(
+    string=from_regex(
+        r"\A\s?([0-9]{1,2}:[0-9]{2}|[0-9]{1,3}:[0-9]{2}:[0-9]{2}"
+        r"|[0-9]{1,4} ?(s|secs?|m|mins?|minutes?|h|hrs?|hours?|d|w))\s?\Z"
+    )
+)
+def test_parse_duration_matches_pytimeparse(string):
+    clear_duration_cache()
+    assert parse_duration(string) == timedelta(
+        seconds=pytimeparse.parse(string)
+    )
+
+
+def test_duration_cache_info():
+    clear_duration_cache()
+    parse_duration("20:00")
+    parse_duration("20:00")
+    parse_duration("10:00")
+    info = duration_cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
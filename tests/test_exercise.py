@@ -1,3 +1,6 @@
+import gc
+import pickle
+from dataclasses import FrozenInstanceError
 from datetime import timedelta
 
 import pytest
@@ -11,13 +14,27 @@ from hypothesis.strategies import (
     timedeltas,
 )
 
-from workout_tracker.exercise import Exercise, to_str
+from workout_tracker import exercise as exercise_module
+from workout_tracker.exercise import (
+    _DECODERS,
+    Exercise,
+    FrozenExercise,
+    clear_decoder_cache,
+    interned_count,
+    to_str,
+)
 from workout_tracker.measurement import (
     Distance,
     DistanceUnit,
+    UnknownUnitError,
     Weight,
     WeightUnit,
 )
+from workout_tracker.movements import (
+    CATALOG,
+    DEFAULT_MOVEMENTS,
+    MovementCatalog,
+)
 
 
 def test_to_str():
@@ -128,6 +145,47 @@ class TestExercise:
         assert jerk_dict in out_dict["sub_exercises"]
         assert len(out_dict["sub_exercises"]) == 2
 
+    def test_to_dict_returns_new_dicts(self):
+        exercise = Exercise(
+            name=None,
+            reps=5,
+            sub_exercises=[
+                Exercise(name="Clean", reps=3),
+                Exercise(name="Jerk", reps=1),
+            ],
+        )
+        out_dict = exercise.to_dict()
+        out_dict["sub_exercises"][0]["reps"] = 10
+        out_dict["reps"] = 10
+        assert exercise.to_dict()["reps"] == 5
+        assert exercise.to_dict()["sub_exercises"][0]["reps"] == 3
+
+    def test_rendering_cache_invalidated(self):
+        exercise = Exercise(
+            name="Back Squat", reps=5, weight=Weight(100, WeightUnit.KG)
+        )
+        assert str(exercise) == "5 Back Squat 100 kg"
+        assert exercise.to_dict()["weight"] == "100 kg"
+
+        exercise.weight = Weight(110, WeightUnit.KG)
+        exercise.reps = 3
+        assert str(exercise) == "3 Back Squat 110 kg"
+        assert exercise.to_dict() == {
+            "name": "Back Squat",
+            "reps": 3,
+            "weight": "110 kg",
+        }
+
+    def test_rendering_cache_sub_exercises(self):
+        clean = Exercise(name="Clean", reps=3)
+        exercise = Exercise(name=None, reps=5, sub_exercises=[clean])
+        assert exercise.to_dict()["sub_exercises"] == [clean.to_dict()]
+
+        clean.reps = 2
+        assert exercise.to_dict()["sub_exercises"] == [
+            {"name": "Clean", "reps": 2}
+        ]
+
     def test_to_and_from_dict_multiple(self):
         exercise = Exercise(
             name=None,
@@ -215,3 +273,207 @@ class TestExercise:
     )
     def test_str(self, exercise, string):
         assert str(exercise) == string
+
+
+class TestShapeDecoders:
+    @pytest.mark.parametrize(
+        "exercise_dict",
+        [
+            {"name": "back squat", "reps": 5, "weight": "100 kg"},
+            {"weight": "100 kg", "reps": 5, "name": "back squat"},
+            {"name": "Run", "distance": "400 m", "duration": "1:30"},
+            {"name": "Box Jump", "reps": 5, "height": None, "extra": 1},
+            {
+                "name": None,
+                "reps": 3,
+                "weight": "60 kg",
+                "sub_exercises": [
+                    {"name": "Clean", "reps": 1},
+                    {"name": "Jerk", "reps": 2},
+                ],
+            },
+            {"name": None, "reps": 3, "sub_exercises": []},
+        ],
+    )
+    def test_same_as_generic(self, exercise_dict):
+        # pylint: disable-next=protected-access
+        expected = Exercise._from_any_dict(exercise_dict)
+        for _ in range(2):
+            exercise = Exercise.from_dict(exercise_dict)
+            assert exercise == expected
+            assert vars(exercise) == vars(expected)
+
+    @pytest.mark.parametrize(
+        "exercise_dict, error",
+        [
+            ({"reps": 5, "weight": "100 kg"}, KeyError),
+            ({"reps": 5, "weight": "100 parsec"}, UnknownUnitError),
+            ({"name": "Squat", "weight": "100 kg"}, ValueError),
+            ({"name": "Run", "duration": "soon", "distance": "x"}, ValueError),
+            ({"name": None, "reps": 1, "sub_exercises": 1}, TypeError),
+        ],
+    )
+    def test_same_errors(self, exercise_dict, error):
+        with pytest.raises(error) as generic_error:
+            # pylint: disable-next=protected-access
+            Exercise._from_any_dict(exercise_dict)
+        with pytest.raises(error) as shape_error:
+            Exercise.from_dict(exercise_dict)
+        assert str(shape_error.value) == str(generic_error.value)
+
+    def test_cached_per_shape(self):
+        clear_decoder_cache()
+        Exercise.from_dict({"name": "Run", "distance": "400 m"})
+        Exercise.from_dict({"name": "Row", "distance": "2 km"})
+        Exercise.from_dict({"name": "Squat", "reps": 5})
+        assert len(_DECODERS) == 2
+
+    def test_cache_bounded(self, monkeypatch):
+        clear_decoder_cache()
+        monkeypatch.setattr(exercise_module, "DECODER_CACHE_SIZE", 1)
+        Exercise.from_dict({"name": "Run", "distance": "400 m"})
+        exercise = Exercise.from_dict({"name": "Squat", "reps": 5})
+        assert exercise == Exercise(name="Squat", reps=5)
+        assert len(_DECODERS) == 1
+
+    def test_subclass(self):
+        class Lift(Exercise):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.decoded = True
+
+        lift = Lift.from_dict({"name": "squat", "reps": 5})
+        assert isinstance(lift, Lift)
+        assert lift.decoded
+
+
+class TestFrozenExercise:
+    def test_interned(self):
+        first = FrozenExercise(
+            name="back squat", reps=5, weight=Weight(100, "kg")
+        )
+        second = FrozenExercise(
+            name="Back Squat", reps=5, weight=Weight(100, "kg")
+        )
+        assert first is second
+        assert first.name == "Back Squat"
+        assert first is not FrozenExercise(
+            name="Back Squat", reps=5, weight=Weight(220.5, "lb")
+        )
+        assert first is not FrozenExercise(
+            name="Back Squat", reps=5, weight=Weight(100.0, "kg")
+        )
+
+    def test_interned_reps_type(self):
+        first = Exercise.from_dict({"name": "Burpee", "reps": 5}, intern=True)
+        second = Exercise.from_dict(
+            {"name": "Burpee", "reps": 5.0}, intern=True
+        )
+        assert first is not second
+        assert isinstance(first.reps, int)
+        assert isinstance(second.reps, float)
+        assert str(second) == "5.0 Burpee"
+
+    def test_from_dict(self):
+        exercise_dict = {
+            "name": None,
+            "reps": 3,
+            "weight": "60 kg",
+            "sub_exercises": [
+                {"name": "Clean", "reps": 1},
+                {"name": "Jerk", "reps": 2},
+            ],
+        }
+        exercise = Exercise.from_dict(exercise_dict, intern=True)
+        assert isinstance(exercise, FrozenExercise)
+        assert exercise is Exercise.from_dict(exercise_dict, intern=True)
+        assert exercise.sub_exercises[0] is FrozenExercise("Clean", reps=1)
+        mutable = Exercise.from_dict(exercise_dict)
+        assert exercise.to_dict() == mutable.to_dict()
+        assert str(exercise) == str(mutable) == "3 1 Clean + 2 Jerk 60.0 kg"
+
+    def test_same_validation(self):
+        with pytest.raises(ValueError):
+            _ = FrozenExercise(name="Squat", weight=Weight(100, "kg"))
+        with pytest.raises(ValueError):
+            _ = FrozenExercise(
+                name=None,
+                reps=1,
+                sub_exercises=[
+                    FrozenExercise("Run", distance=Distance(1, "km"))
+                ],
+            )
+
+    def test_immutable(self):
+        exercise = FrozenExercise(name="Squat", reps=5)
+        with pytest.raises(FrozenInstanceError):
+            exercise.reps = 3
+        with pytest.raises(FrozenInstanceError):
+            del exercise.reps
+        assert not hasattr(exercise, "__dict__")
+
+    def test_freeze_and_thaw(self):
+        exercise = Exercise(
+            name=None,
+            reps=2,
+            sub_exercises=[
+                Exercise("Clean", reps=1),
+                Exercise("Jerk", reps=1),
+            ],
+        )
+        frozen = exercise.freeze()
+        assert frozen is exercise.freeze()
+        assert frozen.thaw() == exercise
+
+    def test_unused_entries_collected(self):
+        exercise = FrozenExercise(name="Rare Movement", reps=1)
+        gc.collect()
+        count = interned_count()
+        del exercise
+        gc.collect()
+        assert interned_count() == count - 1
+
+    def test_pickle(self):
+        exercise = FrozenExercise(name="Run", distance=Distance(400, "m"))
+        assert pickle.loads(pickle.dumps(exercise)) is exercise
+        assert repr(exercise).startswith(
+            "FrozenExercise(name='Run', reps=None"
+        )
+
+
+class TestMovementId:
+    def test_aliases_share_id(self):
+        ids = {
+            Exercise(name=name, reps=5).movement_id
+            for name in ["BS", "back squats", "Back Squat"]
+        }
+        assert ids == {CATALOG.lookup("Back Squat")}
+
+    def test_unknown_and_complex(self):
+        assert Exercise(name="Pistol", reps=5).movement_id is None
+        complex_exercise = Exercise(
+            name=None, reps=1, sub_exercises=[Exercise("Clean", reps=1)]
+        )
+        assert complex_exercise.movement_id is None
+        assert complex_exercise.freeze().movement_id is None
+
+    def test_renamed(self):
+        exercise = Exercise(name="Run", distance=Distance(400, "m"))
+        assert exercise.movement_id == CATALOG.lookup("Run")
+        exercise.name = "Row"
+        assert exercise.movement_id == CATALOG.lookup("Row")
+
+    def test_catalog_changed(self, monkeypatch):
+        catalog = MovementCatalog(DEFAULT_MOVEMENTS)
+        monkeypatch.setattr(exercise_module, "CATALOG", catalog)
+        exercise = Exercise(name="Turkish Get Up", reps=5)
+        assert exercise.movement_id is None
+        movement_id = catalog.add("Turkish Get Up", ["TGU"])
+        assert exercise.movement_id == movement_id
+        assert exercise.freeze().movement_id == movement_id
+
+    def test_not_compared(self):
+        exercise = Exercise(name="Run", distance=Distance(400, "m"))
+        _ = exercise.movement_id
+        assert exercise == Exercise(name="Run", distance=Distance(400, "m"))
+        assert exercise.freeze().movement_id == exercise.movement_id
@@ -0,0 +1,90 @@
+import pytest
+
+from workout_tracker import instrumentation, measurement
+from workout_tracker.duration import clear_duration_cache, duration_cache_info
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import UnknownUnitError, Weight
+from workout_tracker.whiteboard import parse_amrap_header, parse_line
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    _ = Weight.from_str("100 kg")
+    assert instrumentation.snapshot()["measurement_from_str"]["calls"] == 0
+
+
+def test_records_calls_and_errors():
+    original = measurement.get_value_and_unit
+    with instrumentation.instrumented():
+        assert instrumentation.is_enabled()
+        exercise = Exercise.from_dict(
+            {"name": "Plank", "reps": 2, "duration": "1:30", "weight": "5 kg"}
+        )
+        _ = exercise.to_dict()
+        with pytest.raises(UnknownUnitError):
+            _ = Weight.from_str("100 parsecs")
+
+    assert not instrumentation.is_enabled()
+    assert measurement.get_value_and_unit is original
+    stats = instrumentation.snapshot()
+    assert stats["exercise_from_dict"]["calls"] == 1
+    assert stats["exercise_to_dict"]["calls"] == 1
+    assert stats["parse_duration"]["calls"] == 1
+    assert stats["measurement_from_str"] == {
+        "calls": 2,
+        "errors": 1,
+        "seconds": pytest.approx(stats["measurement_from_str"]["seconds"]),
+    }
+    assert stats["get_value_and_unit"]["errors"] == 1
+    assert stats["exercise_from_dict"]["seconds"] > 0
+
+
+def test_records_whiteboard_durations():
+    with instrumentation.instrumented():
+        _ = parse_line("Plank 1:30")
+        _ = parse_amrap_header("AMRAP 12 min")
+    assert instrumentation.snapshot()["parse_duration"]["calls"] == 2
+
+
+def test_duration_cache_while_enabled():
+    with instrumentation.instrumented():
+        _ = parse_line("Plank 1:30")
+        assert duration_cache_info().currsize > 0
+        clear_duration_cache()
+        assert duration_cache_info().currsize == 0
+    assert instrumentation.snapshot()["parse_duration"]["calls"] == 1
+
+
+def test_selected_hooks():
+    instrumentation.enable(["exercise_to_dict"])
+    _ = Weight.from_str("100 kg")
+    _ = Exercise(name="Burpee", reps=5).to_dict()
+    stats = instrumentation.snapshot()
+    assert stats["measurement_from_str"]["calls"] == 0
+    assert stats["exercise_to_dict"]["calls"] == 1
+
+    instrumentation.reset()
+    assert instrumentation.snapshot()["exercise_to_dict"]["calls"] == 0
+    with pytest.raises(ValueError):
+        instrumentation.enable(["unknown"])
+
+
+def test_to_prometheus():
+    with instrumentation.instrumented():
+        _ = Weight.from_str("100 kg")
+    text = instrumentation.to_prometheus()
+    assert "# TYPE workout_tracker_calls_total counter\n" in text
+    assert (
+        'workout_tracker_calls_total{hook="measurement_from_str"} 1\n' in text
+    )
+    assert (
+        'workout_tracker_errors_total{hook="get_value_and_unit"} 0\n' in text
+    )
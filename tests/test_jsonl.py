@@ -0,0 +1,77 @@
+import pickle
+from datetime import timedelta
+
+import pytest
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.jsonl import RecordError, dump_iter, iter_load
+from workout_tracker.measurement import Distance, Weight
+
+
+@pytest.fixture
+def exercises():
+    return [
+        Exercise(name="Back Squat", reps=5, weight=Weight(100, "kg")),
+        Exercise(name="Run", distance=Distance(400, "m")),
+        Exercise(name="Plank", duration=timedelta(seconds=90)),
+        Exercise(
+            name=None,
+            reps=3,
+            weight=Weight(50, "lb"),
+            sub_exercises=[
+                Exercise(name="Clean", reps=3),
+                Exercise(name="Jerk", reps=1),
+            ],
+        ),
+    ]
+
+
+def test_dump_and_load(tmp_path, exercises):
+    path = tmp_path / "exercises.jsonl"
+    assert dump_iter(iter(exercises), path) == 4
+    assert list(iter_load(path)) == exercises
+
+
+def test_dump_append(tmp_path, exercises):
+    path = tmp_path / "exercises.jsonl"
+    dump_iter(exercises[:2], path)
+    dump_iter(exercises[2:], path, append=True)
+    assert list(iter_load(path)) == exercises
+
+
+def test_load_reports_bad_records(tmp_path):
+    path = tmp_path / "exercises.jsonl"
+    path.write_text(
+        '{"name": "Row", "distance": "500 m"}\n'
+        "\n"
+        "not json\n"
+        '{"name": "Row", "distance": "500 parsecs"}\n'
+        '{"reps": 5}\n'
+        "[1, 2]\n"
+        '{"name": null, "reps": 5}\n'
+        '{"name": 42, "reps": 5}\n'
+        '{"name": null, "reps": 1, '
+        '"sub_exercises": [{"name": null, "reps": 1}]}\n'
+        '{"name": "Row", "reps": 10}\n',
+        encoding="utf-8",
+    )
+    errors = []
+    exercises = list(iter_load(path, on_error=errors.append))
+
+    assert [exercise.name for exercise in exercises] == ["Row", "Row"]
+    assert [error.line_number for error in errors] == [3, 4, 5, 6, 7, 8, 9]
+    assert errors[0].line == "not json\n"
+
+
+def test_load_logs_bad_records(tmp_path, caplog):
+    path = tmp_path / "exercises.jsonl"
+    path.write_text('{"name": "Row"}\n', encoding="utf-8")
+    assert not list(iter_load(path))
+    assert "line 1" in caplog.text
+
+
+def test_record_error_pickle():
+    error = RecordError(3, "{}", KeyError("name"))
+    restored = pickle.loads(pickle.dumps(error))
+    assert restored.line_number == 3
+    assert str(restored) == str(error)
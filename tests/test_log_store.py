@@ -0,0 +1,206 @@
+from datetime import date, timedelta
+
+import pytest
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.log_store import WorkoutLog, record_names
+from workout_tracker.measurement import Distance, Weight
+from workout_tracker.workout import Amrap
+
+
+def squat(kilos):
+    return Exercise(name="Back Squat", reps=5, weight=Weight(kilos, "kg"))
+
+
+@pytest.fixture
+def amrap():
+    return Amrap(
+        duration=timedelta(minutes=12),
+        exercises=[
+            Exercise(name="Run", distance=Distance(200, "m")),
+            Exercise(
+                name=None,
+                reps=3,
+                sub_exercises=[
+                    Exercise(name="Clean", reps=1),
+                    Exercise(name="Jerk", reps=1),
+                ],
+            ),
+        ],
+        buy_in=Amrap(
+            duration=timedelta(minutes=2),
+            exercises=[Exercise(name="Burpee", reps=10)],
+        ),
+    )
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "workouts.log"
+
+
+def test_record_names(amrap):
+    assert record_names(amrap) == {
+        "Run",
+        "1 Clean + 1 Jerk",
+        "Clean",
+        "Jerk",
+        "Burpee",
+    }
+
+
+def test_append_and_query(log_path, amrap):
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100), date(2024, 12, 30))
+        log.append(amrap, date(2025, 1, 2))
+        log.append(squat(105), date(2025, 1, 6))
+        log.extend([(date(2026, 1, 1), squat(110))])
+
+        assert [record for _, record in log.query("back squat")] == [
+            squat(100),
+            squat(105),
+            squat(110),
+        ]
+        assert list(
+            log.query("Back Squat", date(2025, 1, 1), date(2025, 12, 31))
+        ) == [(date(2025, 1, 6), squat(105))]
+        assert list(log.query("Clean")) == [(date(2025, 1, 2), amrap)]
+        assert not list(log.query("Deadlift"))
+
+
+def test_append_frozen(log_path, amrap):
+    frozen = Amrap(
+        duration=amrap.duration,
+        exercises=[exercise.freeze() for exercise in amrap.exercises],
+    )
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100).freeze(), date(2025, 1, 1))
+        log.append(frozen, date(2025, 1, 2))
+        assert [record for _, record in log.query("Back Squat")] == [
+            squat(100)
+        ]
+        assert [record.exercises for _, record in log.query("Clean")] == [
+            amrap.exercises
+        ]
+
+
+def test_query_unordered_dates(log_path):
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100), date(2025, 3, 1))
+        log.append(squat(90), date(2025, 1, 1))
+        log.append(squat(95), date(2025, 2, 1))
+        assert [
+            record.weight.value
+            for _, record in log.query("Back Squat", end=date(2025, 2, 1))
+        ] == [90, 95]
+
+
+def test_reopen(log_path, amrap):
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100), date(2025, 1, 1))
+        log.append(amrap, date(2025, 1, 2))
+    with WorkoutLog(log_path, sync=True) as log:
+        log.append(squat(105), date(2025, 1, 3))
+        assert len(list(log.query("Back Squat"))) == 2
+        assert list(log) == [
+            (date(2025, 1, 1), squat(100)),
+            (date(2025, 1, 2), amrap),
+            (date(2025, 1, 3), squat(105)),
+        ]
+
+
+def test_recover_torn_frame(log_path):
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100), date(2025, 1, 1))
+        log.append(squat(105), date(2025, 1, 2))
+    size = log_path.stat().st_size
+    with open(log_path, "ab") as file:
+        file.write(b"\x40\x00\x00\x00\x00\x00")
+
+    with WorkoutLog(log_path) as log:
+        assert log_path.stat().st_size == size
+        assert len(list(log.query("Back Squat"))) == 2
+        log.append(squat(110), date(2025, 1, 3))
+        assert len(list(log.query("Back Squat"))) == 3
+
+
+def test_recover_missing_index(log_path):
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100), date(2025, 1, 1))
+        log.append(squat(105), date(2025, 1, 2))
+    index_path = log_path.with_name(log_path.name + ".idx")
+    index_path.write_bytes(index_path.read_bytes()[:30])
+
+    with WorkoutLog(log_path) as log:
+        assert len(list(log.query("Back Squat"))) == 2
+    assert index_path.stat().st_size == 40
+
+
+def test_recover_torn_index_entries(log_path):
+    workout = Amrap(
+        duration=timedelta(minutes=10),
+        exercises=[
+            Exercise(name="Run", distance=Distance(400, "m")),
+            Exercise(name="Row", distance=Distance(500, "m")),
+        ],
+    )
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100), date(2025, 1, 1))
+        log.append(workout, date(2025, 1, 2))
+    index_path = log_path.with_name(log_path.name + ".idx")
+    index_path.write_bytes(index_path.read_bytes()[:-20])
+
+    with WorkoutLog(log_path) as log:
+        assert len(list(log.query("Run"))) == 1
+        assert len(list(log.query("Row"))) == 1
+        assert len(list(log.query("Back Squat"))) == 1
+    assert index_path.stat().st_size == 60
+    with WorkoutLog(log_path) as log:
+        assert len(list(log.query("Row"))) == 1
+
+
+@pytest.mark.parametrize("cut", [7, 13])
+def test_recover_torn_name(log_path, cut):
+    with WorkoutLog(log_path) as log:
+        log.append(Exercise(name="Über Squat", reps=5), date(2025, 1, 1))
+        log.append(Exercise(name="Äpfel Burpee", reps=5), date(2025, 1, 2))
+    names_path = log_path.with_name(log_path.name + ".names")
+    names_path.write_bytes(names_path.read_bytes()[:-cut])
+
+    with WorkoutLog(log_path) as log:
+        assert log.names() == ["Über Squat", "Äpfel Burpee"]
+        assert len(list(log.query("Äpfel Burpee"))) == 1
+        log.append(Exercise(name="Row", reps=5), date(2025, 1, 3))
+    with WorkoutLog(log_path) as log:
+        assert log.names() == ["Über Squat", "Äpfel Burpee", "Row"]
+        assert len(list(log.query("Über Squat"))) == 1
+
+
+def test_recover_stale_index(log_path):
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100), date(2025, 1, 1))
+        log.append(squat(105), date(2025, 1, 2))
+    with open(log_path, "r+b") as file:
+        file.truncate(log_path.stat().st_size - 1)
+
+    with WorkoutLog(log_path) as log:
+        assert list(log) == [(date(2025, 1, 1), squat(100))]
+        assert len(list(log.query("Back Squat"))) == 1
+
+
+def test_compact(log_path):
+    with WorkoutLog(log_path) as log:
+        log.append(squat(100), date(2025, 3, 1))
+        log.append(squat(90), date(2025, 1, 1))
+        log.append(Exercise(name="Row", reps=10), date(2025, 2, 1))
+        log.compact(keep=lambda day, record: record.name != "Row")
+
+        assert list(log) == [
+            (date(2025, 1, 1), squat(90)),
+            (date(2025, 3, 1), squat(100)),
+        ]
+        assert log.names() == ["Back Squat"]
+        log.append(squat(95), date(2025, 4, 1))
+
+    with WorkoutLog(log_path) as log:
+        assert len(list(log.query("Back Squat", date(2025, 2, 1)))) == 2
@@ -1,15 +1,22 @@
+import pickle
 from copy import deepcopy
 
 import pytest
 
 from workout_tracker.measurement import (
+    UNIT_REGISTRY,
     Distance,
     DistanceUnit,
     Unit,
     UnknownUnitError,
     Weight,
     WeightUnit,
+    conversion_factor,
+    convert_all,
+    convert_values,
     get_value_and_unit,
+    lookup_unit,
+    round_half_up,
 )
 
 
@@ -55,6 +62,42 @@ def test_get_value_and_unit_unknown_unit():
         _, _ = get_value_and_unit("200 NotAUnit")
 
 
+@pytest.mark.parametrize(
+    "text, exp_value, exp_unit",
+    [
+        ("100 kgs", 100, WeightUnit.KG),
+        ("135 lbs", 135, WeightUnit.LB),
+        ("400 meters", 400, DistanceUnit.M),
+        ("  1.5\tkm  ", 1.5, DistanceUnit.KM),
+        ("3 feet", 3, DistanceUnit.FT),
+        ("yd 10", 10, DistanceUnit.YARD),
+    ],
+)
+def test_get_value_and_unit_aliases(text, exp_value, exp_unit):
+    value, unit = get_value_and_unit(string=text)
+    assert value == exp_value
+    assert unit is exp_unit
+
+
+@pytest.mark.parametrize(
+    "alias, exp_unit",
+    [
+        ("kg", WeightUnit.KG),
+        ("pounds", WeightUnit.LB),
+        ("poods", WeightUnit.POOD),
+        ("inches", DistanceUnit.INCH),
+    ],
+)
+def test_lookup_unit(alias, exp_unit):
+    assert lookup_unit(alias) is exp_unit
+
+
+@pytest.mark.parametrize("unit", ["stone", "KM", "KG", "Pounds"])
+def test_lookup_unit_unknown_unit(unit):
+    with pytest.raises(UnknownUnitError):
+        _ = lookup_unit(unit)
+
+
 class TestUnit:
     def test_init(self):
         unit = Unit(name="kg", in_si=1)
@@ -68,6 +111,22 @@ class TestUnit:
         assert unit_4_si.from_si(1) == 0.25
         assert unit_4_si.from_si(4.4) == 1.1
 
+    def test_frozen(self, unit_4_si):
+        with pytest.raises(AttributeError):
+            unit_4_si.in_si = 2
+
+
+def test_unit_registry_is_shared():
+    assert Distance(1, "m").unit is Distance(2, DistanceUnit.M).unit
+    assert Weight(1, "kg").unit is UNIT_REGISTRY["kg"]
+    assert Weight.from_str("3 lbs").unit is UNIT_REGISTRY["lb"]
+
+
+def test_pickle_shares_registry_unit():
+    weight = pickle.loads(pickle.dumps(Weight(2, "pood")))
+    assert weight == Weight(2, "pood")
+    assert weight.unit is UNIT_REGISTRY["pood"]
+
 
 class TestDistance:
     def test_init(self):
@@ -79,6 +138,12 @@ class TestDistance:
         with pytest.raises(UnknownUnitError):
             _ = Distance(1.3, unit="wrong")
 
+    def test_immutable(self, dist_2_ft):
+        with pytest.raises(AttributeError):
+            dist_2_ft.value = 3
+        with pytest.raises(AttributeError):
+            dist_2_ft.other = 3
+
     def test_from_str(self):
         dist = Distance.from_str("2 mile")
         assert isinstance(dist, Distance)
@@ -119,6 +184,14 @@ class TestWeight:
         with pytest.raises(UnknownUnitError):
             _ = Weight(42, unit="wrong")
 
+    def test_from_str_alias(self):
+        weight = Weight.from_str("24 kgs")
+        assert weight == Weight(24, unit=WeightUnit.KG)
+
+    def test_from_str_wrong_family(self):
+        with pytest.raises(UnknownUnitError):
+            _ = Weight.from_str("24 m")
+
     def test_str_(self, weight_2_pood):
         assert str(weight_2_pood) == "2 pood"
 
@@ -131,3 +204,129 @@ class TestWeight:
         assert weight_2_pood != Weight(value=2, unit=WeightUnit.KG)
         assert weight_2_pood != Weight(value=3, unit=WeightUnit.POOD)
         assert weight_2_pood != Distance(value=2, unit=DistanceUnit.FT)
+
+    def test_eq_tolerance(self):
+        assert Distance(1, DistanceUnit.FT) == Distance(12, DistanceUnit.INCH)
+        assert Weight(0.1 + 0.2, "kg") == Weight(0.3, "kg")
+        assert Weight(0.3, "kg") != Weight(0.300001, "kg")
+
+
+class TestMeasurementHashing:
+    def test_hash_consistent_with_eq(self):
+        weights = {
+            Weight(32, "kg"),
+            Weight(2, "pood"),
+            Weight(0.1 + 0.2, "kg"),
+        }
+        assert weights == {Weight(32, "kg"), Weight(0.3, "kg")}
+        assert hash(Distance(1, "ft")) == hash(Distance(12, "in"))
+
+    def test_dict_keys(self):
+        counts = {}
+        for weight in [Weight(16, "kg"), Weight(1, "pood"), Weight(20, "kg")]:
+            counts[weight] = counts.get(weight, 0) + 1
+        assert counts == {Weight(16, "kg"): 2, Weight(20, "kg"): 1}
+
+    def test_ordering(self):
+        weights = [Weight(100, "lb"), Weight(2, "pood"), Weight(40, "kg")]
+        assert sorted(weights) == [weights[1], weights[2], weights[0]]
+        assert Weight(1, "pood") <= Weight(16, "kg")
+        assert Weight(1, "pood") >= Weight(16, "kg")
+        assert Weight(1, "lb") < Weight(1, "kg") < Weight(1, "pood")
+        assert Distance(1, "mile") > Distance(1, "km")
+
+    def test_ordering_raises(self):
+        with pytest.raises(TypeError):
+            _ = Weight(1, "kg") < Distance(1, "m")
+        with pytest.raises(TypeError):
+            _ = Weight(1, "kg") < 1
+
+    def test_si_key(self):
+        assert Distance(1, "ft").si_key == Distance(12, "in").si_key == 0.3048
+
+
+class TestMeasurementArithmetic:
+    def test_add_sub(self):
+        total = Weight(20, "kg") + Weight(1, "pood")
+        assert total == Weight(36, "kg")
+        assert total.unit.name == WeightUnit.KG
+        difference = Weight(2, "pood") - Weight(16, "kg")
+        assert difference.value == 1
+        assert difference.unit.name == WeightUnit.POOD
+
+    def test_sum(self):
+        assert sum([Weight(1, "pood"), Weight(4, "kg")]) == Weight(20, "kg")
+
+    def test_scale(self):
+        assert Distance(400, "m") * 4 == Distance(1.6, "km")
+        assert 2 * Weight(1, "pood") == Weight(2, "pood")
+        assert (Weight(3, "pood") / 3).value == 1
+
+    def test_ratio(self):
+        assert Weight(2, "pood") / Weight(16, "kg") == 2
+
+    def test_native_unit(self):
+        assert str(Weight(100, "lb") * 3) == "300 lb"
+        assert str(3 * Weight(100, "lb")) == "300 lb"
+        assert str(Weight(100, "lb") / 4) == "25.0 lb"
+        assert str(Weight(100, "lb") + Weight(35, "lb")) == "135 lb"
+        assert str(Weight(135, "lb") - Weight(35, "lb")) == "100 lb"
+        assert str(Distance(1.5, "km") + Distance(500, "m")) == "2.0 km"
+        assert Weight(100, "lb") / Weight(50, "lb") == 2
+
+    def test_raises(self):
+        with pytest.raises(TypeError):
+            _ = Weight(1, "kg") + Distance(1, "m")
+        with pytest.raises(TypeError):
+            _ = Weight(1, "kg") + 1
+        with pytest.raises(TypeError):
+            _ = Weight(1, "kg") * Weight(1, "kg")
+
+
+class TestConversion:
+    def test_to(self):
+        weight = Weight(32, "kg").to(WeightUnit.POOD)
+        assert weight.value == pytest.approx(2)
+        assert weight.unit is UNIT_REGISTRY["pood"]
+        assert Distance(1, "mile").to("m").value == pytest.approx(1609.344)
+
+    def test_to_alias(self):
+        assert Weight(1, "kg").to("kilograms").unit is UNIT_REGISTRY["kg"]
+
+    def test_to_same_unit(self):
+        weight = Weight(2, "pood")
+        assert weight.to("pood") is weight
+
+    def test_to_rounds(self):
+        assert Weight(100, "lb").to("kg", 2).value == 45.36
+        assert Distance(1, "mile").to("km", 1).value == 1.6
+
+    def test_to_raises(self):
+        with pytest.raises(UnknownUnitError):
+            _ = Weight(1, "kg").to("m")
+        with pytest.raises(UnknownUnitError):
+            _ = Weight(1, "kg").to("parsec")
+
+    def test_conversion_factor(self):
+        assert conversion_factor("pood", "kg") == 16
+        assert conversion_factor("kgs", "pood") == 1 / 16
+        with pytest.raises(UnknownUnitError):
+            _ = conversion_factor("kg", "km")
+
+    @pytest.mark.parametrize(
+        "value, ndigits, exp_value",
+        [(2.675, 2, 2.68), (0.125, 2, 0.13), (-1.5, 0, -2), (2.5, 0, 3)],
+    )
+    def test_round_half_up(self, value, ndigits, exp_value):
+        assert round_half_up(value, ndigits) == exp_value
+
+    def test_convert_values(self):
+        assert convert_values([1, 2], "pood", "kg") == [16, 32]
+        assert convert_values([100, 225], "lb", "kg", 1) == [45.4, 102.1]
+
+    def test_convert_all(self):
+        weights = convert_all(
+            [Weight(1, "pood"), Weight(100, "lb"), Weight(20, "kg")], "kg", 1
+        )
+        assert [weight.value for weight in weights] == [16, 45.4, 20]
+        assert {weight.unit.name for weight in weights} == {"kg"}
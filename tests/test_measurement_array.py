@@ -0,0 +1,111 @@
+import pytest
+
+from workout_tracker.measurement import (
+    Distance,
+    DistanceUnit,
+    UnknownUnitError,
+    Weight,
+    WeightUnit,
+)
+from workout_tracker.measurement_array import MeasurementArray
+
+
+@pytest.fixture
+def weights():
+    return MeasurementArray.from_strings(
+        Weight, ["100 kg", "2 pood", "220.5 lbs"]
+    )
+
+
+class TestMeasurementArray:
+    def test_init(self):
+        array = MeasurementArray(Distance, [1, 2], ["m", DistanceUnit.KM])
+        assert len(array) == 2
+        assert array[1] == Distance(2000, DistanceUnit.M)
+
+    def test_init_raises(self):
+        with pytest.raises(TypeError):
+            _ = MeasurementArray(str)
+        with pytest.raises(ValueError):
+            _ = MeasurementArray(Weight, [1, 2], ["kg"])
+        with pytest.raises(UnknownUnitError):
+            _ = MeasurementArray(Weight, [1], ["m"])
+
+    def test_from_strings_raises(self):
+        with pytest.raises(UnknownUnitError):
+            _ = MeasurementArray.from_strings(Weight, ["100 kg", "400 m"])
+        with pytest.raises(ValueError):
+            _ = MeasurementArray.from_strings(Weight, ["100 kg 2"])
+
+    def test_from_measurements(self):
+        measurements = [Weight(100, "kg"), Weight(45, "lb")]
+        array = MeasurementArray.from_measurements(Weight, measurements)
+        assert list(array) == measurements
+
+    def test_si_values(self, weights):
+        assert list(weights.si_values()) == pytest.approx(
+            [100, 32, 220.5 * 0.45359237]
+        )
+
+    def test_to_unit(self, weights):
+        assert list(weights.to_unit(WeightUnit.POOD)) == pytest.approx(
+            [6.25, 2, 220.5 * 0.45359237 / 16]
+        )
+        with pytest.raises(UnknownUnitError):
+            _ = weights.to_unit("m")
+
+    def test_to_unit_rounds(self, weights):
+        assert list(weights.to_unit(WeightUnit.KG, 1)) == [100, 32, 100.0]
+
+    def test_sum(self, weights):
+        assert weights.sum().si_value == pytest.approx(
+            132 + 220.5 * 0.45359237
+        )
+        tonnage = weights.sum(unit="lb", weights=[5, 5, 0])
+        assert tonnage.unit.name == WeightUnit.LB
+        assert tonnage.si_value == pytest.approx(660)
+
+    @pytest.mark.parametrize("factors", [[5, 5], [5, 5, 0, 1]])
+    def test_sum_weights_length_mismatch(self, weights, factors):
+        with pytest.raises(ValueError):
+            weights.sum(weights=iter(factors))
+
+    def test_mean_min_max(self, weights):
+        assert weights.mean().si_value == pytest.approx(
+            (132 + 220.5 * 0.45359237) / 3
+        )
+        assert weights.min() == Weight(2, WeightUnit.POOD)
+        assert weights.max(unit="lb").value == pytest.approx(220.5)
+
+    def test_empty_raises(self):
+        array = MeasurementArray(Weight)
+        assert array.sum() == Weight(0, WeightUnit.KG)
+        with pytest.raises(ValueError):
+            _ = array.mean()
+        with pytest.raises(ValueError):
+            _ = array.max()
+
+    def test_compare_measurement(self, weights):
+        assert list(weights > Weight(50, "kg")) == [1, 0, 1]
+        assert list(weights == Weight(32, "kg")) == [0, 1, 0]
+        assert list(weights != Weight(32, "kg")) == [1, 0, 1]
+
+    def test_compare_array(self, weights):
+        other = MeasurementArray(Weight, [100, 100, 100], ["kg"] * 3)
+        assert list(weights <= other) == [1, 1, 0]
+        assert list(weights >= other) == [1, 0, 1]
+        assert list(weights < other) == [0, 1, 0]
+        with pytest.raises(ValueError):
+            _ = weights < MeasurementArray(Weight, [1], ["kg"])
+        with pytest.raises(TypeError):
+            _ = weights < Distance(1, "m")
+
+    def test_compare_tolerance(self):
+        distances = MeasurementArray(Distance, [12, 1], ["in", "ft"])
+        assert list(distances == Distance(1, "ft")) == [1, 1]
+        assert list(distances < Distance(12, "in")) == [0, 0]
+
+    def test_compress(self, weights):
+        heavy = weights.compress(weights > Weight(50, "kg"))
+        assert len(heavy) == 2
+        assert heavy[0] == Weight(100, WeightUnit.KG)
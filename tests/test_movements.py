@@ -0,0 +1,79 @@
+import pytest
+
+from workout_tracker.movements import CATALOG, MovementCatalog, canonical_name
+
+
+@pytest.fixture
+def catalog():
+    return MovementCatalog(
+        [
+            ("Back Squat", ["BS", "Squat"]),
+            ("Bench Press", ["BP"]),
+            ("Box Jump", []),
+            ("Burpee", []),
+        ]
+    )
+
+
+def test_canonical_name():
+    assert canonical_name("  back   squat ") == "Back Squat"
+
+
+class TestMovementCatalog:
+    @pytest.mark.parametrize(
+        "name",
+        ["Back Squat", "BS", "bs", "back squats", "Back-Squat", " squat "],
+    )
+    def test_lookup(self, catalog, name):
+        assert catalog.lookup(name) == 0
+
+    def test_lookup_plural_es(self, catalog):
+        assert catalog.lookup("bench presses") == 1
+
+    def test_lookup_unknown(self, catalog):
+        assert catalog.lookup("Pistol") is None
+        assert catalog.resolve("Pistol") is None
+
+    def test_resolve(self, catalog):
+        movement = catalog.resolve("bp")
+        assert movement.name == "Bench Press"
+        assert movement.aliases == ("BP",)
+        assert catalog[movement.id] == movement
+
+    def test_add_aliases(self, catalog):
+        assert catalog.lookup("Pistol") is None
+        assert catalog.add("back squat", ["Pistol"]) == 0
+        assert catalog.lookup("Pistol") == 0
+        assert catalog[0].aliases == ("BS", "Squat", "Pistol")
+        assert len(catalog) == 4
+
+    def test_add_conflict(self, catalog):
+        with pytest.raises(ValueError):
+            catalog.add("Front Squat", ["Squat"])
+
+    def test_complete(self, catalog):
+        assert [movement.name for movement in catalog.complete("b")] == [
+            "Back Squat",
+            "Bench Press",
+            "Box Jump",
+            "Burpee",
+        ]
+        assert [
+            movement.name for movement in catalog.complete("B", limit=2)
+        ] == ["Back Squat", "Bench Press"]
+        assert catalog.complete("x") == []
+
+    def test_cache_bounded(self):
+        catalog = MovementCatalog([("Run", [])], cache_size=2)
+        for name in ["run", "Run", "RUN", "run"]:
+            assert catalog.lookup(name) == 0
+        info = catalog.cache_info()
+        assert info.currsize == 2
+        assert info.hits == 0
+
+    def test_default_catalog(self):
+        assert CATALOG.lookup("C&J") == CATALOG.lookup("clean and jerk")
+        assert CATALOG.lookup("pull-ups") == CATALOG.lookup("PU")
+        assert [movement.id for movement in CATALOG] == list(
+            range(len(CATALOG))
+        )
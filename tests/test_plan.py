@@ -0,0 +1,191 @@
+import copy
+from datetime import timedelta
+
+import pytest
+
+from workout_tracker import plan as plan_module
+from workout_tracker.analytics import iter_movements, work_time
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import Distance, Weight
+from workout_tracker.movements import CATALOG
+from workout_tracker.plan import (
+    BUY_IN,
+    BUY_OUT,
+    COMPLEX,
+    EXERCISE,
+    SUB_EXERCISE,
+    WORKOUT,
+    clear_plan_cache,
+    compile_plan,
+)
+from workout_tracker.timeline import total_duration
+from workout_tracker.workout import Amrap, Workout
+
+
+def minutes(value):
+    return timedelta(minutes=value)
+
+
+@pytest.fixture
+def complex_exercise():
+    return Exercise(
+        name=None,
+        reps=3,
+        weight=Weight(60, "kg"),
+        duration=timedelta(seconds=10),
+        sub_exercises=[
+            Exercise(name="Clean", reps=2),
+            Exercise(name="Split Jerk", reps=1),
+        ],
+    )
+
+
+@pytest.fixture
+def amrap(complex_exercise):
+    return Amrap(
+        duration=minutes(5),
+        exercises=[
+            Exercise(name="Run", distance=Distance(200, "m")),
+            complex_exercise,
+            Exercise(name="Burpee", reps=5),
+        ],
+        repeats=3,
+        rest=minutes(1),
+        buy_in=Amrap(
+            duration=minutes(2),
+            exercises=[Exercise(name="Row", distance=Distance(500, "m"))],
+            repeats=2,
+        ),
+        buy_out=Amrap(
+            duration=minutes(1),
+            exercises=[Exercise(name="Double Under", reps=50)],
+        ),
+    )
+
+
+def test_rows(amrap):
+    plan = compile_plan(amrap)
+    assert list(plan.kinds) == [
+        WORKOUT,
+        WORKOUT,
+        EXERCISE,
+        EXERCISE,
+        SUB_EXERCISE,
+        SUB_EXERCISE,
+        COMPLEX,
+        EXERCISE,
+        WORKOUT,
+        EXERCISE,
+    ]
+    assert list(plan.parents) == [-1, 0, 1, 0, 6, 6, 0, 0, 0, 8]
+    assert list(plan.depths) == [0, 1, 1, 0, 0, 0, 0, 0, 1, 1]
+    assert plan.roles[1] == BUY_IN
+    assert plan.roles[8] == BUY_OUT
+    assert plan.names[4] == "Clean"
+    assert plan.movement_ids[4] == CATALOG.lookup("Clean")
+    assert plan.movement_ids[6] == -1
+    assert len(plan) == 10
+
+
+@pytest.mark.parametrize("rounds", [1, 4, 2.5])
+def test_movements(amrap, rounds):
+    plan = compile_plan(amrap)
+    assert list(plan.movements(rounds)) == list(
+        iter_movements(amrap, rounds=rounds)
+    )
+
+
+def test_frozen_exercises(amrap, complex_exercise):
+    frozen = complex_exercise.freeze()
+    assert list(compile_plan(frozen).movements()) == list(
+        iter_movements(complex_exercise)
+    )
+    amrap.exercises = [exercise.freeze() for exercise in amrap.exercises]
+    assert list(compile_plan(amrap).movements(2)) == list(
+        iter_movements(amrap, rounds=2)
+    )
+
+
+def test_exercise(complex_exercise):
+    plan = compile_plan(complex_exercise)
+    assert list(plan.movements()) == list(iter_movements(complex_exercise))
+    assert plan.work_time() == work_time(complex_exercise) == 30
+    assert plan.total_duration() == timedelta(0)
+
+
+def test_times(amrap):
+    plan = compile_plan(amrap)
+    assert plan.work_time() == work_time(amrap)
+    assert plan.total_duration() == total_duration(amrap)
+
+
+def test_outline(amrap):
+    assert list(compile_plan(amrap).outline()) == [
+        "3 x 0:05:00 AMRAP, rest 0:01:00",
+        "  Buy-in: 2 x 0:02:00 AMRAP",
+        "    500 m Row",
+        "  200 m Run",
+        f"  {amrap.exercises[1]}",
+        "  5 Burpee",
+        "  Buy-out: 0:01:00 AMRAP",
+        "    50 Double Under",
+    ]
+
+
+def test_cache(amrap):
+    plan = compile_plan(amrap)
+    assert compile_plan(amrap) is plan
+    assert compile_plan(copy.deepcopy(amrap)) is plan
+    clear_plan_cache()
+    assert compile_plan(amrap) is not plan
+
+
+def test_cache_follows_changes(amrap):
+    plan = compile_plan(amrap)
+    amrap.repeats = 2
+    assert compile_plan(amrap) is not plan
+    assert compile_plan(amrap).work_time() == work_time(amrap)
+    amrap.exercises.append(Exercise(name="Burpee", reps=10))
+    amrap.exercises[0].reps = 2
+    assert list(compile_plan(amrap).movements(3)) == list(
+        iter_movements(amrap, rounds=3)
+    )
+
+
+def test_cache_follows_sub_exercises(amrap, complex_exercise):
+    _ = compile_plan(amrap)
+    plan = compile_plan(complex_exercise)
+    complex_exercise.sub_exercises[0].reps = 3
+    assert list(compile_plan(complex_exercise).movements()) == list(
+        iter_movements(complex_exercise)
+    )
+    assert compile_plan(complex_exercise) is not plan
+    assert list(compile_plan(amrap).movements(2)) == list(
+        iter_movements(amrap, rounds=2)
+    )
+
+
+def test_plans_are_read_only(amrap):
+    plan = compile_plan(amrap)
+    with pytest.raises(TypeError):
+        plan.reps[0] = 10
+    with pytest.raises(TypeError):
+        plan.labels[0] = "Nothing"
+    with pytest.raises(AttributeError):
+        plan.loads = []
+    assert list(compile_plan(amrap).movements()) == list(iter_movements(amrap))
+
+
+def test_cache_size(monkeypatch):
+    monkeypatch.setattr(plan_module, "PLAN_CACHE_SIZE", 2)
+    clear_plan_cache()
+    plans = [
+        compile_plan(Exercise(name="Burpee", reps=reps)) for reps in (1, 2, 3)
+    ]
+    assert compile_plan(Exercise(name="Burpee", reps=3)) is plans[2]
+    assert compile_plan(Exercise(name="Burpee", reps=1)) is not plans[0]
+
+
+def test_unsupported_workout():
+    with pytest.raises(TypeError):
+        compile_plan(Workout())
@@ -0,0 +1,93 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import Distance, Weight
+from workout_tracker.records import PersonalRecordIndex, RecordKind
+
+
+def squat(reps, kilos, unit="kg"):
+    return Exercise(name="Back Squat", reps=reps, weight=Weight(kilos, unit))
+
+
+def run(meters, seconds):
+    return Exercise(
+        name="Run",
+        distance=Distance(meters, "m"),
+        duration=timedelta(seconds=seconds),
+    )
+
+
+@pytest.fixture
+def index():
+    index = PersonalRecordIndex()
+    index.extend(
+        [
+            (date(2025, 1, 1), squat(5, 100)),
+            (date(2025, 1, 2), squat(3, 110)),
+            (date(2025, 1, 3), squat(1, 130)),
+            (date(2025, 1, 4), run(400, 90)),
+            (date(2025, 1, 5), Exercise(name="Pull Up", reps=12)),
+        ]
+    )
+    return index
+
+
+def test_add_reports_new_records(index):
+    assert index.add(squat(5, 100), date(2025, 2, 1)) == []
+    new_records = index.add(squat(5, 225, "lb"), date(2025, 2, 2))
+    assert [(record.kind, record.scheme) for record in new_records] == [
+        (RecordKind.WEIGHT, 5),
+    ]
+    assert index.heaviest("back squat", 5).day == date(2025, 2, 2)
+    assert index.max_reps("Back Squat").value == 5
+
+    new_records = index.add(Exercise(name="Pull Up", reps=15))
+    assert new_records[0].value == 15
+
+
+def test_fastest(index):
+    assert index.fastest("Run", Distance(0.4, "km")).value == timedelta(
+        seconds=90
+    )
+    assert index.add(run(400, 95)) == []
+    assert index.add(run(400, 85))[0].value == timedelta(seconds=85)
+    assert index.fastest("Run", Distance(1, "km")) is None
+
+
+def test_rep_maxes(index):
+    index.add(squat(10, 80))
+    assert [record.scheme for record in index.rep_maxes("Back Squat")] == [
+        1,
+        3,
+        5,
+        10,
+    ]
+    assert index.best_for_reps("Back Squat", 2).value == Weight(110, "kg")
+    assert index.best_for_reps("Back Squat", 4).value == Weight(100, "kg")
+    assert index.best_for_reps("Back Squat", 11) is None
+    assert index.best_for_reps("Deadlift", 1) is None
+
+
+def test_snapshot_restore(index):
+    snapshot = json.loads(json.dumps(index.snapshot()))
+    restored = PersonalRecordIndex.restore(snapshot)
+    assert list(restored) == list(index)
+    assert restored.rep_maxes("Back Squat") == index.rep_maxes("Back Squat")
+    assert restored.add(squat(3, 110)) == []
+
+
+def test_snapshot_exponents():
+    index = PersonalRecordIndex()
+    index.add(squat(1, 1e-05))
+    index.add(run(1e-05, 1))
+    snapshot = json.loads(json.dumps(index.snapshot()))
+    restored = PersonalRecordIndex.restore(snapshot)
+    assert list(restored) == list(index)
+
+
+def test_restore_raises():
+    with pytest.raises(ValueError):
+        PersonalRecordIndex.restore({"version": 0, "records": []})
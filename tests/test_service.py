@@ -0,0 +1,199 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.jsonl import RecordError, iter_load
+from workout_tracker.measurement import Weight
+from workout_tracker.service import (
+    BatchWriter,
+    IngestionService,
+    JsonlStorage,
+    SqliteStorage,
+    Storage,
+    parse_payload,
+)
+from workout_tracker.sqlite_store import WorkoutRepository
+
+SQUAT = {"name": "Back Squat", "reps": 5, "weight": "100 kg"}
+
+
+class BlockingStorage(Storage):
+    def __init__(self):
+        self.release = threading.Event()
+        self.batches = []
+
+    def write(self, exercises):
+        self.release.wait(timeout=5)
+        self.batches.append(exercises)
+
+
+async def request(port, method, target, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {target} HTTP/1.1\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_parse_payload():
+    assert parse_payload(json.dumps(SQUAT).encode()) == [
+        Exercise(name="Back Squat", reps=5, weight=Weight(100, "kg"))
+    ]
+    assert len(parse_payload(json.dumps([SQUAT, SQUAT]).encode())) == 2
+    with pytest.raises(RecordError):
+        parse_payload(b"not json")
+    with pytest.raises(RecordError) as info:
+        parse_payload(json.dumps([SQUAT, {"reps": 5}]).encode())
+    assert info.value.line_number == 2
+
+
+def test_ingest_jsonl(tmp_path):
+    path = tmp_path / "exercises.jsonl"
+
+    async def run():
+        writer = BatchWriter(JsonlStorage(path), max_delay=0.01)
+        async with IngestionService(writer, port=0) as service:
+            responses = await asyncio.gather(
+                request(service.port, "POST", "/exercises", SQUAT),
+                request(service.port, "POST", "/exercises", [SQUAT] * 3),
+                request(service.port, "POST", "/exercises", {"reps": 5}),
+                request(service.port, "GET", "/health"),
+                request(service.port, "GET", "/exercises"),
+                request(service.port, "GET", "/unknown"),
+            )
+        return responses
+
+    responses = asyncio.run(run())
+    assert [status for status, _ in responses] == [
+        201,
+        201,
+        400,
+        200,
+        405,
+        404,
+    ]
+    assert responses[1][1] == {"accepted": 3}
+    assert len(list(iter_load(path))) == 4
+
+
+def test_ingest_sqlite(tmp_path):
+    path = tmp_path / "exercises.db"
+
+    async def run():
+        writer = BatchWriter(SqliteStorage(path), max_batch_size=2)
+        async with IngestionService(writer, port=0) as service:
+            await asyncio.gather(
+                *(
+                    request(service.port, "POST", "/exercises", SQUAT)
+                    for _ in range(5)
+                )
+            )
+        writer.storage.close()
+
+    asyncio.run(run())
+    with WorkoutRepository(path) as repository:
+        assert [exercise for _, exercise in repository] == [
+            Exercise.from_dict(SQUAT)
+        ] * 5
+
+
+def test_backpressure():
+    storage = BlockingStorage()
+
+    async def run():
+        writer = BatchWriter(storage, max_batch_size=1, max_pending=1)
+        async with IngestionService(writer, port=0) as service:
+            first = asyncio.create_task(
+                request(service.port, "POST", "/exercises", SQUAT)
+            )
+            await asyncio.sleep(0.1)
+            second = asyncio.create_task(
+                request(service.port, "POST", "/exercises", SQUAT)
+            )
+            await asyncio.sleep(0.1)
+            rejected = await request(service.port, "POST", "/exercises", SQUAT)
+            storage.release.set()
+            return rejected, await first, await second
+
+    rejected, first, second = asyncio.run(run())
+    assert rejected[0] == 503
+    assert first[0] == second[0] == 201
+    assert len(storage.batches) == 2
+
+
+def test_keep_alive(tmp_path):
+    async def run():
+        writer = BatchWriter(JsonlStorage(tmp_path / "x.jsonl"), max_delay=0)
+        async with IngestionService(writer, port=0) as service:
+            reader, stream = await asyncio.open_connection(
+                "127.0.0.1", service.port
+            )
+            statuses = []
+            for _ in range(3):
+                stream.write(b"GET /health HTTP/1.1\r\n\r\n")
+                statuses.append(await reader.readline())
+                await reader.readuntil(b"\r\n\r\n")
+                await reader.readexactly(15)
+            stream.close()
+            return statuses
+
+    assert asyncio.run(run()) == [b"HTTP/1.1 200 OK\r\n"] * 3
+
+
+async def raw_request(port, data):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split()[1])
+
+
+@pytest.mark.parametrize("length", ["-1", "1_0", "abc", "\u00b2"])
+def test_bad_content_length(tmp_path, length):
+    async def run():
+        writer = BatchWriter(JsonlStorage(tmp_path / "x.jsonl"), max_delay=0)
+        async with IngestionService(writer, port=0) as service:
+            return await raw_request(
+                service.port,
+                f"POST /exercises HTTP/1.1\r\nContent-Length: {length}"
+                "\r\n\r\n".encode("latin-1"),
+            )
+
+    assert asyncio.run(run()) == 400
+
+
+def test_invalid_name(tmp_path):
+    async def run():
+        writer = BatchWriter(JsonlStorage(tmp_path / "x.jsonl"), max_delay=0)
+        async with IngestionService(writer, port=0) as service:
+            return await request(
+                service.port, "POST", "/exercises", {"name": None, "reps": 5}
+            )
+
+    status, payload = asyncio.run(run())
+    assert status == 400
+    assert "name" in payload["error"]
+
+
+def test_unexpected_error(tmp_path, monkeypatch):
+    async def fail(*args):
+        raise RuntimeError("boom")
+
+    async def run():
+        writer = BatchWriter(JsonlStorage(tmp_path / "x.jsonl"), max_delay=0)
+        async with IngestionService(writer, port=0) as service:
+            monkeypatch.setattr(service, "_dispatch", fail)
+            return await request(service.port, "GET", "/health")
+
+    assert asyncio.run(run()) == (500, {"error": "Internal error."})
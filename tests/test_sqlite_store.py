@@ -0,0 +1,137 @@
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import Distance, Weight
+from workout_tracker.sqlite_store import WorkoutRepository
+from workout_tracker.workout import Amrap
+
+
+def squat(value, unit="kg"):
+    return Exercise(name="Back Squat", reps=5, weight=Weight(value, unit))
+
+
+@pytest.fixture
+def amrap():
+    return Amrap(
+        duration=timedelta(minutes=12),
+        exercises=[
+            Exercise(name="Run", distance=Distance(200, "m")),
+            Exercise(
+                name=None,
+                reps=3,
+                weight=Weight(52.5, "kg"),
+                sub_exercises=[
+                    Exercise(name="Clean", reps=1),
+                    Exercise(name="Jerk", reps=2),
+                ],
+            ),
+            Exercise(name="Box Jump", reps=10, height=Distance(24, "in")),
+        ],
+        repeats=2,
+        rest=timedelta(minutes=1, seconds=30),
+        buy_in=Amrap(
+            duration=timedelta(minutes=2),
+            exercises=[
+                Exercise(name="Plank", duration=timedelta(seconds=45.5))
+            ],
+            buy_out=Amrap(
+                duration=timedelta(minutes=1),
+                exercises=[Exercise(name="Burpee", reps=10)],
+            ),
+        ),
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    with WorkoutRepository(tmp_path / "workouts.db", pool_size=2) as repo:
+        yield repo
+
+
+def test_round_trip(repository, amrap):
+    records = [
+        (date(2025, 1, 1), squat(100)),
+        (date(2025, 1, 2), amrap),
+        (None, squat(225, "lb")),
+        (date(2025, 1, 3), squat(102.5, "lb")),
+    ]
+    ids = repository.extend(records)
+    assert len(set(ids)) == 4
+    assert list(repository) == records
+    assert repository.get(ids[1]) == records[1]
+
+    loaded = list(repository)
+    assert loaded[2][1].weight.value == 225
+    assert isinstance(loaded[2][1].weight.value, int)
+    assert loaded[3][1].weight.value == 102.5
+    assert str(loaded[1][1].exercises[1]) == "3 1 Clean + 2 Jerk 52.5 kg"
+
+
+def test_frozen_exercises(repository, amrap):
+    frozen = Amrap(
+        duration=amrap.duration,
+        exercises=[exercise.freeze() for exercise in amrap.exercises],
+    )
+    ids = repository.extend([(None, squat(100).freeze()), (None, frozen)])
+    assert repository.get(ids[0]) == (None, squat(100))
+    assert repository.get(ids[1])[1].exercises == amrap.exercises
+
+
+def test_get_raises(repository):
+    with pytest.raises(KeyError):
+        repository.get(1)
+
+
+def test_extend_rolls_back(repository):
+    repository.add(squat(100))
+    with pytest.raises(TypeError):
+        repository.extend([(None, squat(105)), (None, "5 Back Squat")])
+    assert len(list(repository)) == 1
+    assert repository.add(squat(110)) == 2
+
+
+def test_query(repository, amrap):
+    repository.extend(
+        [
+            (date(2025, 1, 1), squat(100)),
+            (date(2025, 1, 2), amrap),
+            (date(2025, 2, 1), squat(225, "lb")),
+            (date(2025, 3, 1), squat(2, "pood")),
+        ]
+    )
+    assert [day for day, _ in repository.query("back squat")] == [
+        date(2025, 1, 1),
+        date(2025, 2, 1),
+        date(2025, 3, 1),
+    ]
+    assert repository.query(
+        "Back Squat", min_load=Weight(220, "lb"), max_load=Weight(101, "kg")
+    ) == [(date(2025, 1, 1), squat(100))]
+    assert repository.query(
+        "Back Squat", start=date(2025, 1, 15), end=date(2025, 2, 28)
+    ) == [(date(2025, 2, 1), squat(225, "lb"))]
+    assert [exercise.name for _, exercise in repository.query("Burpee")] == [
+        "Burpee"
+    ]
+    assert repository.query("1 Clean + 2 Jerk")[0][1] == amrap.exercises[1]
+    assert len(repository.query(min_load=Weight(50, "kg"))) == 3
+
+
+def test_concurrent_readers(repository):
+    repository.extend((None, squat(kilos)) for kilos in range(50, 150))
+    results = []
+
+    def read():
+        results.append(len(repository.query(min_load=Weight(100, "kg"))))
+
+    threads = [threading.Thread(target=read) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    repository.add(squat(200))
+    for thread in threads:
+        thread.join()
+    assert set(results) <= {50, 51}
+    assert len(results) == 6
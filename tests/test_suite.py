@@ -0,0 +1,44 @@
+import json
+import sys
+
+import pytest
+
+from benchmarks import suite
+
+
+def test_compare():
+    baseline = {"fast": 100.0, "slow": 100.0, "gone": 100.0}
+    results = {"fast": 120.0, "slow": 79.0, "new": 1.0}
+    assert suite.compare(results, baseline, 0.2) == ["slow"]
+    assert suite.compare(results, baseline, 0.25) == []
+    assert suite.compare({"edge": 80.0}, {"edge": 100.0}, 0.2) == []
+    assert suite.compare(results, {}, 0.2) == []
+
+
+def run_suite(monkeypatch, *args):
+    monkeypatch.setattr(
+        sys, "argv", ["suite", "--count", "40", "--repeats", "1", *args]
+    )
+    suite.main()
+
+
+def test_gate(monkeypatch, tmp_path):
+    path = tmp_path / "baseline.json"
+    with pytest.raises(SystemExit) as error:
+        run_suite(monkeypatch, "--baseline", str(path))
+    assert error.value.code == 1
+
+    run_suite(monkeypatch, "--baseline", str(path), "--save")
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    assert set(baseline) == set(suite.cases(40))
+
+    path.write_text(
+        json.dumps({name: 1e-3 for name in baseline}), encoding="utf-8"
+    )
+    run_suite(monkeypatch, "--baseline", str(path))
+    path.write_text(
+        json.dumps({name: 1e12 for name in baseline}), encoding="utf-8"
+    )
+    with pytest.raises(SystemExit) as error:
+        run_suite(monkeypatch, "--baseline", str(path))
+    assert error.value.code == 1
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from itertools import islice
+
+import pytest
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import Distance, Weight
+from workout_tracker.timeline import (
+    EventKind,
+    iter_rounds,
+    round_reps,
+    score_volume,
+    timeline,
+    total_duration,
+)
+from workout_tracker.workout import Amrap
+
+
+def minutes(value):
+    return timedelta(minutes=value)
+
+
+@pytest.fixture
+def amrap():
+    return Amrap(
+        duration=minutes(5),
+        exercises=[
+            Exercise(name="Run", distance=Distance(200, "m")),
+            Exercise(
+                name="Kettlebell Swing", reps=10, weight=Weight(24, "kg")
+            ),
+            Exercise(name="Burpee", reps=5),
+        ],
+        repeats=3,
+        rest=minutes(1),
+        buy_in=Amrap(
+            duration=minutes(2),
+            exercises=[Exercise(name="Row", distance=Distance(500, "m"))],
+        ),
+        buy_out=Amrap(
+            duration=minutes(3),
+            exercises=[Exercise(name="Pull Up", reps=5)],
+            repeats=2,
+        ),
+    )
+
+
+def test_total_duration(amrap):
+    assert total_duration(amrap) == minutes(2 + 3 * 5 + 2 + 2 * 3)
+
+
+def test_timeline(amrap):
+    events = list(timeline(amrap))
+    assert [
+        (event.start, event.end, event.kind, event.repeat, event.depth)
+        for event in events
+    ] == [
+        (minutes(0), minutes(2), EventKind.WORK, 1, 1),
+        (minutes(2), minutes(7), EventKind.WORK, 1, 0),
+        (minutes(7), minutes(8), EventKind.REST, 2, 0),
+        (minutes(8), minutes(13), EventKind.WORK, 2, 0),
+        (minutes(13), minutes(14), EventKind.REST, 3, 0),
+        (minutes(14), minutes(19), EventKind.WORK, 3, 0),
+        (minutes(19), minutes(22), EventKind.WORK, 1, 1),
+        (minutes(22), minutes(25), EventKind.WORK, 2, 1),
+    ]
+    assert events[0].workout is amrap.buy_in
+    assert events[-1].end == total_duration(amrap)
+    assert events[1].duration == minutes(5)
+
+
+def test_timeline_is_lazy():
+    long_amrap = Amrap(
+        duration=minutes(1), exercises=[], repeats=10**12, rest=minutes(1)
+    )
+    events = list(islice(timeline(long_amrap), 3))
+    assert events[-1].start == minutes(2)
+
+
+def test_timeline_raises():
+    with pytest.raises(TypeError):
+        _ = list(timeline(Exercise(name="Burpee", reps=5)))
+
+
+def test_iter_rounds(amrap):
+    assert [
+        (number, exercise.name)
+        for number, exercise in islice(iter_rounds(amrap), 4)
+    ] == [
+        (1, "Run"),
+        (1, "Kettlebell Swing"),
+        (1, "Burpee"),
+        (2, "Run"),
+    ]
+
+
+def test_round_reps(amrap):
+    assert round_reps(amrap) == 16
+
+
+def test_score_volume(amrap):
+    volume = score_volume(amrap, rounds=4, reps=6)
+    extra_swings = 5 / 10 * 3
+    assert volume.reps == pytest.approx(5 * 2 + 3 * (4 * 15 + 5))
+    assert volume.loaded_reps == pytest.approx(3 * (4 * 10 + 5))
+    assert volume.tonnage == pytest.approx(
+        24 * (3 * 4 * 10 + extra_swings * 10)
+    )
+    assert volume.distance == pytest.approx(500 + 3 * 5 * 200)
+    assert volume.time == (2 + 3 * 5 + 2 * 3) * 60
+
+
+def test_score_volume_after_change(amrap):
+    before = score_volume(amrap, rounds=2)
+    amrap.repeats = 1
+    amrap.exercises.append(
+        Exercise(name="Deadlift", reps=5, weight=Weight(100, "kg"))
+    )
+    after = score_volume(amrap, rounds=2)
+    assert after != before
+    assert after.tonnage == pytest.approx(2 * (240 + 500))
+    assert after.time == (2 + 5 + 2 * 3) * 60
+
+
+def test_score_volume_large_score():
+    amrap = Amrap(
+        duration=minutes(20), exercises=[Exercise(name="Burpee", reps=5)]
+    )
+    assert score_volume(amrap, rounds=10**9, reps=3).reps == 5 * 10**9 + 3
+
+
+def test_score_volume_zero_score(amrap):
+    volume = score_volume(amrap, rounds=0)
+    assert volume.reps == score_volume(amrap, rounds=1).reps - 3 * 15
+
+
+def test_score_volume_raises(amrap):
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = score_volume(amrap, rounds=-1)
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = score_volume(amrap, rounds=1, reps=-1)
+    with pytest.raises(ValueError):
+        _ = score_volume(amrap, rounds=1, reps=16)
@@ -0,0 +1,138 @@
+import json
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.measurement import Weight
+from workout_tracker.movements import CATALOG
+from workout_tracker.training_load import TrainingLoad
+from workout_tracker.workout import Amrap
+
+START = date(2025, 1, 1)
+
+
+def squat(reps, kilos, unit="kg", name="Back Squat"):
+    return Exercise(name=name, reps=reps, weight=Weight(kilos, unit))
+
+
+def history(days, seed=0):
+    rng = random.Random(seed)
+    return [
+        (START + timedelta(days=day), squat(rng.randint(1, 5), 100))
+        for day in sorted(rng.sample(range(days * 2), days))
+    ]
+
+
+def test_rolling_sums():
+    load = TrainingLoad()
+    load.add(squat(5, 100), START)
+    load.add(squat(5, 225, "lb", name="BS"), START)
+    metrics = load.metrics()
+    assert metrics.acute == metrics.chronic == pytest.approx(1010.29, 1e-4)
+    assert load.metrics(movement="back squats") == metrics
+
+    load.advance(START + timedelta(days=7))
+    assert load.metrics().acute == 0
+    assert load.metrics().chronic == pytest.approx(1010.29, 1e-4)
+    load.advance(START + timedelta(days=28))
+    metrics = load.metrics()
+    assert metrics.acute == metrics.chronic == 0
+    assert metrics.ratio is None
+    assert 0 < metrics.acute_ewma < metrics.chronic_ewma
+
+
+def test_sums_return_to_zero():
+    load = TrainingLoad()
+    for day in range(10):
+        load.add(squat(1, 0.1 * (day + 1)), START + timedelta(days=day))
+    load.advance(START + timedelta(days=16))
+    assert load.metrics().acute == 0.0
+    assert load.metrics().chronic > 0
+    load.advance(START + timedelta(days=37))
+    metrics = load.metrics()
+    assert metrics.acute == metrics.chronic == 0.0
+    assert metrics.ratio is None
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_matches_recomputation(seed):
+    records = history(60, seed)
+    load = TrainingLoad()
+    for day, exercise in records:
+        load.add(exercise, day)
+        acute = sum(
+            other.reps * 100
+            for other_day, other in records
+            if day - timedelta(days=7) < other_day <= day
+        )
+        chronic = sum(
+            other.reps * 100
+            for other_day, other in records
+            if day - timedelta(days=28) < other_day <= day
+        )
+        metrics = load.metrics()
+        assert metrics.acute == pytest.approx(acute)
+        assert metrics.chronic == pytest.approx(chronic)
+        assert metrics.ratio == pytest.approx(acute * 4 / chronic)
+
+
+def test_ewma():
+    load = TrainingLoad(acute_days=3, chronic_days=7)
+    load.add(squat(1, 100), START)
+    assert load.metrics().acute_ewma == pytest.approx(50)
+    assert load.metrics().chronic_ewma == pytest.approx(25)
+    load.advance(START + timedelta(days=2))
+    assert load.metrics().acute_ewma == pytest.approx(12.5)
+    load.add(squat(1, 100), START + timedelta(days=2))
+    metrics = load.metrics()
+    assert metrics.acute_ewma == pytest.approx(62.5)
+    assert metrics.chronic_ewma == pytest.approx(25 * 0.75**2 + 25)
+    assert metrics.ewma_ratio == pytest.approx(62.5 / (25 * 0.75**2 + 25))
+
+
+def test_athletes_and_movements():
+    load = TrainingLoad()
+    amrap = Amrap(
+        duration=timedelta(minutes=10),
+        exercises=[squat(5, 60), squat(5, 40, name="Thruster")],
+    )
+    load.add(amrap, START, athlete="Alex", rounds=3)
+    load.add(squat(1, 50, name="Zercher Squat"), START, athlete="Sam")
+    assert sorted(load.athletes()) == ["Alex", "Sam"]
+    assert load.metrics("Alex").acute == 1500
+    assert load.by_movement("Alex") == {
+        CATALOG.lookup("Back Squat"): load.metrics("Alex", "Back Squat"),
+        CATALOG.lookup("Thruster"): load.metrics("Alex", "Thruster"),
+    }
+    assert list(load.by_movement("Sam")) == ["Zercher Squat"]
+    assert load.metrics("Kim").ratio is None
+    assert len(load) == 5
+
+
+def test_days_in_order():
+    load = TrainingLoad()
+    load.add(squat(1, 100), START)
+    with pytest.raises(ValueError):
+        load.add(squat(1, 100), START - timedelta(days=1))
+    with pytest.raises(ValueError):
+        TrainingLoad(acute_days=28, chronic_days=7)
+
+
+def test_snapshot_restore():
+    records = history(40)
+    load = TrainingLoad()
+    load.extend(records[:30])
+    snapshot = json.loads(json.dumps(load.snapshot()))
+    restored = TrainingLoad.restore(snapshot)
+    assert restored.day == load.day
+    for day, exercise in records[30:]:
+        load.add(exercise, day)
+        restored.add(exercise, day)
+    assert restored.metrics() == pytest.approx(load.metrics())
+
+
+def test_restore_raises():
+    with pytest.raises(ValueError):
+        TrainingLoad.restore({"version": 0, "windows": []})
@@ -0,0 +1,259 @@
+from datetime import timedelta
+
+import pytest
+from hypothesis import given, settings
+from hypothesis.strategies import (
+    builds,
+    integers,
+    none,
+    one_of,
+    sampled_from,
+    timedeltas,
+)
+
+from workout_tracker.exercise import Exercise
+from workout_tracker.jsonl import RecordError
+from workout_tracker.measurement import (
+    Distance,
+    DistanceUnit,
+    Weight,
+    WeightUnit,
+)
+from workout_tracker.whiteboard import (
+    iter_parse,
+    iter_parse_csv,
+    iter_parse_file,
+    parse_amrap_header,
+    parse_line,
+    tokenize,
+)
+from workout_tracker.workout import Amrap
+
+NAMES = ["Back Squat", "Run", "Box Jump", "C2B Pull Up", "Wall Ball"]
+
+
+def test_tokenize():
+    assert tokenize("3 x 100kg 1:30 + 2 mi") == [
+        ("reps", 3),
+        ("word", "x"),
+        ("weight", Weight(100, "kg")),
+        ("duration", timedelta(seconds=90)),
+        ("plus", "+"),
+        ("distance", Distance(2, "mile")),
+    ]
+
+
+@pytest.mark.parametrize(
+    "line, exercise",
+    [
+        (
+            "5 back squat 100 kgs",
+            Exercise(
+                name="Back Squat", reps=5, weight=Weight(100, WeightUnit.KG)
+            ),
+        ),
+        (
+            "400m run",
+            Exercise(name="Run", distance=Distance(400, DistanceUnit.M)),
+        ),
+        (
+            "20 Box Jumps 24 inches",
+            Exercise(
+                name="Box Jumps",
+                reps=20,
+                height=Distance(24, DistanceUnit.INCH),
+            ),
+        ),
+        (
+            "1 min Plank",
+            Exercise(name="Plank", duration=timedelta(minutes=1)),
+        ),
+        (
+            "3 2 Power Clean + 1 Split Jerk 70 kg",
+            Exercise(
+                name=None,
+                reps=3,
+                weight=Weight(70, WeightUnit.KG),
+                sub_exercises=[
+                    Exercise(name="Power Clean", reps=2),
+                    Exercise(name="Split Jerk", reps=1),
+                ],
+            ),
+        ),
+    ],
+)
+def test_parse_line(line, exercise):
+    assert parse_line(line) == exercise
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "5 100 kg",
+        "Run 400 m fast",
+        "Squat 5",
+        "5 Squat 100 kg 90 kg",
+        "5 Clean 50 kg + 1 Jerk",
+        "5 Clean + Jerk",
+        "2.5 Squat",
+        "Plank 99999999999999999999 min",
+        "99999999999999999999:00:00 Plank",
+    ],
+)
+def test_parse_line_raises(line):
+    with pytest.raises(ValueError):
+        parse_line(line)
+
+
+@given(
+    name=sampled_from(NAMES),
+    reps=one_of(none(), integers(min_value=1, max_value=100)),
+    duration=one_of(
+        none(),
+        timedeltas(
+            min_value=timedelta(seconds=1),
+            max_value=timedelta(hours=2),
+        ),
+    ),
+    distance=builds(
+        Distance,
+        value=integers(min_value=1, max_value=5000).map(float),
+        unit=sampled_from(DistanceUnit),
+    ),
+    weight=one_of(
+        none(),
+        builds(
+            Weight,
+            value=integers(min_value=1, max_value=300).map(float),
+            unit=sampled_from(WeightUnit),
+        ),
+    ),
+)
+@settings(max_examples=50)
+def test_round_trip(name, reps, duration, distance, weight):
+    exercise = Exercise(
+        name=name,
+        reps=reps,
+        duration=duration,
+        distance=distance,
+        weight=weight,
+    )
+    assert parse_line(str(exercise)) == exercise
+
+
+def test_round_trip_complex():
+    exercise = Exercise(
+        name=None,
+        reps=5,
+        weight=Weight(50, "lb"),
+        height=Distance(20, "in"),
+        sub_exercises=[
+            Exercise(name="Clean", reps=3),
+            Exercise(name="Jerk", reps=1),
+        ],
+    )
+    assert parse_line(str(exercise)) == exercise
+
+
+@pytest.mark.parametrize(
+    "line, duration",
+    [
+        ("20 min AMRAP", timedelta(minutes=20)),
+        ("AMRAP in 12:00:", timedelta(minutes=12)),
+        ("amrap 7 minutes", timedelta(minutes=7)),
+        ("5 Back Squat 100 kg", None),
+        ("AMRAP", None),
+    ],
+)
+def test_parse_amrap_header(line, duration):
+    assert parse_amrap_header(line) == duration
+
+
+def test_parse_amrap_header_raises():
+    with pytest.raises(ValueError):
+        parse_amrap_header("AMRAP 99999999999999999999 min")
+
+
+def test_iter_parse_reports_long_durations():
+    lines = ["Plank 99999999999999999999 min", "5 Pull Up"]
+    errors = []
+    items = list(iter_parse(lines, on_error=errors.append))
+    assert items == [Exercise(name="Pull Up", reps=5)]
+    assert [error.line_number for error in errors] == [1]
+
+
+def test_iter_parse():
+    text = """
+        # Monday
+        5 Back Squat 100 kg
+        20 min AMRAP
+        5 Pull Up
+        10 Push Up
+
+        400 m Run
+        Squat 5
+        AMRAP in 10:00
+        10 Wall Ball 9 kg
+    """
+    errors = []
+    items = list(iter_parse(text.splitlines(), on_error=errors.append))
+    assert items == [
+        Exercise(name="Back Squat", reps=5, weight=Weight(100, "kg")),
+        Amrap(
+            duration=timedelta(minutes=20),
+            exercises=[
+                Exercise(name="Pull Up", reps=5),
+                Exercise(name="Push Up", reps=10),
+            ],
+        ),
+        Exercise(name="Run", distance=Distance(400, "m")),
+        Amrap(
+            duration=timedelta(minutes=10),
+            exercises=[
+                Exercise(name="Wall Ball", reps=10, weight=Weight(9, "kg"))
+            ],
+        ),
+    ]
+    assert len(errors) == 1
+    assert isinstance(errors[0], RecordError)
+    assert errors[0].line_number == 9
+    assert errors[0].line == "Squat 5"
+
+
+def test_iter_parse_file(tmp_path):
+    path = tmp_path / "whiteboard.txt"
+    path.write_text("5 Back Squat 100 kg\n400 m Run\n", encoding="utf-8")
+    assert [str(item) for item in iter_parse_file(path)] == [
+        "5 Back Squat 100.0 kg",
+        "400.0 m Run",
+    ]
+
+
+def test_iter_parse_csv():
+    lines = [
+        "name,reps,weight,distance,duration,height",
+        "back squat,5,100 kg,,,",
+        "Run,,,400 m,1:30,",
+        "3 Clean + 1 Jerk,2,60 kg,,,",
+        "Box Jump,x,,,,",
+    ]
+    errors = []
+    exercises = list(iter_parse_csv(lines, on_error=errors.append))
+    assert exercises == [
+        Exercise(name="Back Squat", reps=5, weight=Weight(100, "kg")),
+        Exercise(
+            name="Run",
+            distance=Distance(400, "m"),
+            duration=timedelta(seconds=90),
+        ),
+        Exercise(
+            name=None,
+            reps=2,
+            weight=Weight(60, "kg"),
+            sub_exercises=[
+                Exercise(name="Clean", reps=3),
+                Exercise(name="Jerk", reps=1),
+            ],
+        ),
+    ]
+    assert [error.line_number for error in errors] == [5]